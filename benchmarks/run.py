@@ -0,0 +1,286 @@
+"""Benchmarks of the carsons equation classes and kron reduction.
+
+Run from the repository root:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --output new.json --compare results.json
+
+Every benchmark reports the best time per call in seconds. With
+`--compare`, benchmarks slower than the baseline by more than the
+tolerance are listed and the exit code is 1.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable
+
+import numpy
+
+import carsons
+from carsons.carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedances,
+    calculate_sequence_impedances,
+    perform_kron_reduction,
+    perform_kron_reductions,
+)
+from tests.helpers import (
+    ConcentricLineModel,
+    LineModel,
+    MultiLineModel,
+    TapeShieldedLineModel,
+)
+
+CONDUCTOR_COUNTS = (4, 8, 16, 32)
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000)
+
+
+def overhead_line(conductors):
+    phases = {
+        ph: (0.000115575, 0.00947938, (0.762 * index, 8.5344))
+        for index, ph in enumerate("ABC")
+    }
+    neutrals = {
+        f"N{index}": (0.000367852, 0.00248107, (0.3048 * index, 7.3152 - 0.1 * index))
+        for index in range(1, conductors - 2)
+    }
+    return LineModel({**phases, **neutrals})
+
+
+def concentric_cable(conductors):
+    phase = {"resistance": 0.000254762, "gmr": 0.00521208}
+    neutral = {
+        "neutral_strand_gmr": 0.000633984,
+        "neutral_strand_resistance": 0.00923964,
+        "neutral_strand_diameter": 0.00162814,
+        "diameter_over_neutral": 0.032766,
+        "neutral_strand_count": 13,
+    }
+    cables = "ABC"[: conductors // 2]
+    return ConcentricLineModel(
+        {
+            **{
+                ph: {**phase, "wire_positions": (0.1524 * index, -1.0)}
+                for index, ph in enumerate(cables)
+            },
+            **{f"N{ph}": neutral for ph in cables},
+        }
+    )
+
+
+def tape_shielded_cable(conductors):
+    phase = {
+        "resistance": 0.000602730,
+        "gmr": 0.00338328,
+        "tape_shield_outer_diameter": 0.022352,
+        "tape_shield_thickness": 0.000127,
+    }
+    neutral = {"resistance": 0.000377166, "gmr": 0.00339242}
+    return TapeShieldedLineModel(
+        {
+            **{
+                ph: {**phase, "wire_positions": (0.1524 * index, -1.0)}
+                for index, ph in enumerate("ABC")
+            },
+            **{
+                f"N{index}": {**neutral, "wire_positions": (0.0762 * index, -1.1)}
+                for index in range(1, conductors - 5)
+            },
+        }
+    )
+
+
+def multi_conductor_cable(conductors):
+    conductor = {"resistance": 0.000300744, "gmr": 0.00481584}
+    return MultiLineModel(
+        {
+            **{
+                ph: {
+                    **conductor,
+                    "wire_positions": (0.1 * index, 5),
+                    "outside_radius": 0.00799940,
+                }
+                for index, ph in enumerate("ABC")
+            },
+            **{
+                f"N{index}": {
+                    **conductor,
+                    "wire_positions": (0.1 * index, 4.9),
+                    "outside_radius": 0.00662940,
+                }
+                for index in range(1, conductors - 2)
+            },
+        }
+    )
+
+
+EQUATIONS = [
+    (CarsonsEquations, overhead_line, CONDUCTOR_COUNTS),
+    (ModifiedCarsonsEquations, overhead_line, CONDUCTOR_COUNTS),
+    (ConcentricNeutralCarsonsEquations, concentric_cable, (2, 4, 6)),
+    (TapeShieldedCableCarsonsEquations, tape_shielded_cable, (7, 16, 32)),
+    (MultiConductorCarsonsEquations, multi_conductor_cable, CONDUCTOR_COUNTS),
+]
+
+
+def measure(function: Callable[[], object], repeat=5, min_time=0.1) -> float:
+    """Best time per call of `function`, in seconds, over `repeat` rounds
+    of as many calls as fit in `min_time`."""
+    start = perf_counter()
+    function()
+    number = max(1, int(min_time / (perf_counter() - start)))
+
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        timings.append(perf_counter() - start)
+
+    return min(timings) / number
+
+
+IMPORT = """
+from time import perf_counter
+import numpy, numpy.linalg
+start = perf_counter()
+import {module}
+print(perf_counter() - start)
+"""
+
+
+def measure_import(module: str, repeat=5) -> float:
+    """Best time to import `module`, in seconds, in a new interpreter that
+    has already imported numpy, i.e. the overhead of carsons itself."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(carsons.__file__)))
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT.format(module=module)],
+                capture_output=True,
+                check=True,
+                cwd=root,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+    return min(timings)
+
+
+def run_benchmarks(
+    conductor_counts=CONDUCTOR_COUNTS, batch_sizes=BATCH_SIZES, repeat=5, min_time=0.1
+) -> dict[str, float]:
+    results = {}
+
+    def report(name, seconds):
+        results[name] = seconds
+        print(f"{name:<60} {seconds:.3e} s", file=sys.stderr)
+
+    def record(name, function):
+        report(name, measure(function, repeat=repeat, min_time=min_time))
+
+    # the package alone, then the equations it loads on first use
+    for module in ("carsons", "carsons.carsons"):
+        report(f"import[{module}]", measure_import(module, repeat=repeat))
+
+    for equations, line, counts in EQUATIONS:
+        for count in counts:
+            if count > max(conductor_counts):
+                continue
+            line_model = line(count)
+            record(
+                f"build_z_primitive[{equations.__name__}-{count}]",
+                # a new instance every call, as memoized geometry would
+                # otherwise be reused
+                lambda: equations(line_model).build_z_primitive(),
+            )
+
+    for count in conductor_counts:
+        z_primitive = CarsonsEquations(overhead_line(count)).build_z_primitive()
+        record(
+            f"perform_kron_reduction[{count}]",
+            lambda: perform_kron_reduction(z_primitive),
+        )
+
+    z_abc = perform_kron_reduction(z_primitive)
+    record(
+        "calculate_sequence_impedances", lambda: calculate_sequence_impedances(z_abc)
+    )
+
+    for size in batch_sizes:
+        models = [CarsonsEquations(overhead_line(4)) for _ in range(size)]
+        z_primitives = numpy.stack([model.build_z_primitive() for model in models])
+        record(
+            f"calculate_impedances[{size}]",
+            lambda: calculate_impedances(models),
+        )
+        record(
+            f"perform_kron_reductions[{size}]",
+            lambda: perform_kron_reductions(z_primitives),
+        )
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.2) -> list[str]:
+    """Names of the benchmarks slower than `baseline` by over `tolerance`."""
+    return [
+        name
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + tolerance)
+    ]
+
+
+def main(arguments=None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a baseline run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--quick", action="store_true", help="small conductor counts and batches"
+    )
+    options = parser.parse_args(arguments)
+
+    if options.quick:
+        results = run_benchmarks(conductor_counts=(4, 8), batch_sizes=(1, 100))
+    else:
+        results = run_benchmarks()
+
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(
+                {
+                    "carsons": carsons.__version__,
+                    "numpy": numpy.__version__,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "benchmarks": results,
+                },
+                output,
+                indent=2,
+            )
+
+    if options.compare:
+        with open(options.compare) as baseline:
+            regressions = compare(
+                results, json.load(baseline)["benchmarks"], options.tolerance
+            )
+        for name in regressions:
+            print(f"regression: {name}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,129 @@
-from carsons.carsons import (
-    CarsonsEquations,
-    ConcentricNeutralCarsonsEquations,
-    MultiConductorCarsonsEquations,
-    TapeShieldedCableCarsonsEquations,
-    calculate_impedance,
-    calculate_sequence_impedance_matrix,
-    calculate_sequence_impedances,
-    convert_geometric_model,
-)
+"""Carson's equations for the impedance of overhead lines and cables.
+
+The public names are imported from their modules on first use (see
+`__getattr__`), so that importing the package costs next to nothing beyond
+what is used; `python -m benchmarks.run` reports the import time.
+"""
+
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from carsons.cache import ImpedanceCache, PersistentImpedanceCache
+    from carsons.carsons import (
+        CarsonsEquations,
+        CompleteCarsonsEquations,
+        ConcentricNeutralCarsonsEquations,
+        ModifiedCarsonsEquations,
+        MultiConductorCarsonsEquations,
+        TapeShieldedCableCarsonsEquations,
+        calculate_carson_series,
+        calculate_complete_carson_series,
+        calculate_frequency_sweep,
+        calculate_impedance,
+        calculate_impedance_derivatives,
+        calculate_impedances,
+        calculate_line_parameters,
+        calculate_resistivity_sweep,
+        calculate_sequence_impedance_components,
+        calculate_sequence_impedance_matrix,
+        calculate_sequence_impedances,
+        calculate_shunt_admittance,
+        calculate_shunt_admittances,
+        convert_conductor_table,
+        convert_geometric_model,
+        convert_geometric_models,
+        perform_kron_reduction_derivative,
+        stream_impedances,
+    )
+    from carsons.geometry import LineGeometry
+    from carsons.incremental import IncrementalImpedance
+    from carsons.instrumentation import StageStatistics, instrument
+    from carsons.kron import KronReduction
 
 __all__ = [
     "CarsonsEquations",
+    "CompleteCarsonsEquations",
     "ConcentricNeutralCarsonsEquations",
+    "ImpedanceCache",
+    "IncrementalImpedance",
+    "KronReduction",
+    "LineGeometry",
+    "ModifiedCarsonsEquations",
     "MultiConductorCarsonsEquations",
+    "PersistentImpedanceCache",
+    "StageStatistics",
     "TapeShieldedCableCarsonsEquations",
+    "calculate_carson_series",
+    "calculate_complete_carson_series",
+    "calculate_frequency_sweep",
     "calculate_impedance",
+    "calculate_impedance_derivatives",
+    "calculate_impedances",
+    "calculate_line_parameters",
+    "calculate_resistivity_sweep",
+    "calculate_sequence_impedance_components",
     "calculate_sequence_impedance_matrix",
     "calculate_sequence_impedances",
+    "calculate_shunt_admittance",
+    "calculate_shunt_admittances",
+    "convert_conductor_table",
     "convert_geometric_model",
+    "convert_geometric_models",
+    "instrument",
+    "perform_kron_reduction_derivative",
+    "stream_impedances",
 ]
 
+_modules = {
+    "ImpedanceCache": "carsons.cache",
+    "PersistentImpedanceCache": "carsons.cache",
+    "IncrementalImpedance": "carsons.incremental",
+    "StageStatistics": "carsons.instrumentation",
+    "instrument": "carsons.instrumentation",
+    "KronReduction": "carsons.kron",
+    "LineGeometry": "carsons.geometry",
+}
+
+# submodules, imported on first use like the names above
+_submodules = (
+    "cache",
+    "carsons",
+    "geometry",
+    "incremental",
+    "instrumentation",
+    "kron",
+    "parallel",
+)
+
 name = "carsons"
 
 
-def get_version():
-    from importlib.resources import files
+def __getattr__(attribute):
+    if attribute == "__version__":
+        return get_version()
+    if attribute in _submodules:
+        # importing it also sets it as an attribute of the package
+        return import_module(f"{__name__}.{attribute}")
+    if attribute not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {attribute!r}")
+
+    module = import_module(_modules.get(attribute, "carsons.carsons"))
+    value = globals()[attribute] = getattr(module, attribute)
+    return value
 
-    return files(__name__).joinpath("VERSION").open("r").read().strip()
 
+def __dir__():
+    return sorted({*globals(), *__all__, *_submodules, "__version__"})
+
+
+@cache
+def get_version():
+    from pkgutil import get_data
 
-__version__ = get_version()
+    version = get_data(__name__, "VERSION")
+    if version is None:
+        # the package's loader cannot read data files
+        raise RuntimeError(f"the VERSION file of {__name__} cannot be read")
+    return version.decode().strip()
@@ -0,0 +1,399 @@
+import os
+import pickle  # nosec B403: keys are pickled to be hashed, nothing is unpickled
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from hashlib import sha256
+from threading import Lock
+from time import time
+
+from numpy import frombuffer, ndarray, result_type, zeros
+
+from carsons import get_version
+from carsons.carsons import (
+    CarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+    convert_geometric_model,
+    require_unbatched,
+)
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, (float, int, str, bytes)):
+        return value
+    if isinstance(value, tuple):
+        return tuple([_freeze(item) for item in value])
+    if isinstance(value, ndarray):
+        # nested tuples keep the shape of batched values; 0-d arrays, such
+        # as the ρ of `astype` copies, become scalars
+        return _freeze(value.tolist())
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, Iterable):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def geometric_model_key(geometric_model) -> Hashable:
+    """Canonical snapshot of the inputs `convert_geometric_model` reads."""
+    phase_labels = getattr(
+        geometric_model, "phase_labels", CarsonsEquations.phase_labels
+    )
+    phases = tuple(geometric_model.phases)
+    return (
+        CarsonsEquations,
+        # without fixed labels the rows follow the order of the phases
+        tuple(sorted(phases)) if phase_labels is not None else phases,
+        _freeze(geometric_model.wire_positions),
+        _freeze(geometric_model.geometric_mean_radius),
+        _freeze(geometric_model.resistance),
+        _freeze(getattr(geometric_model, "frequency", 60)),
+        _freeze(getattr(geometric_model, "earth_resistivity", CarsonsEquations.ρ)),
+        _freeze(phase_labels),
+    )
+
+
+def equations_key(model: CarsonsEquations) -> Hashable:
+    """Canonical snapshot of the inputs `calculate_impedance` reads.
+
+    The per-conductor values are taken after the equation class has
+    derived its own from the line model (e.g. the gmr of concentric
+    neutrals or tape shields), so they cover cable-specific attributes.
+    """
+    all_conductors = model.conductors
+    conductors = [phase for phase in all_conductors if phase in model.phases]
+    values = []
+    for name in model.per_conductor_attributes:
+        attribute = getattr(model, name)
+        values.append(
+            tuple([_freeze(attribute[c]) for c in conductors if c in attribute])
+        )
+    return (
+        type(model),
+        tuple(all_conductors),
+        tuple(conductors),
+        tuple(values),
+        _freeze(model.ƒ),
+        _freeze(model.ρ),
+        model.dtype,
+    )
+
+
+def _canonical(key: tuple) -> bytes:
+    # the same bytes in every process and run, unlike the key's hash:
+    # classes are written by their qualified names, which unlike the
+    # classes themselves can always be pickled, and numbers by value, so
+    # that different inputs never share bytes
+    return pickle.dumps(
+        tuple(
+            f"{item.__module__}.{item.__qualname__}" if isinstance(item, type) else item
+            for item in key
+        ),
+        protocol=5,
+    )
+
+
+class ImpedanceCache:
+    """A bounded, least-recently-used cache of impedance matrices.
+
+    Use it in place of `convert_geometric_model` and `calculate_impedance`
+    when the same line geometries are evaluated repeatedly:
+
+        cache = ImpedanceCache(maxsize=4096)
+        z_abc = cache.calculate_impedance(CarsonsEquations(line))
+
+    Results are keyed on a snapshot of the model's inputs rather than its
+    identity, so equal geometries described by different objects share an
+    entry. Callers receive copies and cannot alter the cached matrices.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, ndarray] = OrderedDict()
+        self._lock = Lock()
+
+    def convert_geometric_model(self, geometric_model) -> ndarray:
+        return self._get(
+            geometric_model_key(geometric_model),
+            lambda: convert_geometric_model(geometric_model),
+        )
+
+    def calculate_impedance(self, model: CarsonsEquations) -> ndarray:
+        return self._get(equations_key(model), lambda: calculate_impedance(model))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key, compute) -> ndarray:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key].copy()
+            self.misses += 1
+
+        z_abc = compute()
+
+        with self._lock:
+            self._entries[key] = z_abc
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return z_abc.copy()
+
+
+class PersistentImpedanceCache:
+    """An impedance cache stored in an SQLite file, shared by processes
+    and kept between runs:
+
+        with PersistentImpedanceCache("impedances.sqlite") as cache:
+            z_abc = cache.calculate_impedances(models)
+
+    Entries are keyed on the same snapshot of a model's inputs as
+    `ImpedanceCache`, which includes the equation class, hashed together
+    with the package version; entries of other versions are removed when
+    the file is opened, and `clear` removes them all.
+
+    Any number of processes may share the file. It is kept in write-ahead
+    log mode, so lookups proceed while another process writes, and every
+    process opens its own connection, including after a fork; the cache
+    can be pickled to workers. Once the file holds more than `max_entries`
+    matrices the least recently used are evicted, with uses recorded at
+    most once per `use_resolution`. Each process counts the entries when
+    its own stores since its last count could exceed `max_entries`, so
+    with several writers the file can briefly hold more.
+
+    `calculate_impedances` looks up and stores a whole batch of models in
+    a few statements and computes the missing matrices together, so warm
+    runs over many segments mostly read the file.
+    """
+
+    # keys per SELECT, below SQLite's limit on the number of parameters
+    lookup_size = 500
+    # seconds within which the use of an entry is recorded once, so the
+    # eviction order is that of the last use to within this
+    use_resolution = 3600.0
+    # layout of the table, recorded as the file's user_version; files of
+    # another layout are emptied when they are opened
+    schema_version = 1
+
+    def __init__(self, path, max_entries: int = 10_000_000, timeout: float = 60.0):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.timeout = timeout  # seconds to wait for other writers
+        self.version = get_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # entries in the file at the last count, plus those stored since
+        self._size: int | None = None
+
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "DELETE FROM impedances WHERE version != ?", (self.version,)
+            )
+
+    def convert_geometric_model(self, geometric_model) -> ndarray:
+        return self._get(
+            geometric_model_key(geometric_model),
+            lambda: convert_geometric_model(geometric_model),
+        )
+
+    def calculate_impedance(self, model: CarsonsEquations) -> ndarray:
+        return self._get(equations_key(model), lambda: calculate_impedance(model))
+
+    def calculate_impedances(self, models: Iterable[CarsonsEquations]) -> ndarray:
+        """Returns the same array as `carsons.calculate_impedances(models)`,
+        computing only the matrices missing from the file."""
+        models = list(models)
+        require_unbatched(models)
+        keys = [self._key(equations_key(model)) for model in models]
+
+        with self._lock:
+            found = self._lookup(list(dict.fromkeys(keys)))
+            missing: dict[bytes, int] = {}
+            for index, key in enumerate(keys):
+                if key not in found:
+                    missing.setdefault(key, index)
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            computed = calculate_impedances(models[index] for index in missing.values())
+            for (key, index), z_abc in zip(missing.items(), computed):
+                d = models[index].dimension
+                found[key] = z_abc[:d, :d]
+            with self._lock:
+                self._store([(key, found[key]) for key in missing])
+
+        p = max((model.dimension for model in models), default=3)
+        dtypes = {z_abc.dtype for z_abc in found.values()}
+        dtype = result_type(*dtypes) if dtypes else complex
+        Z = zeros(shape=(len(models), p, p), dtype=dtype)
+        for index, key in enumerate(keys):
+            d = len(found[key])
+            Z[index, :d, :d] = found[key]
+
+        return Z
+
+    def clear(self):
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM impedances")
+            self.hits = 0
+            self.misses = 0
+            self._size = 0
+
+    def __len__(self):
+        with self._lock:
+            ((count,),) = self._connect().execute("SELECT COUNT(*) FROM impedances")
+            return count
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_connection"] = state["_pid"] = state["_size"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _get(self, key, compute) -> ndarray:
+        key = self._key(key)
+        with self._lock:
+            found = self._lookup([key])
+            if key in found:
+                self.hits += 1
+                return found[key].copy()
+            self.misses += 1
+
+        z_abc = compute()
+
+        with self._lock:
+            self._store([(key, z_abc)])
+
+        return z_abc
+
+    def _key(self, key) -> bytes:
+        return sha256(self.version.encode() + b"\0" + _canonical(key)).digest()
+
+    def _lookup(self, keys: list[bytes]) -> dict[bytes, ndarray]:
+        connection = self._connect()
+        found = {}
+        stale = []
+        now = time()
+        for start in range(0, len(keys), self.lookup_size):
+            chunk = keys[start : start + self.lookup_size]
+            # only parameter markers are added to the statement, and the
+            # keys are bound to them
+            placeholders = ",".join("?" * len(chunk))
+            statement = (
+                "SELECT key, dtype, shape, value, used FROM impedances "  # nosec B608
+                "WHERE key IN (" + placeholders + ")"
+            )
+            rows = connection.execute(statement, chunk)
+            for key, dtype, shape, value, used in rows:
+                found[key] = frombuffer(value, dtype=dtype).reshape(
+                    [int(size) for size in shape.split(",")]
+                )
+                if used < now - self.use_resolution:
+                    stale.append(key)
+
+        # only record uses once per `use_resolution`, so that repeated runs
+        # over the same entries read the file without writing to it
+        if stale:
+            with connection:
+                connection.executemany(
+                    "UPDATE impedances SET used = ? WHERE key = ?",
+                    ((now, key) for key in stale),
+                )
+        return found
+
+    def _store(self, entries: list[tuple[bytes, ndarray]]):
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO impedances VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        key,
+                        self.version,
+                        z_abc.dtype.str,
+                        # the shape of batched models has leading axes
+                        ",".join(str(size) for size in z_abc.shape),
+                        z_abc.tobytes(),
+                        time(),
+                    )
+                    for key, z_abc in entries
+                ),
+            )
+            # replaced entries are counted as added, which only brings the
+            # next count forward
+            if self._size is not None:
+                self._size += len(entries)
+            if self._size is None or self._size > self.max_entries:
+                ((self._size,),) = connection.execute("SELECT COUNT(*) FROM impedances")
+            if self._size > self.max_entries:
+                connection.execute(
+                    "DELETE FROM impedances WHERE key IN "
+                    "(SELECT key FROM impedances ORDER BY used LIMIT ?)",
+                    (self._size - self.max_entries,),
+                )
+                self._size = self.max_entries
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                ((schema_version,),) = connection.execute("PRAGMA user_version")
+                if schema_version != self.schema_version:
+                    connection.execute("DROP TABLE IF EXISTS impedances")
+                    connection.execute(
+                        f"PRAGMA user_version = {int(self.schema_version)}"
+                    )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS impedances ("
+                    "key BLOB PRIMARY KEY, version TEXT NOT NULL, "
+                    "dtype TEXT NOT NULL, shape TEXT NOT NULL, "
+                    "value BLOB NOT NULL, used REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS impedances_used ON impedances (used)"
+                )
+            self._connection, self._pid = connection, os.getpid()
+            self._size = None
+        return self._connection
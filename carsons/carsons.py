@@ -1,10 +1,48 @@
 from collections import defaultdict
+from copy import copy
+from functools import cache, wraps
 from itertools import islice
-from typing import Iterable, Iterator
-
-from numpy import arctan, array, cos, exp, log, ndarray, sin, sqrt, zeros
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from numpy import (
+    arange,
+    arctan,
+    array,
+    asarray,
+    broadcast_arrays,
+    broadcast_shapes,
+    broadcast_to,
+    complex64,
+    concatenate,
+    cos,
+    einsum,
+    euler_gamma,
+    exp,
+    eye,
+    float64,
+    full,
+    kron,
+    log,
+    moveaxis,
+    ndarray,
+    ndim,
+    newaxis,
+    ones,
+    result_type,
+    sign,
+    sin,
+    sqrt,
+    swapaxes,
+    unique,
+    where,
+    zeros,
+)
 from numpy import pi as π
-from numpy.linalg import inv
+from numpy.linalg import inv, solve
+
+from carsons.geometry import LineGeometry
+from carsons.instrumentation import instrumented
 
 alpha = exp(2j * π / 3)
 
@@ -27,7 +65,7 @@ def convert_geometric_model(geometric_model) -> ndarray:
     carsons_model = CarsonsEquations(geometric_model)
 
     z_primitive = carsons_model.build_z_primitive()
-    z_abc = perform_kron_reduction(z_primitive)
+    z_abc = perform_kron_reduction(z_primitive, dimension=carsons_model.dimension)
     return z_abc
 
 
@@ -38,6 +76,328 @@ def calculate_impedance(model) -> ndarray:
     return z_abc
 
 
+def calculate_impedance_derivatives(model) -> dict[str, ndarray]:
+    """The derivatives of `calculate_impedance(model)` with respect to the
+    values of `model.build_z_primitive_derivatives`, in the same layout."""
+    z_primitive = model.build_z_primitive()
+    dz_primitive = model.build_z_primitive_derivatives()
+
+    # reduce every derivative in one call, which factors Ẑnn once
+    dz_ρ = dz_primitive.pop("ρ")
+    names = list(dz_primitive)
+    dz_abc = perform_kron_reduction_derivative(
+        z_primitive,
+        concatenate([*dz_primitive.values(), dz_ρ[newaxis]]),
+        dimension=model.dimension,
+    )
+    count = len(model.conductors)
+    return {
+        **{name: dz_abc[i * count : (i + 1) * count] for i, name in enumerate(names)},
+        "ρ": dz_abc[-1],
+    }
+
+
+def convert_geometric_models(geometric_models: Iterable, dtype=None) -> ndarray:
+    return calculate_impedances(
+        (CarsonsEquations(model) for model in geometric_models), dtype
+    )
+
+
+@instrumented
+def calculate_impedances(models: Iterable["CarsonsEquations"], dtype=None) -> ndarray:
+    """Computes the impedance matrices of many models at once.
+
+    Models of the same equation class with the same conductors are stacked
+    (see `CarsonsEquations.stack`) so that their primitive matrices are
+    built together as one (batch, n, n) array, and all of them are then
+    kron-reduced in a single `perform_kron_reductions` call. If `dtype` is
+    given, e.g. float32, the stacked models are evaluated in that
+    precision, see `CarsonsEquations.astype`.
+
+    Returns:
+    Z ----  an array of shape (len(models), dimension, dimension), where
+            Z[i] is `calculate_impedance(models[i])`. When 3 phase models
+            are mixed with secondaries, the 2x2 secondary matrices are
+            padded with zeros.
+    """
+    models = list(models)
+    (z_primitives,) = _build_stacked(models, dtype, "build_z_primitive")
+
+    dimensions = [model.dimension for model in models]
+    return perform_kron_reductions(z_primitives, dimensions)
+
+
+def calculate_shunt_admittance(model) -> ndarray:
+    """The shunt admittance matrix of the line, in Siemens / meter.
+
+    The potential coefficients of `model.build_p_primitive` are reduced
+    like the primitive impedance matrix, see `perform_kron_reduction`, and
+    inverted into the capacitance matrix C, giving Yabc = jωC.
+
+    Returns:
+        an array of the shape of `calculate_impedance(model)`
+    """
+    p_primitive = model.build_p_primitive()
+    p_abc = perform_kron_reduction(p_primitive, dimension=model.dimension)
+
+    return 1j * model.ω * invert_potential_coefficients(p_abc)
+
+
+@instrumented
+def calculate_shunt_admittances(
+    models: Iterable["CarsonsEquations"], dtype=None
+) -> ndarray:
+    """Computes the shunt admittance matrices of many models at once, with
+    the models stacked as in `calculate_impedances`.
+
+    Returns:
+    Y ----  an array of shape (len(models), dimension, dimension), where
+            Y[i] is `calculate_shunt_admittance(models[i])`
+    """
+    models = list(models)
+    (p_primitives,) = _build_stacked(models, dtype, "build_p_primitive")
+
+    return _reduce_admittances(models, p_primitives, dtype)
+
+
+@instrumented
+def calculate_line_parameters(
+    models: Iterable["CarsonsEquations"], dtype=None
+) -> tuple[ndarray, ndarray]:
+    """Computes the series impedance and shunt admittance matrices of many
+    models in one pass: each stack of models builds both of its primitive
+    matrices, which share their geometry.
+
+    Returns:
+    (Z, Y), as `calculate_impedances` and `calculate_shunt_admittances`
+    """
+    models = list(models)
+    z_primitives, p_primitives = _build_stacked(
+        models, dtype, "build_z_primitive", "build_p_primitive"
+    )
+
+    dimensions = [model.dimension for model in models]
+    return (
+        perform_kron_reductions(z_primitives, dimensions),
+        _reduce_admittances(models, p_primitives, dtype),
+    )
+
+
+def _reduce_admittances(models, p_primitives, dtype) -> ndarray:
+    dimensions = [model.dimension for model in models]
+    ω = asarray([model.ω for model in models], dtype=dtype)[:, newaxis, newaxis]
+    p_abc = perform_kron_reductions(p_primitives, dimensions)
+
+    return 1j * ω * invert_potential_coefficients(p_abc)
+
+
+def require_unbatched(models: Iterable["CarsonsEquations"]):
+    """Raises a ValueError if any of `models` is batched, see
+    `CarsonsEquations.batch_shape`. The batch APIs stack models into one
+    (batch, n, n) array, so a batched model must be evaluated on its own."""
+    for index, model in enumerate(models):
+        if model.batch_shape:
+            raise ValueError(
+                f"model {index} is batched with shape {model.batch_shape}; "
+                "compute the matrices of a batched model, e.g. of a batched "
+                "LineGeometry, with calculate_impedance"
+            )
+
+
+def _build_stacked(models: list, dtype, *names) -> list[list[ndarray]]:
+    # stacks the models of the same equation class with the same conductors
+    # and calls each method of `names` once on every stack, returning the
+    # matrices per model in input order
+    groups: dict[tuple, list[int]] = defaultdict(list)
+    for index, model in enumerate(models):
+        conductors = model.conductors
+        # the layout and precision of a stack are those of its first model
+        groups[
+            type(model),
+            tuple(conductors),
+            tuple(phase for phase in conductors if phase in model.phases),
+            model.dtype,
+        ].append(index)
+
+    built: list[list[ndarray]] = [[zeros(shape=(0, 0))] * len(models) for _ in names]
+    for indices in groups.values():
+        stacked = models[indices[0]].stack([models[index] for index in indices])
+        if dtype is not None:
+            stacked = stacked.astype(dtype)
+        for matrices, name in zip(built, names):
+            for index, matrix in zip(indices, getattr(stacked, name)()):
+                matrices[index] = matrix
+
+    return built
+
+
+def invert_potential_coefficients(p_abc: ndarray) -> ndarray:
+    """The capacitance matrix C = Pabc⁻¹ of a reduced matrix of potential
+    coefficients, or of a stack of them. Rows and columns of phases
+    missing from the line, which are zero in Pabc, are left zero in C."""
+    p_abc = p_abc.real
+    diagonal = arange(p_abc.shape[-1])
+    present = p_abc[..., diagonal, diagonal] != 0
+
+    p_abc = p_abc.copy()
+    p_abc[..., diagonal, diagonal] += ~present
+    C = inv(p_abc)
+    return C * (present[..., :, newaxis] & present[..., newaxis, :])
+
+
+def stream_impedances(
+    items: Iterable[tuple[Any, Any]],
+    equations: type["CarsonsEquations"] | None = None,
+    batch_size: int = 1024,
+) -> Iterator[tuple[Any, ndarray]]:
+    """Lazily computes the impedance matrices of a stream of models.
+
+    `items` are (key, model) pairs, e.g. `enumerate(models)`. They are
+    read `batch_size` at a time and each batch is evaluated with
+    `calculate_impedances`, so memory use depends on `batch_size` but not
+    on the length of the stream. If `equations` is given, the models are
+    line models, converted with `equations(model)` as they are read;
+    otherwise they are equation models.
+
+    Yields:
+    key, Z -- in the order of `items`, where Z is
+              `calculate_impedance(model)`
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    items = iter(items)
+    while batch := list(islice(items, batch_size)):
+        keys = [key for key, _ in batch]
+        models = [
+            model if equations is None else equations(model) for _, model in batch
+        ]
+        del batch
+
+        z_abc = calculate_impedances(models)
+        for key, model, z in zip(keys, models, z_abc):
+            d = model.dimension
+            # copies, so that results kept by the caller do not hold on
+            # to the whole batch
+            yield key, z[:d, :d].copy()
+
+
+def convert_conductor_table(
+    table, equations: type["CarsonsEquations"] | None = None
+) -> tuple[ndarray, ndarray]:
+    """Computes the impedance matrices of the line segments in a table
+    with one row per conductor.
+
+    `table` is a numpy structured array, or a mapping of column names to
+    equal-length arrays, with the columns
+
+        segment    -- the id of the segment the conductor belongs to
+        phase      -- the conductor label, e.g. "A" or "N1"
+        x, y       -- the position of the conductor in meters
+        gmr        -- the geometric mean radius of the conductor in meters
+        r          -- the resistance of the conductor in ohms/meter
+
+    and optionally `frequency` (Hz) and `earth_resistivity` (ohm-meters),
+    which must be the same on every row of a segment. Segments with the
+    same conductors are gathered into one `LineGeometry` with array
+    operations and evaluated by `equations` (`CarsonsEquations` by
+    default) in a single batch, so no object is created per segment.
+
+    Returns:
+    segments -- the unique segment ids, sorted
+    Z -------  an array of shape (len(segments), p, p), where Z[i] is the
+               impedance matrix of segments[i] and p is the largest
+               dimension, at least 3; smaller matrices are padded with
+               zeros
+    """
+    equations = equations or CarsonsEquations
+    segments, segment_of_row = unique(asarray(table["segment"]), return_inverse=True)
+    labels, label_of_row = unique(asarray(table["phase"]), return_inverse=True)
+    shape = (len(segments), len(labels))
+
+    present = zeros(shape, dtype=bool)
+    present[segment_of_row, label_of_row] = True
+    if present.sum() != len(segment_of_row):
+        raise ValueError("each conductor may only appear once in a segment")
+
+    def per_conductor(column):
+        values = zeros(shape)
+        values[segment_of_row, label_of_row] = table[column]
+        return values
+
+    def per_segment(column, default):
+        if column not in _column_names(table):
+            return default
+        values = zeros(len(segments))
+        values[segment_of_row] = table[column]
+        if (values[segment_of_row] != table[column]).any():
+            raise ValueError(f"{column} must be the same for every row of a segment")
+        return values
+
+    x, y, gmr, r = (per_conductor(column) for column in ("x", "y", "gmr", "r"))
+    ƒ = per_segment("frequency", 60)
+    ρ = per_segment("earth_resistivity", equations.ρ)
+
+    reduced = []
+    conductor_sets, group_of_segment = unique(present, axis=0, return_inverse=True)
+    for group, conductors in enumerate(conductor_sets):
+        rows = (group_of_segment.ravel() == group).nonzero()[0]
+        geometry = LineGeometry(
+            [str(label) for label in labels[conductors]],
+            x[rows][:, conductors],
+            y[rows][:, conductors],
+            gmr[rows][:, conductors],
+            r[rows][:, conductors],
+            frequency=ƒ if ndim(ƒ) == 0 else ƒ[rows],
+            earth_resistivity=ρ if ndim(ρ) == 0 else ρ[rows],
+        )
+        model = equations(geometry)
+        z_abc = perform_kron_reductions(model.build_z_primitive(), model.dimension)
+        reduced.append((rows, z_abc))
+
+    dimension = max([3, *(z_abc.shape[-1] for _, z_abc in reduced)])
+    Z = zeros(shape=(len(segments), dimension, dimension), dtype=complex)
+    for rows, z_abc in reduced:
+        d = z_abc.shape[-1]
+        Z[rows, :d, :d] = z_abc
+
+    return segments, Z
+
+
+def _column_names(table) -> Iterable[str]:
+    names = getattr(getattr(table, "dtype", None), "names", None)
+    return names if names is not None else table.keys()
+
+
+def calculate_frequency_sweep(model, frequencies) -> ndarray:
+    """Computes the impedance matrix of `model` at each of `frequencies`.
+
+    Only ω depends on the frequency, so the conductor geometry is computed
+    once and every frequency is evaluated in the same array operations.
+
+    Returns:
+    Z ----  an array of shape (len(frequencies), dimension, dimension),
+            where Z[i] is the impedance matrix at frequencies[i]; for a
+            batched model, of shape (len(frequencies), *batch_shape,
+            dimension, dimension)
+    """
+    z_primitive = model.at_frequencies(frequencies).build_z_primitive()
+    return perform_kron_reductions(z_primitive, model.dimension)
+
+
+def calculate_resistivity_sweep(model, resistivities) -> ndarray:
+    """Computes the impedance matrix of `model` for each of the earth
+    `resistivities`, in ohm-meters, like `calculate_frequency_sweep`.
+
+    Returns:
+    Z ----  an array of shape (len(resistivities), dimension, dimension),
+            or (len(resistivities), *batch_shape, dimension, dimension)
+    """
+    z_primitive = model.at_resistivities(resistivities).build_z_primitive()
+    return perform_kron_reductions(z_primitive, model.dimension)
+
+
+@instrumented
 def perform_kron_reduction(z_primitive: ndarray, dimension=3) -> ndarray:
     """Reduces the primitive impedance matrix to an equivalent impedance
     matrix.
@@ -70,58 +430,836 @@ def perform_kron_reduction(z_primitive: ndarray, dimension=3) -> ndarray:
                      Zabc = [Zaa, Zab, Zac]
                             [Zba, Zbb, Zbc]
                             [Zca, Zcb, Zcc]
+
+    A stack of primitive matrices of shape (..., n, n) is reduced matrix by
+    matrix.
     """
     Ẑpp, Ẑpn = (
-        z_primitive[0:dimension, 0:dimension],
-        z_primitive[0:dimension, dimension:],
+        z_primitive[..., 0:dimension, 0:dimension],
+        z_primitive[..., 0:dimension, dimension:],
     )
     Ẑnp, Ẑnn = (
-        z_primitive[dimension:, 0:dimension],
-        z_primitive[dimension:, dimension:],
+        z_primitive[..., dimension:, 0:dimension],
+        z_primitive[..., dimension:, dimension:],
     )
     Z_abc = Ẑpp - Ẑpn @ inv(Ẑnn) @ Ẑnp
     return Z_abc
 
 
-def calculate_sequence_impedance_matrix(Z):
-    return Ainv @ Z @ A
+@instrumented
+def perform_kron_reductions(
+    z_primitives: ndarray | Sequence[ndarray], dimension: int | Sequence[int] = 3
+) -> ndarray:
+    """Reduces many primitive impedance matrices at once.
+
+    Equivalent to applying `perform_kron_reduction` to each of
+    `z_primitives`, but Ẑnn⁻¹Ẑnp is found with one broadcast linear solve
+    rather than by forming the inverse of Ẑnn.
+
+    The primitive matrices may be of different sizes and `dimension` may
+    be given per matrix, e.g. to reduce 3 phase lines and 2 wire
+    secondaries together. The blocks of every matrix are then padded to a
+    common size: phases with zeros, and neutrals with an identity Ẑnn
+    block, which leaves the reduction of the original conductors intact.
+
+    Returns:
+    Z ----  an array of shape (batch, p, p), where p is the largest
+            dimension; matrices with fewer phases are padded with zeros.
+    """
+    if isinstance(z_primitives, ndarray) and isinstance(dimension, int):
+        return _reduce_stack(z_primitives, dimension)
+
+    count = len(z_primitives)
+    dimensions = broadcast_to(dimension, (count,))
+    sizes = [len(z_primitive) for z_primitive in z_primitives]
+
+    p = max(dimensions, default=dimension if isinstance(dimension, int) else 3)
+    m = max((size - d for size, d in zip(sizes, dimensions)), default=0)
+
+    dtype = result_type(complex64, *z_primitives)
+    Ẑpp = zeros(shape=(count, p, p), dtype=dtype)
+    Ẑpn = zeros(shape=(count, p, m), dtype=dtype)
+    Ẑnp = zeros(shape=(count, m, p), dtype=dtype)
+    Ẑnn = zeros(shape=(count, m, m), dtype=dtype)
+    Ẑnn[:, arange(m), arange(m)] = 1
+
+    groups: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for index, (size, d) in enumerate(zip(sizes, dimensions)):
+        groups[size, d].append(index)
+
+    for (size, d), indices in groups.items():
+        z_primitive = array([z_primitives[index] for index in indices])
+        rows, n = array(indices)[:, newaxis, newaxis], size - d
+        Ẑpp[rows, arange(d)[:, newaxis], arange(d)] = z_primitive[:, :d, :d]
+        Ẑpn[rows, arange(d)[:, newaxis], arange(n)] = z_primitive[:, :d, d:]
+        Ẑnp[rows, arange(n)[:, newaxis], arange(d)] = z_primitive[:, d:, :d]
+        Ẑnn[rows, arange(n)[:, newaxis], arange(n)] = z_primitive[:, d:, d:]
+
+    if m == 0:
+        return Ẑpp
+
+    Z_abc = Ẑpp - Ẑpn @ solve(Ẑnn, Ẑnp)
+    return Z_abc
+
+
+def _reduce_stack(z_primitives: ndarray, dimension: int) -> ndarray:
+    # a stack of matrices of the same size needs no padding
+    d = dimension
+    Ẑpp, Ẑpn = z_primitives[..., :d, :d], z_primitives[..., :d, d:]
+    Ẑnp, Ẑnn = z_primitives[..., d:, :d], z_primitives[..., d:, d:]
+    if Ẑnn.shape[-1] == 0 or len(z_primitives) == 0:
+        return Ẑpp.copy()
+    return Ẑpp - Ẑpn @ solve(Ẑnn, Ẑnp)
+
+
+def perform_kron_reduction_derivative(
+    z_primitive: ndarray, dz_primitive: ndarray, dimension=3
+) -> ndarray:
+    """The derivative of `perform_kron_reduction(z_primitive, dimension)`
+    given the derivative dz_primitive of the primitive matrix:
+
+        dZ = dẐpp - dẐpn Ẑnn⁻¹Ẑnp - Ẑpn Ẑnn⁻¹ dẐnp + Ẑpn Ẑnn⁻¹ dẐnn Ẑnn⁻¹Ẑnp
+
+    dz_primitive may have leading axes before those of z_primitive, such
+    as the conductor axis of `build_z_primitive_derivatives`. Ẑnn⁻¹Ẑnp and
+    Ẑpn Ẑnn⁻¹ are solved for once and shared by all of them.
+    """
+    d = dimension
+    dẐpp, dẐpn = dz_primitive[..., :d, :d], dz_primitive[..., :d, d:]
+    dẐnp, dẐnn = dz_primitive[..., d:, :d], dz_primitive[..., d:, d:]
+    if dẐnn.shape[-1] == 0:
+        return dẐpp.copy()
+
+    Ẑpn, Ẑnp, Ẑnn = (
+        z_primitive[..., :d, d:],
+        z_primitive[..., d:, :d],
+        z_primitive[..., d:, d:],
+    )
+    Ẑnn_Ẑnp = solve(Ẑnn, Ẑnp)
+    Ẑpn_Ẑnn = swapaxes(solve(swapaxes(Ẑnn, -1, -2), swapaxes(Ẑpn, -1, -2)), -1, -2)
+
+    dZ_abc = dẐpp - dẐpn @ Ẑnn_Ẑnp - Ẑpn_Ẑnn @ (dẐnp - dẐnn @ Ẑnn_Ẑnp)
+    return dZ_abc
+
+
+@cache
+def fortescue_matrices(phases=3, circuits=1) -> tuple[ndarray, ndarray]:
+    """The symmetrical component matrices A and A⁻¹ of `circuits` circuits
+    of `phases` phases each, with Z₀₁₂ = A⁻¹ Z A.
+
+    For three phases A is the usual matrix of powers of α = exp(2jπ/3);
+    for n phases its entries are exp(-2jπ·p·s/n), so that two-phase
+    (e.g. triplex secondary) matrices split into the common mode (0) and
+    the differential mode (1). Several circuits, such as the 6×6 matrix of
+    a double-circuit line, are transformed circuit by circuit, leaving the
+    mutual coupling of their sequences in the off-diagonal blocks.
+
+    Returns:
+        (A, Ainv), two read-only arrays of shape (n, n), n = phases·circuits
+    """
+    if phases < 1 or circuits < 1:
+        raise ValueError("There must be at least one phase and one circuit")
+
+    if phases == 3:
+        Aₚ, Aₚinv = A, Ainv
+    else:
+        p, s = arange(phases)[:, newaxis], arange(phases)
+        Aₚ = exp(-2j * π * p * s / phases)
+        Aₚinv = Aₚ.conj().T / phases
+
+    Aₙ, Aₙinv = kron(eye(circuits), Aₚ), kron(eye(circuits), Aₚinv)
+    Aₙ.flags.writeable = Aₙinv.flags.writeable = False
+    return Aₙ, Aₙinv
+
+
+@cache
+def _sequence_transforms(phases, circuits) -> tuple[ndarray, ndarray]:
+    # Z₀₁₂[i, l] = Σⱼₖ A⁻¹[i, j] Z[j, k] A[k, l], i.e. a single product
+    # of the flattened matrices with A⁻¹ᵀ ⊗ A, which unlike two chained
+    # matmuls is one GEMM over the whole stack; the second transform only
+    # computes the diagonal of Z₀₁₂
+    Aₙ, Aₙinv = fortescue_matrices(phases, circuits)
+    n = phases * circuits
+    matrix = einsum("ij,kl->jkil", Aₙinv, Aₙ).reshape(n * n, n * n)
+    diagonal = einsum("ij,ki->jki", Aₙinv, Aₙ).reshape(n * n, n)
+    matrix.flags.writeable = diagonal.flags.writeable = False
+    return matrix, diagonal
+
+
+def _sequence_transform(Z, circuits, diagonal):
+    Z = asarray(Z)
+    n = Z.shape[-1]
+    if Z.ndim < 2 or Z.shape[-2] != n:
+        raise ValueError(f"Expected square matrices, got shape {Z.shape}")
+    if n % circuits:
+        raise ValueError(f"{n} conductors do not split into {circuits} circuits")
+
+    transform = _sequence_transforms(n // circuits, circuits)[diagonal]
+    # keeps complex64 in float32 mode
+    transform = transform.astype(result_type(Z, complex64), copy=False)
+    return Z.reshape(*Z.shape[:-2], n * n) @ transform
+
+
+def calculate_sequence_impedance_matrix(Z, circuits=1):
+    """Z₀₁₂ = A⁻¹ Z A of a matrix or a stack of matrices of shape
+    (..., n, n), see `fortescue_matrices` for n other than 3.
+
+    Returns:
+        an array of the shape of `Z`
+    """
+    Z = asarray(Z)
+    return _sequence_transform(Z, circuits, diagonal=False).reshape(Z.shape)
+
+
+def calculate_sequence_impedance_components(Z, circuits=1):
+    """The sequence impedances, i.e. the diagonal of Z₀₁₂, of a matrix or
+    a stack of matrices of shape (..., n, n):
+
+        Z0, Z1, Z2 = calculate_sequence_impedance_components(z_abc)
+
+    Returns:
+        an array of shape (n, ...), the sequences of each circuit in turn
+    """
+    return moveaxis(_sequence_transform(Z, circuits, diagonal=True), -1, 0)
 
 
 def calculate_sequence_impedances(Z):
-    Z012 = calculate_sequence_impedance_matrix(Z)
-    return Z012[1, 1], Z012[0, 0]
+    Z0, Z1, _ = calculate_sequence_impedance_components(Z)
+    return Z1, Z0
+
+
+def calculate_carson_series(k, θ, number_of_P_terms=1, number_of_Q_terms=2):
+    """Sums the leading terms of Carson's P and Q series.
+
+    `k` and `θ` are scalars or arrays of the same shape. The powers of k
+    and the trigonometric functions of nθ are computed once and shared by
+    both series. Only the terms requested are evaluated: P reads k and θ
+    from its second term on, Q reads k from its second term and θ from its
+    third (see `series_uses_k` and `series_uses_θ`), so either may be None
+    when it is not used.
+
+    Returns:
+    P, Q -- the partial sums; a series of only its constant term is the
+            float constant, which broadcasts against any array
+    """
+    P: Any = π / 8.0 if number_of_P_terms > 0 else 0.0
+    Q: Any = -0.0386 if number_of_Q_terms > 0 else 0.0
+
+    if number_of_Q_terms > 1 or number_of_P_terms > 2:
+        log_2_k = log(2 / k)
+    if number_of_Q_terms > 1:
+        Q = Q + 0.5 * log_2_k
+
+    if number_of_P_terms > 1 or number_of_Q_terms > 2:
+        k_cos_θ = k / (3 * 2**0.5) * cos(θ)
+        if number_of_P_terms > 1:
+            P = P - k_cos_θ
+        if number_of_Q_terms > 2:
+            Q = Q + k_cos_θ
+
+    if number_of_P_terms > 2 or number_of_Q_terms > 3:
+        k2 = k * k
+        cos_2θ = cos(2 * θ)
+        if number_of_P_terms > 2:
+            P = P + k2 / 16 * (0.6728 + log_2_k) * cos_2θ
+        if number_of_P_terms > 3:
+            P = P + k2 / 16 * θ * sin(2 * θ)
+        if number_of_Q_terms > 3:
+            Q = Q - π * k2 / 64 * cos_2θ
+
+    if number_of_P_terms > 4 or number_of_Q_terms > 4:
+        k3_cos_3θ = k2 * k / (45 * 2**0.5) * cos(3 * θ)
+        if number_of_P_terms > 4:
+            P = P + k3_cos_3θ
+        if number_of_Q_terms > 4:
+            Q = Q + k3_cos_3θ
+
+    if number_of_P_terms > 5 or number_of_Q_terms > 5:
+        k4 = k2 * k2
+        cos_4θ = cos(4 * θ)
+        if number_of_P_terms > 5:
+            P = P - π * k4 * cos_4θ / 1536
+        if number_of_Q_terms > 5:
+            Q = Q - k4 / 384 * θ * sin(4 * θ)
+        if number_of_Q_terms > 6:
+            Q = Q - k4 / 384 * cos_4θ * (log_2_k + 1.0895)
+
+    return P, Q
+
+
+def calculate_carson_series_derivatives(k, θ, number_of_P_terms=1, number_of_Q_terms=2):
+    """The partial derivatives of `calculate_carson_series` with respect
+    to k and θ, term by term.
+
+    Returns:
+    ∂P/∂k, ∂P/∂θ, ∂Q/∂k, ∂Q/∂θ -- arrays of the shape of k and θ
+    """
+    k, θ = broadcast_arrays(asarray(k, dtype=float), asarray(θ, dtype=float))
+    P_k, P_θ, Q_k, Q_θ = (zeros(k.shape) for _ in range(4))
+
+    if number_of_Q_terms > 1 or number_of_P_terms > 2:
+        log_2_k = log(2 / k)
+    if number_of_Q_terms > 1:
+        Q_k = Q_k - 0.5 / k
+
+    if number_of_P_terms > 1 or number_of_Q_terms > 2:
+        cos_θ = cos(θ) / (3 * sqrt(2))
+        k_sin_θ = k * sin(θ) / (3 * sqrt(2))
+        if number_of_P_terms > 1:
+            P_k, P_θ = P_k - cos_θ, P_θ + k_sin_θ
+        if number_of_Q_terms > 2:
+            Q_k, Q_θ = Q_k + cos_θ, Q_θ - k_sin_θ
+
+    if number_of_P_terms > 2 or number_of_Q_terms > 3:
+        k2 = k * k
+        cos_2θ, sin_2θ = cos(2 * θ), sin(2 * θ)
+        if number_of_P_terms > 2:
+            P_k = P_k + (k / 8 * (0.6728 + log_2_k) - k / 16) * cos_2θ
+            P_θ = P_θ - k2 / 8 * (0.6728 + log_2_k) * sin_2θ
+        if number_of_P_terms > 3:
+            P_k = P_k + k / 8 * θ * sin_2θ
+            P_θ = P_θ + k2 / 16 * (sin_2θ + 2 * θ * cos_2θ)
+        if number_of_Q_terms > 3:
+            Q_k = Q_k - π * k / 32 * cos_2θ
+            Q_θ = Q_θ + π * k2 / 32 * sin_2θ
+
+    if number_of_P_terms > 4 or number_of_Q_terms > 4:
+        k3_cos_3θ_k = k2 / (15 * sqrt(2)) * cos(3 * θ)
+        k3_cos_3θ_θ = -k2 * k / (15 * sqrt(2)) * sin(3 * θ)
+        if number_of_P_terms > 4:
+            P_k, P_θ = P_k + k3_cos_3θ_k, P_θ + k3_cos_3θ_θ
+        if number_of_Q_terms > 4:
+            Q_k, Q_θ = Q_k + k3_cos_3θ_k, Q_θ + k3_cos_3θ_θ
+
+    if number_of_P_terms > 5 or number_of_Q_terms > 5:
+        k3, k4 = k2 * k, k2 * k2
+        cos_4θ, sin_4θ = cos(4 * θ), sin(4 * θ)
+        if number_of_P_terms > 5:
+            P_k = P_k - π * k3 * cos_4θ / 384
+            P_θ = P_θ + π * k4 * sin_4θ / 384
+        if number_of_Q_terms > 5:
+            Q_k = Q_k - k3 / 96 * θ * sin_4θ
+            Q_θ = Q_θ - k4 / 384 * (sin_4θ + 4 * θ * cos_4θ)
+        if number_of_Q_terms > 6:
+            Q_k = Q_k - (k3 / 96 * (log_2_k + 1.0895) - k3 / 384) * cos_4θ
+            Q_θ = Q_θ + k4 / 96 * sin_4θ * (log_2_k + 1.0895)
+
+    return P_k, P_θ, Q_k, Q_θ
+
+
+def series_uses_k(number_of_P_terms, number_of_Q_terms) -> bool:
+    return number_of_P_terms > 1 or number_of_Q_terms > 1
+
+
+def series_uses_θ(number_of_P_terms, number_of_Q_terms) -> bool:
+    return number_of_P_terms > 1 or number_of_Q_terms > 2
+
+
+def calculate_complete_carson_series(k, θ, tolerance=1e-12, asymptotic_k=20.0):
+    """Evaluates Carson's P and Q to within `tolerance`, for any k.
+
+    Pairs with k up to `asymptotic_k` are summed from the complete series;
+    the number of terms is chosen per pair, stopping once the remaining
+    terms are below `tolerance`. Beyond `asymptotic_k` rounding errors in
+    the series outgrow the truncation error of the asymptotic expansion
+    for large k, which is used instead. Close to `asymptotic_k` neither is
+    better than about 1e-9, whatever the tolerance; away from it both
+    reach 1e-11 or better.
+
+    `k` and `θ` are broadcast against each other, so that P and Q of many
+    pairs at many frequencies are evaluated at once.
+
+    Returns:
+    P, Q -- arrays of the broadcast shape of k and θ
+    """
+    k, θ = broadcast_arrays(asarray(k, dtype=float), asarray(θ, dtype=float))
+    P, Q = zeros(k.shape), zeros(k.shape)
+
+    large = k > asymptotic_k
+    P[~large], Q[~large] = _carson_series(k[~large], θ[~large], tolerance)
+    P[large], Q[large] = _carson_asymptotic_series(k[large], θ[large], tolerance)
+
+    return P, Q
+
+
+def calculate_complete_carson_series_derivatives(
+    k, θ, tolerance=1e-12, asymptotic_k=20.0
+):
+    """The partial derivatives of `calculate_complete_carson_series` with
+    respect to k and θ, summed term by term over the same terms.
+
+    Returns:
+    ∂P/∂k, ∂P/∂θ, ∂Q/∂k, ∂Q/∂θ -- arrays of the broadcast shape of k and θ
+    """
+    k, θ = broadcast_arrays(asarray(k, dtype=float), asarray(θ, dtype=float))
+    P_k, P_θ, Q_k, Q_θ = (zeros(k.shape) for _ in range(4))
+
+    large = k > asymptotic_k
+    _, _, P_k[~large], P_θ[~large], Q_k[~large], Q_θ[~large] = _carson_series(
+        k[~large], θ[~large], tolerance, derivatives=True
+    )
+    _, _, P_k[large], P_θ[large], Q_k[large], Q_θ[large] = _carson_asymptotic_series(
+        k[large], θ[large], tolerance, derivatives=True
+    )
+
+    return P_k, P_θ, Q_k, Q_θ
+
+
+def _carson_series(k, θ, tolerance, derivatives=False) -> tuple[ndarray, ...]:
+    # the complete series, with coefficients bᵢ, cᵢ and dᵢ = π/4 bᵢ and
+    # terms repeating every 4 powers of k, see Dommel - EMTP Theory Book;
+    # with `derivatives`, followed by ∂P/∂k, ∂P/∂θ, ∂Q/∂k and ∂Q/∂θ
+    P = full(k.shape, π / 8.0)
+    Q = 0.5 * (0.5 + log(2) - euler_gamma - log(k))
+    P_k, P_θ, Q_k, Q_θ = zeros(k.shape), zeros(k.shape), -0.5 / k, zeros(k.shape)
+
+    pairs = arange(k.size)
+    log_k = log(k)
+    zⁱ = ones(k.shape, dtype=complex)  # (k exp(jθ))ⁱ = kⁱ (cos iθ + j sin iθ)
+    b_odd, b_even = sqrt(2) / 6, 1 / 16
+    c = 1.25 + log(2) - euler_gamma
+
+    i = 0
+    while pairs.size:
+        i += 1
+        zⁱ = zⁱ * k * exp(1j * θ)
+
+        if i > 2:
+            # bᵢ = bᵢ₋₂ / (i (i + 2)), changing sign every 4 terms
+            sign = -1 if i % 4 in (1, 2) else 1
+            if i % 2:
+                b_odd = b_odd * sign / (i * (i + 2))
+            else:
+                b_even = b_even * sign / (i * (i + 2))
+                c = c + 1 / i + 1 / (i + 2)
+        bᵢ = b_odd if i % 2 else b_even
+
+        # the term is made of kⁱ cos iθ and (c - log k) kⁱ cos iθ + θ kⁱ sin iθ
+        kⁱ_cos_iθ, kⁱ_sin_iθ = zⁱ.real, zⁱ.imag
+        _add_carson_term(
+            P, Q, pairs, i, bᵢ, kⁱ_cos_iθ, (c - log_k) * kⁱ_cos_iθ + θ * kⁱ_sin_iθ
+        )
+        if derivatives:
+            _add_carson_term(
+                P_k,
+                Q_k,
+                pairs,
+                i,
+                bᵢ,
+                i * kⁱ_cos_iθ / k,
+                ((i * (c - log_k) - 1) * kⁱ_cos_iθ + i * θ * kⁱ_sin_iθ) / k,
+            )
+            _add_carson_term(
+                P_θ,
+                Q_θ,
+                pairs,
+                i,
+                bᵢ,
+                -i * kⁱ_sin_iθ,
+                (1 - i * (c - log_k)) * kⁱ_sin_iθ + i * θ * kⁱ_cos_iθ,
+            )
+
+        # past i = k the terms of a pair decrease monotonically, so it is
+        # done once they are below tolerance
+        envelope = abs(bᵢ) * abs(zⁱ) * (abs(c - log_k) + θ + 1)
+        converging = (i <= k) | (envelope >= tolerance)
+        pairs, k, θ, log_k, zⁱ = (
+            pairs[converging],
+            k[converging],
+            θ[converging],
+            log_k[converging],
+            zⁱ[converging],
+        )
+
+    return (P, Q, P_k, P_θ, Q_k, Q_θ) if derivatives else (P, Q)
+
+
+def _add_carson_term(P, Q, pairs, i, bᵢ, kⁱ_cos_iθ, log_term):
+    # adds the i-th term of the complete series to P and Q of `pairs`,
+    # given the values of its parts, or their derivatives
+    if i % 4 == 1:
+        P[pairs] -= bᵢ * kⁱ_cos_iθ
+        Q[pairs] += bᵢ * kⁱ_cos_iθ
+    elif i % 4 == 2:
+        P[pairs] += bᵢ * log_term
+        Q[pairs] -= π / 4 * bᵢ * kⁱ_cos_iθ
+    elif i % 4 == 3:
+        P[pairs] += bᵢ * kⁱ_cos_iθ
+        Q[pairs] += bᵢ * kⁱ_cos_iθ
+    else:
+        P[pairs] -= π / 4 * bᵢ * kⁱ_cos_iθ
+        Q[pairs] -= bᵢ * log_term
+
+
+def _carson_asymptotic_series(
+    k, θ, tolerance, derivatives=False
+) -> tuple[ndarray, ...]:
+    # expanding 1 / (u + sqrt(u² + j)) in Carson's integral for large k:
+    # P + jQ = -cos 2θ / k² + j Σ aₙ cos((2n + 1)θ) / (√j k)²ⁿ⁺¹, where
+    # aₙ = (2n)! binom(1/2, n), summed until its terms stop decreasing;
+    # with `derivatives`, followed by ∂P/∂k, ∂P/∂θ, ∂Q/∂k and ∂Q/∂θ
+    J = -cos(2 * θ) / k**2 + 0j
+    J_k = 2 * cos(2 * θ) / k**3 + 0j
+    J_θ = 2 * sin(2 * θ) / k**2 + 0j
+
+    # with m = 2n + 1
+    w = 1 / (exp(1j * π / 4) * k)
+    wᵐ = w
+    eʲᵐᶿ = exp(1j * θ)
+    a = 1.0
+    previous = full(k.shape, float("inf"))
+
+    n = 0
+    while True:
+        if n:
+            a = a * (3 - 2 * n) * (2 * n - 1)
+            wᵐ = wᵐ * w * w
+            eʲᵐᶿ = eʲᵐᶿ * exp(2j * θ)
+        magnitude = abs(a) * abs(wᵐ)
+        adding = (magnitude >= tolerance) & (magnitude <= previous)
+        if not adding.any():
+            break
+        J += where(adding, 1j * a * eʲᵐᶿ.real * wᵐ, 0)
+        if derivatives:
+            m = 2 * n + 1
+            J_k += where(adding, -1j * a * m * eʲᵐᶿ.real * wᵐ / k, 0)
+            J_θ += where(adding, -1j * a * m * eʲᵐᶿ.imag * wᵐ, 0)
+        previous = where(adding, magnitude, 0)
+        n += 1
+
+    if derivatives:
+        return J.real, J.imag, J_k.real, J_θ.real, J_k.imag, J_θ.imag
+    return J.real, J.imag
+
+
+def read_only(values: Mapping) -> Mapping:
+    """A read-only copy of the per-conductor `values`, which neither the
+    caller nor the model can modify."""
+    return MappingProxyType(copy(values))
+
+
+def pair_geometry(method):
+    """Memoizes a quantity of the conductor pair (i, j) on the instance.
+
+    Geometric quantities are symmetric, so (j, i) shares the entry of
+    (i, j). The per-conductor values of models are read-only; callers that
+    assign new ones must call `CarsonsEquations.forget_geometry`.
+    Only quantities that depend on neither frequency nor earth resistivity
+    may be memoized, since `at_frequencies` and `at_resistivities` share them.
+    """
+    name = method.__qualname__
+
+    @wraps(method)
+    def memoized(self, i, j):
+        key = (name, i, j) if i <= j else (name, j, i)
+        try:
+            return self._geometry[key]
+        except KeyError:
+            value = self._geometry[key] = method(self, i, j)
+            return value
+
+    return memoized
+
+
+def conductor_geometry(method):
+    """Memoizes a geometry matrix of the given conductors on the instance.
+
+    Callers must not modify the returned arrays in place.
+    """
+    name = method.__qualname__
+
+    @wraps(method)
+    def memoized(self, conductors):
+        key = (name, tuple(conductors))
+        try:
+            return self._geometry[key]
+        except KeyError:
+            value = self._geometry[key] = method(self, conductors)
+            return value
+
+    return memoized
 
 
 class CarsonsEquations:
-    ρ = 100  # resistivity, ohms/meter^3
+    ρ: float | ndarray = 100  # default earth resistivity, ohms/meter^3
     μ = 4 * π * 1e-7  # permeability, Henry / meter
+    ε = 8.854187817e-12  # permittivity of free space, Farad / meter
+
+    number_of_P_terms = 1
+    number_of_Q_terms = 2
 
+    # real dtype of the matrix methods, see `astype`
+    dtype: type = float64
+
+    # phases of the impedance matrix, see `phase_conductors`; None lays
+    # out every line in its own phases
+    phase_labels: tuple[str, ...] | None = ("A", "B", "C")
+
+    # attributes mapping each conductor to a value, see `stack`
+    per_conductor_attributes: tuple[str, ...] = (
+        "phase_positions",
+        "gmr",
+        "r",
+        "outside_radius",
+    )
+
+    @instrumented
     def __init__(self, model):
-        self.phases: Iterable[str] = model.phases
-        self.phase_positions: dict[str, tuple[float, float]] = model.wire_positions
-        self.gmr: dict[str, float] = model.geometric_mean_radius
-        self.r: dict[str, float] = model.resistance
+        # per-conductor values are read-only copies, which subclasses
+        # extend with their conductors by assigning new read-only mappings
+        self.phases: tuple[str, ...] = tuple(model.phases)
+        self.phase_positions: Mapping[str, tuple[float, float]] = read_only(
+            model.wire_positions
+        )
+        self.gmr: Mapping[str, float] = read_only(model.geometric_mean_radius)
+        self.r: Mapping[str, float] = read_only(model.resistance)
+        # only needed for the potential coefficients, see `build_p_primitive`
+        self.outside_radius: Mapping[str, float] = read_only(
+            getattr(model, "outside_radius", {})
+        )
 
         self.ƒ = getattr(model, "frequency", 60)
+        self.ρ = getattr(model, "earth_resistivity", self.ρ)
+        self.phase_labels = getattr(model, "phase_labels", self.phase_labels)
+        # a batched line geometry has values per segment, broadcast against
+        # the (batch, n, n) matrices of conductor pairs
+        if ndim(self.ƒ):
+            self.ƒ = asarray(self.ƒ)[..., newaxis, newaxis]
+        if ndim(self.ρ):
+            self.ρ = asarray(self.ρ)[..., newaxis, newaxis]
         self.ω = 2.0 * π * self.ƒ  # angular frequency radians / second
 
+        # its arrays are read directly, see `get_values`
+        self.line_geometry = model if isinstance(model, LineGeometry) else None
+
+        self._geometry: dict[tuple, Any] = {}
+
+    def forget_geometry(self):
+        """Forgets the memoized geometry. Call it after assigning new
+        per-conductor values, e.g. `phase_positions`; the model then reads
+        only those mappings, not the arrays of its `LineGeometry`. Copies
+        made before, see `at_frequencies`, keep the geometry they had."""
+        self._geometry = {}
+        self.line_geometry = None
+
+    @instrumented
     def build_z_primitive(self) -> ndarray:
-        dimension = len(self.conductors)
-        z_primitive = zeros(shape=(dimension, dimension), dtype=complex)
+        """Builds the primitive impedance matrix.
+
+        Every entry is evaluated at once on the (n, n) matrices of the
+        conductors present in the model, see `compute_R_matrix` and
+        `compute_X_matrix`. The result is the same as assembling
+        `compute_R(i, j)` and `compute_X(i, j)` element by element; rows
+        and columns of conductors missing from the model are left zero.
+        """
+        conductors = self.conductors
+        dimension = len(conductors)
+
+        indices = [
+            index for index, phase in enumerate(conductors) if phase in self.phases
+        ]
+        if not indices:
+            return zeros(
+                shape=(dimension, dimension), dtype=result_type(self.dtype, 1j)
+            )
+
+        present = [conductors[index] for index in indices]
+        P, Q = self.compute_P_and_Q_matrix(
+            present, self.number_of_P_terms, self.number_of_Q_terms
+        )
+        Z = self.compute_R_matrix(present, P) + 1j * self.compute_X_matrix(present, Q)
 
-        for index_i, phase_i in enumerate(self.conductors):
-            for index_j, phase_j in enumerate(self.conductors):
-                if phase_i not in self.phases or phase_j not in self.phases:
-                    continue
-                R = self.compute_R(phase_i, phase_j)
-                X = self.compute_X(phase_i, phase_j)
-                z_primitive[index_i, index_j] = complex(R, X)
+        z_primitive = zeros(shape=(*Z.shape[:-2], dimension, dimension), dtype=Z.dtype)
+        z_primitive[..., array(indices)[:, newaxis], array(indices)] = Z
 
         return z_primitive
 
+    def build_z_primitive_derivatives(self) -> dict[str, ndarray]:
+        """The partial derivatives of `build_z_primitive` with respect to
+        the values of each conductor and to the earth resistivity.
+
+        They are evaluated analytically on the same (n, n) matrices of
+        conductor pairs as `build_z_primitive`, sharing its memoized
+        geometry, and the derivatives of P and Q are those of the series
+        terms in use, see `calculate_carson_series_derivatives`.
+
+        Returns:
+        a dict of
+            "x", "y", "gmr", "r" -- arrays of shape (n, ..., n, n), where
+                                     [k] is the derivative of the primitive
+                                     matrix with respect to that value of
+                                     the k-th of `conductors`
+            "ρ" ------------------- an array of the shape of the primitive
+                                     matrix
+
+        θ has a kink where two conductors share an x coordinate; there its
+        derivative with respect to x is taken to be 0.
+        """
+        conductors = self.conductors
+        dimension = len(conductors)
+
+        indices = [
+            index for index, phase in enumerate(conductors) if phase in self.phases
+        ]
+        present = [conductors[index] for index in indices]
+        partials = self.compute_Z_derivatives_matrix(present) if present else {}
+        batch_shape = broadcast_shapes(*(p.shape for p in partials.values()))[:-2]
+        shape = (*batch_shape, dimension, dimension)
+
+        dz_primitive = {
+            name: zeros((dimension, *shape), dtype=complex)
+            for name in ("x", "y", "gmr", "r")
+        }
+        dz_primitive["ρ"] = zeros(shape, dtype=complex)
+        if not present:
+            return dz_primitive
+
+        dz_primitive["ρ"][..., array(indices)[:, newaxis], indices] = partials["ρ"]
+
+        # conductor k only appears in row k and column k of the matrix
+        for a, k in enumerate(indices):
+            for name in ("x", "y", "gmr"):
+                dz_k = dz_primitive[name][k]
+                dz_k[..., k, indices] += partials[f"{name}ᵢ"][..., a, :]
+                dz_k[..., indices, k] += partials[f"{name}ⱼ"][..., :, a]
+            dz_primitive["r"][k][..., k, k] = partials["rᵢ"][..., a, a]
+
+        return dz_primitive
+
+    @instrumented
+    def build_p_primitive(self) -> ndarray:
+        """Builds the primitive matrix of potential coefficients, in
+        meters / Farad, for the shunt admittance of the line.
+
+        From the method of images, Pᵢⱼ = ln(Sᵢⱼ / dᵢⱼ) / 2πε, where Sᵢⱼ is
+        the distance from conductor i to the image of conductor j below the
+        earth, see `compute_D_matrix`, dᵢⱼ is their spacing and dᵢᵢ is the
+        outside radius of conductor i. It is laid out, and batched, like
+        `build_z_primitive` and shares its memoized geometry; rows and
+        columns of conductors missing from the model are left zero.
+
+        The conductors are taken to be bare, in air of permittivity ε, so the
+        cable classes, whose fields pass through their insulation, raise a
+        ValueError instead.
+        """
+        conductors = self.conductors
+        dimension = len(conductors)
+
+        indices = [
+            index for index, phase in enumerate(conductors) if phase in self.phases
+        ]
+        if not indices:
+            return zeros(shape=(dimension, dimension), dtype=self.dtype)
+
+        present = [conductors[index] for index in indices]
+        missing = [c for c in present if c not in self.outside_radius]
+        if missing:
+            raise ValueError(
+                "The potential coefficients need the outside_radius of every "
+                f"conductor, missing {missing}"
+            )
+        spacing = self.compute_d_matrix(present).copy()
+        diagonal = arange(len(present))
+        spacing[..., diagonal, diagonal] = self.get_conductor_values(
+            self.outside_radius, present
+        )
+        P = log(self.compute_D_matrix(present) / spacing) / (2 * π * self.ε)
+
+        p_primitive = zeros(shape=(*P.shape[:-2], dimension, dimension), dtype=P.dtype)
+        p_primitive[..., array(indices)[:, newaxis], array(indices)] = P
+
+        return p_primitive
+
+    def stack(self, models: Sequence["CarsonsEquations"]) -> "CarsonsEquations":
+        """Combines models of this class with the same conductors into one.
+
+        The per-conductor values of the result are arrays over the models
+        and its angular frequency and earth resistivity have shape
+        (batch, 1, 1), so that its
+        `build_z_primitive` returns the (batch, n, n) stack of the models'
+        primitive matrices. Only the matrix methods support stacked models.
+        The models must not be batched themselves, see `require_unbatched`.
+        """
+        require_unbatched(models)
+
+        stacked = copy(self)
+        stacked._geometry = {}
+        stacked.line_geometry = None
+        conductors = self.present_conductors
+        for name in self.per_conductor_attributes:
+            values = [getattr(model, name) for model in models]
+            setattr(
+                stacked,
+                name,
+                read_only(
+                    {
+                        conductor: moveaxis(
+                            array([value[conductor] for value in values]), 0, -1
+                        )
+                        for conductor in conductors
+                        if conductor in values[0]
+                    }
+                ),
+            )
+        stacked.ƒ = array([model.ƒ for model in models])[:, newaxis, newaxis]
+        stacked.ω = array([model.ω for model in models])[:, newaxis, newaxis]
+        stacked.ρ = array([model.ρ for model in models])[:, newaxis, newaxis]
+
+        return stacked
+
+    def at_frequencies(self, frequencies) -> "CarsonsEquations":
+        """A copy of this model evaluated at each of `frequencies` at once.
+
+        Its angular frequency has shape (len(frequencies), 1, 1), so that
+        `build_z_primitive` returns one primitive matrix per frequency. The
+        frequencies of a batched model, see `batch_shape`, are a new axis
+        before its batch axes. The copy shares the memoized geometry of
+        this model. Only the matrix methods support it.
+        """
+        swept = copy(self)
+        swept.ƒ = self._sweep_axis(frequencies)
+        swept.ω = 2.0 * π * swept.ƒ
+
+        return swept
+
+    def at_resistivities(self, resistivities) -> "CarsonsEquations":
+        """A copy of this model evaluated at each of the earth
+        `resistivities` at once, see `at_frequencies`."""
+        swept = copy(self)
+        swept.ρ = self._sweep_axis(resistivities)
+
+        return swept
+
+    def _sweep_axis(self, values) -> ndarray:
+        # the values along an axis before the batch and matrix axes
+        axes = len(self.batch_shape) + 2
+        return asarray(values, dtype=float).reshape(-1, *(1,) * axes)
+
+    def astype(self, dtype) -> "CarsonsEquations":
+        """A copy of this model whose matrix methods compute in the real
+        precision `dtype`, e.g. float32, and whose primitive matrix has the
+        matching complex dtype. Only the matrix methods support it.
+
+        In float32 the primitive and reduced impedance matrices are within
+        1e-6 of the largest entry of their float64 result, see
+        tests/test_precision.py, in half the memory. Large batched models,
+        e.g. of a `LineGeometry`, are computed about 1.4 to 2 times as fast;
+        `calculate_impedances` gains little, as most of its time goes into
+        stacking the models. The complete series is summed in float64 and
+        rounded to `dtype`; the derivatives are always float64.
+        """
+        converted = copy(self)
+        converted.dtype = dtype
+        converted._geometry = {}
+        converted.ƒ = asarray(self.ƒ, dtype=dtype)
+        converted.ω = asarray(self.ω, dtype=dtype)
+        converted.ρ = asarray(self.ρ, dtype=dtype)
+
+        return converted
+
     def compute_R(self, i, j) -> float:
         rᵢ = self.r[i]
-        ΔR = self.μ * self.ω / π * self.compute_P(i, j)
+        ΔR = self.μ * self.ω / π * self.compute_P(i, j, self.number_of_P_terms)
 
         if i == j:
             return rᵢ + ΔR
@@ -129,7 +1267,7 @@ class CarsonsEquations:
             return ΔR
 
     def compute_X(self, i, j) -> float:
-        Qᵢⱼ = self.compute_Q(i, j)
+        Qᵢⱼ = self.compute_Q(i, j, self.number_of_Q_terms)
         ΔX = self.μ * self.ω / π * Qᵢⱼ
 
         # calculate geometry ratio 𝛥G
@@ -147,42 +1285,50 @@ class CarsonsEquations:
         return X_o + ΔX
 
     def compute_P(self, i, j, number_of_terms=1) -> float:
-        terms = islice(self.compute_P_terms(i, j), number_of_terms)
-        return sum(terms)
+        Pᵢⱼ, _ = self.compute_P_and_Q(i, j, number_of_terms, 0)
+        return Pᵢⱼ
 
     def compute_P_terms(self, i, j) -> Iterator[float]:
+        """The terms of Carson's P series in turn, which
+        `calculate_carson_series` sums in closed form."""
         yield π / 8.0
 
-        kᵢⱼ = self.compute_k(i, j)
-        θᵢⱼ = self.compute_θ(i, j)
-
-        yield -kᵢⱼ / (3 * sqrt(2)) * cos(θᵢⱼ)
+        kᵢⱼ, θᵢⱼ = self.compute_k(i, j), self.compute_θ(i, j)
+        yield -kᵢⱼ / (3 * 2**0.5) * cos(θᵢⱼ)
         yield kᵢⱼ**2 / 16 * (0.6728 + log(2 / kᵢⱼ)) * cos(2 * θᵢⱼ)
         yield kᵢⱼ**2 / 16 * θᵢⱼ * sin(2 * θᵢⱼ)
-        yield kᵢⱼ**3 / (45 * sqrt(2)) * cos(3 * θᵢⱼ)
+        yield kᵢⱼ**3 / (45 * 2**0.5) * cos(3 * θᵢⱼ)
         yield -π * kᵢⱼ**4 * cos(4 * θᵢⱼ) / 1536
 
     def compute_Q(self, i, j, number_of_terms=2) -> float:
-        terms = islice(self.compute_Q_terms(i, j), number_of_terms)
-        return sum(terms)
+        _, Qᵢⱼ = self.compute_P_and_Q(i, j, 0, number_of_terms)
+        return Qᵢⱼ
 
     def compute_Q_terms(self, i, j) -> Iterator[float]:
+        """The terms of Carson's Q series in turn, see `compute_P_terms`."""
         yield -0.0386
 
-        kᵢⱼ = self.compute_k(i, j)
+        kᵢⱼ, θᵢⱼ = self.compute_k(i, j), self.compute_θ(i, j)
         yield 0.5 * log(2 / kᵢⱼ)
-
-        θᵢⱼ = self.compute_θ(i, j)
-        yield kᵢⱼ / (3 * sqrt(2)) * cos(θᵢⱼ)
+        yield kᵢⱼ / (3 * 2**0.5) * cos(θᵢⱼ)
         yield -π * kᵢⱼ**2 / 64 * cos(2 * θᵢⱼ)
-        yield kᵢⱼ**3 / (45 * sqrt(2)) * cos(3 * θᵢⱼ)
+        yield kᵢⱼ**3 / (45 * 2**0.5) * cos(3 * θᵢⱼ)
         yield -(kᵢⱼ**4) / 384 * θᵢⱼ * sin(4 * θᵢⱼ)
         yield -(kᵢⱼ**4) / 384 * cos(4 * θᵢⱼ) * (log(2 / kᵢⱼ) + 1.0895)
 
+    def compute_P_and_Q(self, i, j, number_of_P_terms=1, number_of_Q_terms=2):
+        uses_k = series_uses_k(number_of_P_terms, number_of_Q_terms)
+        uses_θ = series_uses_θ(number_of_P_terms, number_of_Q_terms)
+        kᵢⱼ = self.compute_k(i, j) if uses_k else None
+        θᵢⱼ = self.compute_θ(i, j) if uses_θ else None
+
+        return calculate_carson_series(kᵢⱼ, θᵢⱼ, number_of_P_terms, number_of_Q_terms)
+
     def compute_k(self, i, j) -> float:
         Dᵢⱼ = self.compute_D(i, j)
         return Dᵢⱼ * sqrt(self.ω * self.μ / self.ρ)
 
+    @pair_geometry
     def compute_θ(self, i, j) -> float:
         xᵢ, _ = self.phase_positions[i]
         xⱼ, _ = self.phase_positions[j]
@@ -191,19 +1337,21 @@ class CarsonsEquations:
 
         return arctan(xᵢⱼ / (hᵢ + hⱼ))
 
+    @pair_geometry
     def compute_d(self, i, j) -> float:
         return self.calculate_distance(
             self.phase_positions[i],
             self.phase_positions[j],
         )
 
+    @pair_geometry
     def compute_D(self, i, j) -> float:
         xⱼ, yⱼ = self.phase_positions[j]
 
         return self.calculate_distance(self.phase_positions[i], (xⱼ, -yⱼ))
 
     @staticmethod
-    def calculate_distance(positionᵢ, positionⱼ) -> float:
+    def calculate_distance(positionᵢ, positionⱼ) -> Any:
         xᵢ, yᵢ = positionᵢ
         xⱼ, yⱼ = positionⱼ
         return sqrt((xᵢ - xⱼ) ** 2 + (yᵢ - yⱼ) ** 2)
@@ -212,15 +1360,286 @@ class CarsonsEquations:
         _, yᵢ = self.phase_positions[i]
         return yᵢ
 
+    def compute_R_matrix(self, conductors, P=None) -> ndarray:
+        """`compute_R` of every pair of `conductors`. P may be passed in
+        when it has already been computed with `compute_P_and_Q_matrix`."""
+        r = self.get_values("r", conductors)
+        if P is None:
+            P = self.compute_P_matrix(conductors, self.number_of_P_terms)
+        ΔR = self.μ * self.ω / π * P
+
+        # rᵢ on the diagonal, broadcasting ΔR over the batch axes of r
+        return ΔR + r[..., newaxis, :] * eye(len(conductors), dtype=r.dtype)
+
+    def compute_X_matrix(self, conductors, Q=None) -> ndarray:
+        """`compute_X` of every pair of `conductors`, see `compute_R_matrix`."""
+        if Q is None:
+            Q = self.compute_Q_matrix(conductors, self.number_of_Q_terms)
+        ΔX = self.μ * self.ω / π * Q
+
+        # calculate geometry ratio 𝛥G; on the diagonal Dᵢᵢ = 2hᵢ
+        D = self.compute_D_matrix(conductors)
+        𝛥G = D / self.compute_spacing_matrix(conductors)
+
+        X_o = self.ω * self.μ / (2 * π) * log(𝛥G)
+
+        return X_o + ΔX
+
+    def compute_Z_derivatives_matrix(self, conductors) -> dict[str, ndarray]:
+        """The partial derivatives of Rᵢⱼ + jXᵢⱼ for every pair of
+        `conductors` with respect to the values of conductor i ("xᵢ", "yᵢ",
+        "gmrᵢ", "rᵢ"), the position and gmr of conductor j ("xⱼ", "yⱼ",
+        "gmrⱼ") and ρ.
+        On the diagonal i and j are the same conductor, and its derivative
+        is the sum of the two."""
+        x, y = self.get_positions(conductors)
+        xᵢⱼ = x[..., newaxis, :] - x[..., :, newaxis]
+        hᵢ_hⱼ = y[..., :, newaxis] + y[..., newaxis, :]
+        D = self.compute_D_matrix(conductors)
+        spacing = self.compute_spacing_matrix(conductors)
+        k_D_ratio = sqrt(self.ω * self.μ / self.ρ)
+
+        P_k, P_θ, Q_k, Q_θ = self.compute_P_and_Q_derivatives_matrix(
+            conductors, self.number_of_P_terms, self.number_of_Q_terms
+        )
+        Z_k = self.μ * self.ω / π * (P_k + 1j * Q_k)
+        Z_θ = self.μ * self.ω / π * (P_θ + 1j * Q_θ)
+        X_o_ratio = self.ω * self.μ / (2 * π)
+
+        # with respect to xⱼ and to either height; ∂/∂xᵢ = -∂/∂xⱼ
+        D_x, D_h = xᵢⱼ / D, hᵢ_hⱼ / D
+        θ_x, θ_h = sign(xᵢⱼ) * hᵢ_hⱼ / D**2, -abs(xᵢⱼ) / D**2
+        Z_x = Z_k * k_D_ratio * D_x + Z_θ * θ_x + 1j * X_o_ratio * D_x / D
+        Z_h = Z_k * k_D_ratio * D_h + Z_θ * θ_h + 1j * X_o_ratio * D_h / D
+
+        d_xᵢ, d_xⱼ, d_yᵢ, d_yⱼ = self.compute_d_derivatives_matrix(conductors)
+        n = len(conductors)
+        return {
+            "xᵢ": -Z_x - 1j * X_o_ratio * d_xᵢ / spacing,
+            "xⱼ": Z_x - 1j * X_o_ratio * d_xⱼ / spacing,
+            "yᵢ": Z_h - 1j * X_o_ratio * d_yᵢ / spacing,
+            "yⱼ": Z_h - 1j * X_o_ratio * d_yⱼ / spacing,
+            "gmrᵢ": -1j * X_o_ratio * eye(n) / spacing,
+            "gmrⱼ": zeros((n, n), dtype=complex),
+            "rᵢ": eye(n, dtype=complex),
+            "ρ": Z_k * -D * k_D_ratio / (2 * self.ρ),
+        }
+
+    def compute_P_and_Q_derivatives_matrix(
+        self, conductors, number_of_P_terms=1, number_of_Q_terms=2
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        """∂P/∂k, ∂P/∂θ, ∂Q/∂k and ∂Q/∂θ of every pair of `conductors`."""
+        return calculate_carson_series_derivatives(
+            self.compute_k_matrix(conductors),
+            self.compute_θ_matrix(conductors),
+            number_of_P_terms,
+            number_of_Q_terms,
+        )
+
+    def compute_d_derivatives_matrix(self, conductors) -> tuple[ndarray, ...]:
+        """The derivatives of `compute_d_matrix` with respect to xᵢ, xⱼ, yᵢ
+        and yⱼ. They are 0 on the diagonal, where the spacing is the gmr."""
+        x, y = self.get_positions(conductors)
+        xᵢⱼ = x[..., newaxis, :] - x[..., :, newaxis]
+        yᵢⱼ = y[..., newaxis, :] - y[..., :, newaxis]
+        spacing = self.compute_spacing_matrix(conductors)
+
+        return -xᵢⱼ / spacing, xᵢⱼ / spacing, -yᵢⱼ / spacing, yᵢⱼ / spacing
+
+    def compute_P_matrix(self, conductors, number_of_terms=1) -> ndarray:
+        P, _ = self.compute_P_and_Q_matrix(conductors, number_of_terms, 0)
+        return P
+
+    def compute_Q_matrix(self, conductors, number_of_terms=2) -> ndarray:
+        _, Q = self.compute_P_and_Q_matrix(conductors, 0, number_of_terms)
+        return Q
+
+    @instrumented
+    def compute_P_and_Q_matrix(
+        self, conductors, number_of_P_terms=1, number_of_Q_terms=2
+    ) -> tuple[ndarray, ndarray]:
+        """P and Q of every pair of `conductors` from one evaluation of the
+        series. k and θ are only computed if the terms requested use them."""
+        uses_k = series_uses_k(number_of_P_terms, number_of_Q_terms)
+        uses_θ = series_uses_θ(number_of_P_terms, number_of_Q_terms)
+        k = self.compute_k_matrix(conductors) if uses_k else None
+        θ = self.compute_θ_matrix(conductors) if uses_θ else None
+
+        P, Q = calculate_carson_series(k, θ, number_of_P_terms, number_of_Q_terms)
+
+        # series of only their constant term are scalars
+        shape = (len(conductors), len(conductors))
+        return (
+            P if isinstance(P, ndarray) else full(shape, P, dtype=self.dtype),
+            Q if isinstance(Q, ndarray) else full(shape, Q, dtype=self.dtype),
+        )
+
+    def compute_k_matrix(self, conductors) -> ndarray:
+        D = self.compute_D_matrix(conductors)
+        return D * sqrt(self.ω * self.μ / self.ρ)
+
+    @conductor_geometry
+    def compute_θ_matrix(self, conductors) -> ndarray:
+        x, h = self.get_positions(conductors)
+        xᵢⱼ = abs(x[..., newaxis, :] - x[..., :, newaxis])
+        hᵢ_hⱼ = h[..., :, newaxis] + h[..., newaxis, :]
+
+        return arctan(xᵢⱼ / hᵢ_hⱼ)
+
+    def compute_spacing_matrix(self, conductors) -> ndarray:
+        """The spacings dᵢⱼ, with each conductor's gmr on the diagonal."""
+        spacing = self.compute_d_matrix(conductors).copy()
+        diagonal = arange(len(conductors))
+        spacing[..., diagonal, diagonal] = self.get_values("gmr", conductors)
+        return spacing
+
+    @conductor_geometry
+    def compute_d_matrix(self, conductors) -> ndarray:
+        """Pairwise conductor spacings dᵢⱼ, as `compute_d`. The diagonal
+        has no physical meaning, see `compute_spacing_matrix`."""
+        x, y = self.get_positions(conductors)
+        return self.calculate_distance(
+            (x[..., :, newaxis], y[..., :, newaxis]),
+            (x[..., newaxis, :], y[..., newaxis, :]),
+        )
+
+    @conductor_geometry
+    def compute_D_matrix(self, conductors) -> ndarray:
+        x, y = self.get_positions(conductors)
+        return self.calculate_distance(
+            (x[..., :, newaxis], y[..., :, newaxis]),
+            (x[..., newaxis, :], -y[..., newaxis, :]),
+        )
+
+    @conductor_geometry
+    def get_positions(self, conductors) -> tuple[ndarray, ndarray]:
+        if self.reads_line_geometry(conductors):
+            return self.get_values("x", conductors), self.get_values("y", conductors)
+
+        x = {conductor: self.phase_positions[conductor][0] for conductor in conductors}
+        y = {conductor: self.phase_positions[conductor][1] for conductor in conductors}
+        return (
+            self.get_conductor_values(x, conductors),
+            self.get_conductor_values(y, conductors),
+        )
+
+    def get_values(self, name, conductors) -> ndarray:
+        """The values of attribute `name` ("x", "y", "gmr" or "r") of
+        `conductors`, read from the line geometry when there is one."""
+        if self.reads_line_geometry(conductors):
+            geometry = self.line_geometry
+            values = getattr(geometry, name).astype(self.dtype, copy=False)
+            if list(conductors) == list(geometry.labels):
+                return values
+            return values[..., geometry.indices(conductors)]
+
+        return self.get_conductor_values(getattr(self, name), conductors)
+
+    def reads_line_geometry(self, conductors) -> bool:
+        # conductors added by the cable classes, such as concentric
+        # neutrals, only exist in the per-conductor dicts
+        return self.line_geometry is not None and all(
+            conductor in self.line_geometry.labels for conductor in conductors
+        )
+
+    def get_conductor_values(self, values, conductors) -> ndarray:
+        """Gathers per-conductor values into an array with the conductors
+        along its last axis, after the batch axes of stacked models."""
+        gathered = [values[conductor] for conductor in conductors]
+        if not any(isinstance(value, ndarray) for value in gathered):
+            # the scalars of an unbatched model need no broadcasting
+            return array(gathered, dtype=self.dtype)
+        return moveaxis(array(broadcast_arrays(*gathered), dtype=self.dtype), 0, -1)
+
     @property
     def dimension(self):
-        return 2 if getattr(self, "is_secondary", False) else 3
+        return len(self.phase_conductors)
+
+    @property
+    def batch_shape(self) -> tuple[int, ...]:
+        """The leading axes of the stack of matrices `build_z_primitive`
+        returns, e.g. (batch,) for a batched `LineGeometry` or a stacked
+        model; () for a single line."""
+        shapes = [
+            value.shape[:-2] for value in (self.ω, self.ρ) if isinstance(value, ndarray)
+        ]
+        if self.line_geometry is not None:
+            shapes.append(self.line_geometry.batch_shape)
+        return broadcast_shapes(*shapes) if shapes else ()
+
+    @property
+    def present_conductors(self):
+        return [phase for phase in self.conductors if phase in self.phases]
 
     @property
     def conductors(self):
-        neutral_conductors = sorted([ph for ph in self.phases if ph.startswith("N")])
+        return self.phase_conductors + self.neutral_conductors
+
+    @property
+    def phase_conductors(self) -> list[str]:
+        """The conductors kept by the kron reduction, in the order of the
+        rows of the impedance matrix.
+
+        These are the `phase_labels`, with zero rows and columns for those
+        missing from the line, so that e.g. a "B", "C" line has a 3x3
+        matrix by default; other phases of the line are ignored. When
+        `phase_labels` is None they are the phases of the line, in the
+        order of the model, so that the matrix has no zero rows and any
+        labels can be used, e.g. the 12 phases of four coupled circuits.
+        """
+        if self.phase_labels is None:
+            neutrals = set(self.neutral_conductors)
+            return [ph for ph in self.phases if ph not in neutrals]
+        return list(self.phase_labels)
+
+    @property
+    def neutral_conductors(self) -> list[str]:
+        return sorted([ph for ph in self.phases if ph.startswith("N")])
 
-        return ["A", "B", "C"] + neutral_conductors
+
+class CompleteCarsonsEquations(CarsonsEquations):
+    """
+    Carson's Equations with the complete P and Q series, accurate at any
+    frequency rather than only for small k, see
+    `calculate_complete_carson_series`. The number of terms is chosen per
+    pair, so `number_of_P_terms` and `number_of_Q_terms` are ignored.
+    """
+
+    tolerance = 1e-12
+    asymptotic_k = 20.0
+
+    def compute_P_and_Q(self, i, j, number_of_P_terms=1, number_of_Q_terms=2):
+        Pᵢⱼ, Qᵢⱼ = calculate_complete_carson_series(
+            self.compute_k(i, j),
+            self.compute_θ(i, j),
+            self.tolerance,
+            self.asymptotic_k,
+        )
+        return Pᵢⱼ[()], Qᵢⱼ[()]
+
+    @instrumented
+    def compute_P_and_Q_matrix(
+        self, conductors, number_of_P_terms=1, number_of_Q_terms=2
+    ) -> tuple[ndarray, ndarray]:
+        P, Q = calculate_complete_carson_series(
+            self.compute_k_matrix(conductors),
+            self.compute_θ_matrix(conductors),
+            self.tolerance,
+            self.asymptotic_k,
+        )
+        # summed in float64, which the number of terms is chosen for, and
+        # rounded to the precision of the model, see `astype`
+        return P.astype(self.dtype, copy=False), Q.astype(self.dtype, copy=False)
+
+    def compute_P_and_Q_derivatives_matrix(
+        self, conductors, number_of_P_terms=1, number_of_Q_terms=2
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        return calculate_complete_carson_series_derivatives(
+            self.compute_k_matrix(conductors),
+            self.compute_θ_matrix(conductors),
+            self.tolerance,
+            self.asymptotic_k,
+        )
 
 
 class ModifiedCarsonsEquations(CarsonsEquations):
@@ -230,6 +1649,8 @@ class ModifiedCarsonsEquations(CarsonsEquations):
     """
 
     number_of_P_terms = 1
+    # the second term of Q is folded into X_o, see `compute_X`
+    number_of_Q_terms = 1
 
     def compute_P(self, i, j, number_of_terms=1) -> float:
         return super().compute_P(i, j, self.number_of_P_terms)
@@ -248,40 +1669,82 @@ class ModifiedCarsonsEquations(CarsonsEquations):
 
         return (X_o + ΔX) * self.ω * self.μ / (2 * π)
 
+    def compute_X_matrix(self, conductors, Q=None) -> ndarray:
+        Q_first_term = super().compute_Q_matrix(conductors, 1) if Q is None else Q
+
+        # Simplify equations and don't compute Dᵢⱼ explicitly
+        k_D_ratio = sqrt(self.ω * self.μ / self.ρ)
+        ΔX = Q_first_term * 2 + log(2, dtype=self.dtype)
+
+        X_o = -log(self.compute_spacing_matrix(conductors)) - log(k_D_ratio)
+
+        return (X_o + ΔX) * self.ω * self.μ / (2 * π)
+
+    def compute_Z_derivatives_matrix(self, conductors) -> dict[str, ndarray]:
+        # P and Q are constant and X depends on ρ only through log(kᵢⱼ/Dᵢⱼ)
+        spacing = self.compute_spacing_matrix(conductors)
+        X_o_ratio = self.ω * self.μ / (2 * π)
+
+        d_xᵢ, d_xⱼ, d_yᵢ, d_yⱼ = self.compute_d_derivatives_matrix(conductors)
+        n = len(conductors)
+        return {
+            "xᵢ": -1j * X_o_ratio * d_xᵢ / spacing,
+            "xⱼ": -1j * X_o_ratio * d_xⱼ / spacing,
+            "yᵢ": -1j * X_o_ratio * d_yᵢ / spacing,
+            "yⱼ": -1j * X_o_ratio * d_yⱼ / spacing,
+            "gmrᵢ": -1j * X_o_ratio * eye(n) / spacing,
+            "gmrⱼ": zeros((n, n), dtype=complex),
+            "rᵢ": eye(n, dtype=complex),
+            "ρ": 1j * X_o_ratio / (2 * self.ρ) * ones((n, n)),
+        }
+
 
 class ConcentricNeutralCarsonsEquations(ModifiedCarsonsEquations):
+    per_conductor_attributes = (*CarsonsEquations.per_conductor_attributes, "radius")
+
+    @instrumented
     def __init__(self, model, *args, **kwargs):
         super().__init__(model)
-        self.neutral_strand_gmr: dict[str, float] = model.neutral_strand_gmr
+        self.neutral_strand_gmr: dict[str, float] = dict(model.neutral_strand_gmr)
         self.neutral_strand_count: dict[str, float] = defaultdict(
             lambda: None, model.neutral_strand_count
         )
-        self.neutral_strand_resistance: dict[str, float] = (
+        self.neutral_strand_resistance: dict[str, float] = dict(
             model.neutral_strand_resistance
         )
         # fmt: off
-        self.radius: dict[str, float] = defaultdict(
+        self.radius: Mapping[str, float] = read_only(defaultdict(
             lambda: None,
             {
                 phase: (diameter_over_neutral - model.neutral_strand_diameter[phase]) / 2
                 for phase, diameter_over_neutral in model.diameter_over_neutral.items()
             },
-        )
-        self.phase_positions.update({
-            f"N{phase}": self.phase_positions[phase]
-            for phase in self.phase_positions.keys()
+        ))
+        self.phase_positions = read_only({
+            **self.phase_positions,
+            **{
+                f"N{phase}": self.phase_positions[phase]
+                for phase in self.phase_positions.keys()
+            },
         })
-        self.gmr.update({
-            phase: self.GMR_cn(phase)
-            for phase in model.diameter_over_neutral.keys()
+        self.gmr = read_only({
+            **self.gmr,
+            **{
+                phase: self.GMR_cn(phase)
+                for phase in model.diameter_over_neutral.keys()
+            },
         })
-        self.r.update({
-            phase: resistance / model.neutral_strand_count[phase]
-            for phase, resistance in model.neutral_strand_resistance.items()
+        self.r = read_only({
+            **self.r,
+            **{
+                phase: resistance / model.neutral_strand_count[phase]
+                for phase, resistance in model.neutral_strand_resistance.items()
+            },
         })
         # fmt: on
         return
 
+    @pair_geometry
     def compute_d(self, i, j) -> float:
         I, J = set(i), set(j)
         r = self.radius[i] or self.radius[j]
@@ -306,6 +1769,60 @@ class ConcentricNeutralCarsonsEquations(ModifiedCarsonsEquations):
             # Distance between two neutral/phase conductors
             return distance_ij
 
+    @conductor_geometry
+    def compute_d_matrix(self, conductors) -> ndarray:
+        neutral = array(["N" in conductor for conductor in conductors])
+        phase = array([conductor.replace("N", "") for conductor in conductors])
+        radius = self.get_conductor_values(
+            {
+                conductor: self.radius[conductor] if "N" in conductor else 0.0
+                for conductor in conductors
+            },
+            conductors,
+        )
+
+        one_neutral = neutral[:, newaxis] ^ neutral[newaxis, :]
+        same_phase = phase[:, newaxis] == phase[newaxis, :]
+        r = radius[..., :, newaxis] + radius[..., newaxis, :]
+
+        distance_ij = super().compute_d_matrix(conductors)
+        return where(
+            one_neutral & same_phase,
+            # Distance between a neutral/phase conductor of same phase
+            r,
+            where(
+                one_neutral,
+                # Distance between a neutral/phase conductor of different
+                # phase, see `compute_d`
+                (distance_ij**2 + r**2) ** 0.5,
+                distance_ij,
+            ),
+        )
+
+    def compute_d_derivatives_matrix(self, conductors) -> tuple[ndarray, ...]:
+        # a concentric neutral is at its radius from its own phase
+        # conductor, wherever either is placed
+        neutral = array(["N" in conductor for conductor in conductors])
+        phase = array([conductor.replace("N", "") for conductor in conductors])
+        fixed = (neutral[:, newaxis] ^ neutral[newaxis, :]) & (
+            phase[:, newaxis] == phase[newaxis, :]
+        )
+
+        return tuple(
+            where(fixed, 0.0, d)
+            for d in super().compute_d_derivatives_matrix(conductors)
+        )
+
+    def build_p_primitive(self) -> ndarray:
+        """Raises a ValueError: the electric field of a concentric neutral
+        cable is confined to its insulation, between the phase conductor and
+        the neutral strands, which the method of images does not model.
+        """
+        raise ValueError(
+            "The potential coefficients of a concentric neutral cable are "
+            "not modelled: its field is confined to its insulation"
+        )
+
     def GMR_cn(self, phase) -> float:
         GMR_s = self.neutral_strand_gmr[phase]
         k = self.neutral_strand_count[phase]
@@ -316,20 +1833,30 @@ class ConcentricNeutralCarsonsEquations(ModifiedCarsonsEquations):
 class TapeShieldedCableCarsonsEquations(ModifiedCarsonsEquations):
     ρ_tape_shield = 1.7721e-8  # copper resistivity at 20 degrees, ohm-meter
 
+    @instrumented
     def __init__(self, model, *args, **kwargs):
         super().__init__(model)
-        self.ds = model.tape_shield_outer_diameter
-        self.thickness = model.tape_shield_thickness
+        self.ds = dict(model.tape_shield_outer_diameter)
+        self.thickness = dict(model.tape_shield_thickness)
 
-        self.phases.extend(f"{ph}t" for ph in model.tape_shield_outer_diameter.keys())
+        self.phases = (
+            *self.phases,
+            *(f"{ph}t" for ph in model.tape_shield_outer_diameter.keys()),
+        )
         # fmt: off
-        self.r.update({
-            f"{ph}t": self.compute_shield_r(self.ds[ph], self.thickness[ph])
-            for ph in model.tape_shield_outer_diameter.keys()
+        self.r = read_only({
+            **self.r,
+            **{
+                f"{ph}t": self.compute_shield_r(self.ds[ph], self.thickness[ph])
+                for ph in model.tape_shield_outer_diameter.keys()
+            },
         })
-        self.gmr.update({
-            f"{ph}t": self.compute_shield_gmr(self.ds[ph], self.thickness[ph])
-            for ph in model.tape_shield_outer_diameter.keys()
+        self.gmr = read_only({
+            **self.gmr,
+            **{
+                f"{ph}t": self.compute_shield_gmr(self.ds[ph], self.thickness[ph])
+                for ph in model.tape_shield_outer_diameter.keys()
+            },
         })
         # fmt: on
 
@@ -338,7 +1865,9 @@ class TapeShieldedCableCarsonsEquations(ModifiedCarsonsEquations):
             f"{ph}t": self.phase_positions[ph]
             for ph in model.tape_shield_outer_diameter.keys()
         }
-        self.phase_positions.update(tape_shield_positions)
+        self.phase_positions = read_only(
+            {**self.phase_positions, **tape_shield_positions}
+        )
 
     @staticmethod
     def compute_shield_gmr(ds, thickness) -> float:
@@ -349,6 +1878,7 @@ class TapeShieldedCableCarsonsEquations(ModifiedCarsonsEquations):
         area = (π * (ds / 2) ** 2) - (π * (ds / 2 - thickness) ** 2)
         return cls.ρ_tape_shield / area
 
+    @pair_geometry
     def compute_d(self, i, j) -> float:
         I, J = set(i), set(j)
 
@@ -359,19 +1889,94 @@ class TapeShieldedCableCarsonsEquations(ModifiedCarsonsEquations):
         else:
             return super().compute_d(i, j)
 
+    @conductor_geometry
+    def compute_d_matrix(self, conductors) -> ndarray:
+        shield = array(["t" in conductor for conductor in conductors])
+        phase = array([conductor.replace("t", "") for conductor in conductors])
+        gmr = self.get_conductor_values(self.gmr, conductors)
+
+        one_tape_shield = shield[:, newaxis] ^ shield[newaxis, :]
+        same_phase = phase[:, newaxis] == phase[newaxis, :]
+        shield_gmr = where(
+            shield[:, newaxis], gmr[..., :, newaxis], gmr[..., newaxis, :]
+        )
+
+        return where(
+            one_tape_shield & same_phase,
+            shield_gmr,
+            super().compute_d_matrix(conductors),
+        )
+
+    def compute_d_derivatives_matrix(self, conductors) -> tuple[ndarray, ...]:
+        # a tape shield is at its gmr from its own phase conductor,
+        # wherever either is placed, see `compute_Z_derivatives_matrix`
+        shield = array(["t" in conductor for conductor in conductors])
+        phase = array([conductor.replace("t", "") for conductor in conductors])
+        fixed = (shield[:, newaxis] ^ shield[newaxis, :]) & (
+            phase[:, newaxis] == phase[newaxis, :]
+        )
+
+        return tuple(
+            where(fixed, 0.0, d)
+            for d in super().compute_d_derivatives_matrix(conductors)
+        )
+
+    def compute_Z_derivatives_matrix(self, conductors) -> dict[str, ndarray]:
+        partials = super().compute_Z_derivatives_matrix(conductors)
+
+        # the spacing of a shield and its own phase conductor is the gmr of
+        # the shield, conductor i in the rows of shields and j in their columns
+        shield = array(["t" in conductor for conductor in conductors])
+        phase = array([conductor.replace("t", "") for conductor in conductors])
+        one_tape_shield = shield[:, newaxis] ^ shield[newaxis, :]
+        same_phase = phase[:, newaxis] == phase[newaxis, :]
+        X_o_ratio = self.ω * self.μ / (2 * π)
+
+        Z_gmr = where(
+            one_tape_shield & same_phase,
+            -1j * X_o_ratio / self.compute_spacing_matrix(conductors),
+            0,
+        )
+        partials["gmrᵢ"] = partials["gmrᵢ"] + where(shield[:, newaxis], Z_gmr, 0)
+        partials["gmrⱼ"] = partials["gmrⱼ"] + where(shield[newaxis, :], Z_gmr, 0)
+
+        return partials
+
+    def build_p_primitive(self) -> ndarray:
+        """Raises a ValueError: the tape shield confines the electric field
+        of the cable to its insulation, which the method of images does not
+        model.
+        """
+        raise ValueError(
+            "The potential coefficients of a tape shielded cable are not "
+            "modelled: its field is confined to its insulation"
+        )
+
     @property
-    def conductors(self):
-        neutral_conductors = sorted([ph for ph in self.phases if ph.startswith("N")])
+    def neutral_conductors(self):
+        # the shields are reduced out with the neutrals
         shield_conductors = sorted([ph for ph in self.phases if ph.endswith("t")])
 
-        return ["A", "B", "C"] + shield_conductors + neutral_conductors
+        return shield_conductors + super().neutral_conductors
 
 
 class MultiConductorCarsonsEquations(ModifiedCarsonsEquations):
+    @instrumented
     def __init__(self, model):
         super().__init__(model)
-        self.outside_radius: dict[str, float] = model.outside_radius
+        self.outside_radius = read_only(model.outside_radius)
+
+    def build_p_primitive(self) -> ndarray:
+        """Raises a ValueError: the conductors of the cable are separated by
+        their insulation, whose permittivity the free-space ε of the method
+        of images does not account for.
+        """
+        raise ValueError(
+            "The potential coefficients of a multi-conductor cable are not "
+            "modelled: the permittivity of its insulation is unknown"
+        )
 
+    @pair_geometry
     def compute_d(self, i, j) -> float:
         # Assumptions:
         # 1. All conductors in the cable are touching each other and
@@ -380,15 +1985,19 @@ class MultiConductorCarsonsEquations(ModifiedCarsonsEquations):
         #    which are diagonally positioned is neglected.
         return self.outside_radius[i] + self.outside_radius[j]
 
-    @property
-    def conductors(self):
-        neutral_conductors = sorted([ph for ph in self.phases if ph.startswith("N")])
-        if self.is_secondary:
-            conductors = ["S1", "S2"] + neutral_conductors
-        else:
-            conductors = ["A", "B", "C"] + neutral_conductors
+    @conductor_geometry
+    def compute_d_matrix(self, conductors) -> ndarray:
+        outside_radius = self.get_conductor_values(self.outside_radius, conductors)
+        return outside_radius[..., :, newaxis] + outside_radius[..., newaxis, :]
+
+    def compute_d_derivatives_matrix(self, conductors) -> tuple[ndarray, ...]:
+        # the spacings only depend on the outside radii
+        n = len(conductors)
+        return (zeros((n, n)),) * 4
 
-        return conductors
+    @property
+    def phase_conductors(self):
+        return ["S1", "S2"] if self.is_secondary else super().phase_conductors
 
     @property
     def is_secondary(self):
@@ -0,0 +1,236 @@
+from typing import Any, Sequence
+
+from numpy import array, asarray, broadcast_shapes, ndarray, ndim
+
+
+def _read_only(values) -> ndarray:
+    values = array(values, dtype=float)
+    values.flags.writeable = False
+    return values
+
+
+def _column(values: ndarray, index: int):
+    column = values[..., index]
+    return float(column) if column.ndim == 0 else column
+
+
+# inputs of the cable equation classes, copied by `LineGeometry.from_model`
+cable_attribute_names = (
+    "neutral_strand_gmr",
+    "neutral_strand_resistance",
+    "neutral_strand_diameter",
+    "diameter_over_neutral",
+    "neutral_strand_count",
+    "tape_shield_outer_diameter",
+    "tape_shield_thickness",
+    "outside_radius",
+    "insulation_thickness",
+)
+
+
+class LineGeometry:
+    """An array-backed line model.
+
+    The positions, gmr and resistance of the conductors named in `labels`
+    are arrays with the conductors along their last axis. Any leading axes
+    describe a batch of line segments with the same conductors, so that
+    a million segments are a handful of (1000000, n) arrays rather than a
+    million model objects. Arrays are broadcast against each other, e.g.
+    a gmr of shape (n,) is shared by every segment; `frequency` and
+    `earth_resistivity` are scalars or arrays of the batch shape. Without
+    an `earth_resistivity` the geometry has no such attribute, so the
+    equation class's `ρ` applies, as for any line model.
+
+    It provides the line model interface the equation classes read
+    (`phases`, `wire_positions`, `geometric_mean_radius`, `resistance`,
+    `frequency` and `earth_resistivity`), so all of them accept it, and
+    `CarsonsEquations` reads the arrays directly instead of gathering them
+    from per-conductor dicts. A batched geometry gives an equation model
+    whose `build_z_primitive` returns the (batch, n, n) stack of primitive
+    matrices, like `CarsonsEquations.stack`.
+
+    Inputs specific to the cable classes, such as `neutral_strand_gmr`,
+    are passed as keyword arguments mapping conductors to values, and read
+    back as attributes.
+
+    The arrays are copied when the geometry is created and are read-only,
+    so equation models can share them without copying.
+    """
+
+    __slots__ = (
+        "labels",
+        "x",
+        "y",
+        "gmr",
+        "r",
+        "phases",
+        "frequency",
+        "earth_resistivity",
+        "cable_attributes",
+    )
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        x,
+        y,
+        gmr,
+        r,
+        frequency=60,
+        earth_resistivity=None,
+        phases: Sequence[str] | None = None,
+        **cable_attributes,
+    ):
+        self.labels: tuple[str, ...] = tuple(labels)
+        self.x: ndarray = _read_only(x)
+        self.y: ndarray = _read_only(y)
+        self.gmr: ndarray = _read_only(gmr)
+        self.r: ndarray = _read_only(r)
+        self.phases: tuple[str, ...] = tuple(self.labels if phases is None else phases)
+        self.frequency = frequency if ndim(frequency) == 0 else _read_only(frequency)
+        if earth_resistivity is not None:
+            self.earth_resistivity = (
+                earth_resistivity
+                if ndim(earth_resistivity) == 0
+                else _read_only(earth_resistivity)
+            )
+        self.cable_attributes: dict[str, dict[str, Any]] = {
+            name: dict(values) for name, values in cable_attributes.items()
+        }
+
+        if len(set(self.labels)) != len(self.labels):
+            raise ValueError(f"conductor labels must be unique, got {self.labels}")
+        for name in ("x", "y", "gmr", "r"):
+            values = getattr(self, name)
+            if values.ndim == 0 or values.shape[-1] != len(self.labels):
+                raise ValueError(
+                    f"{name} must have one value per conductor along its last "
+                    f"axis, got shape {values.shape} for {len(self.labels)} "
+                    "conductors"
+                )
+        # raises if the batch axes do not broadcast
+        self.batch_shape
+
+    @classmethod
+    def from_model(cls, model) -> "LineGeometry":
+        """Converts a line model with the per-conductor dict interface."""
+        labels = tuple(model.wire_positions)
+        return cls(
+            labels,
+            x=[model.wire_positions[label][0] for label in labels],
+            y=[model.wire_positions[label][1] for label in labels],
+            gmr=[model.geometric_mean_radius[label] for label in labels],
+            r=[model.resistance[label] for label in labels],
+            frequency=getattr(model, "frequency", 60),
+            earth_resistivity=getattr(model, "earth_resistivity", None),
+            phases=model.phases,
+            **{
+                name: getattr(model, name)
+                for name in cable_attribute_names
+                if hasattr(model, name)
+            },
+        )
+
+    @classmethod
+    def from_models(cls, models: Sequence) -> "LineGeometry":
+        """Converts line models with the same conductors into one geometry
+        with a batch axis over the models."""
+        geometries = [cls.from_model(model) for model in models]
+        labels, phases = geometries[0].labels, geometries[0].phases
+        for geometry in geometries:
+            if geometry.labels != labels or set(geometry.phases) != set(phases):
+                raise ValueError(
+                    "models must have the same conductors, got "
+                    f"{labels} and {geometry.labels}"
+                )
+
+        def stacked(name):
+            return array([getattr(geometry, name) for geometry in geometries])
+
+        with_resistivity = [
+            hasattr(geometry, "earth_resistivity") for geometry in geometries
+        ]
+        if any(with_resistivity) and not all(with_resistivity):
+            raise ValueError(
+                "earth_resistivity must be given for all of the models or none"
+            )
+
+        return cls(
+            labels,
+            x=stacked("x"),
+            y=stacked("y"),
+            gmr=stacked("gmr"),
+            r=stacked("r"),
+            frequency=stacked("frequency"),
+            earth_resistivity=(
+                stacked("earth_resistivity") if all(with_resistivity) else None
+            ),
+            phases=phases,
+            **{
+                name: {
+                    conductor: array(
+                        [
+                            geometry.cable_attributes[name][conductor]
+                            for geometry in geometries
+                        ]
+                    )
+                    for conductor in values
+                }
+                for name, values in geometries[0].cable_attributes.items()
+            },
+        )
+
+    @property
+    def batch_shape(self) -> tuple[int, ...]:
+        return broadcast_shapes(
+            self.x.shape[:-1],
+            self.y.shape[:-1],
+            self.gmr.shape[:-1],
+            self.r.shape[:-1],
+            asarray(self.frequency).shape,
+            asarray(getattr(self, "earth_resistivity", None)).shape,
+        )
+
+    @property
+    def is_neutral(self) -> ndarray:
+        """Mask of the neutral conductors, in the order of `labels`."""
+        return array([label.startswith("N") for label in self.labels], dtype=bool)
+
+    @property
+    def phase_indices(self) -> ndarray:
+        return (~self.is_neutral).nonzero()[0]
+
+    @property
+    def neutral_indices(self) -> ndarray:
+        return self.is_neutral.nonzero()[0]
+
+    def indices(self, conductors: Sequence[str]) -> list[int]:
+        """Positions of `conductors` along the last axis of the arrays."""
+        return [self.labels.index(conductor) for conductor in conductors]
+
+    @property
+    def wire_positions(self) -> dict[str, tuple[Any, Any]]:
+        return {
+            label: (_column(self.x, index), _column(self.y, index))
+            for index, label in enumerate(self.labels)
+        }
+
+    @property
+    def geometric_mean_radius(self) -> dict[str, Any]:
+        return {
+            label: _column(self.gmr, index) for index, label in enumerate(self.labels)
+        }
+
+    @property
+    def resistance(self) -> dict[str, Any]:
+        return {
+            label: _column(self.r, index) for index, label in enumerate(self.labels)
+        }
+
+    def __getattr__(self, name):
+        # only called for names that are not slots, see `cable_attributes`
+        if name != "cable_attributes" and name in self.cable_attributes:
+            return self.cable_attributes[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
@@ -0,0 +1,95 @@
+from copy import copy
+
+from numpy import ndarray
+
+from carsons.carsons import CarsonsEquations
+from carsons.kron import KronReduction
+
+
+class IncrementalImpedance:
+    """Keeps the impedance matrix of a model up to date as its conductors
+    are moved or changed one at a time, e.g. while a conductor is dragged
+    in a line design tool:
+
+        line = IncrementalImpedance(CarsonsEquations(Line()))
+        z_abc = line.update("B", position=(0.9, 8.6))
+
+    Changing conductor i only changes row and column i of the primitive
+    matrix, which are taken from the model's vectorized
+    `build_z_primitive`; its array operations cost less than evaluating
+    the pairs of the row one by one for all but the smallest lines. When
+    i is a phase conductor Ẑnn is unchanged, and the
+    reduced matrix is corrected in its row and column i from the stored
+    Ẑnn⁻¹ rather than reduced again. Changing a neutral reduces again.
+
+    The model is copied, so the caller's model is left as it was. Only
+    unbatched models are supported. Conductors that cable classes place
+    at their phase conductor, such as concentric neutrals, are conductors
+    of their own and are not moved with it.
+    """
+
+    def __init__(self, model: CarsonsEquations):
+        self.model = copy(model)
+        # the per-conductor mappings are the only inputs from now on
+        self.model.forget_geometry()
+
+        self._z_primitive = self.model.build_z_primitive()
+        if self._z_primitive.ndim != 2:
+            raise ValueError("IncrementalImpedance requires an unbatched model")
+        self._reduce()
+
+        self.conductors = self.model.conductors
+
+    @property
+    def z_primitive(self) -> ndarray:
+        return self._z_primitive.copy()
+
+    @property
+    def z_abc(self) -> ndarray:
+        return self._z_abc.copy()
+
+    def update(self, conductor, position=None, gmr=None, resistance=None) -> ndarray:
+        """Sets the values given for `conductor` and returns the updated
+        impedance matrix, the same as `calculate_impedance` would for a
+        model with those values."""
+        model = self.model
+        if conductor not in self.conductors or conductor not in model.phases:
+            raise ValueError(f"{conductor} is not a conductor of the model")
+
+        if position is not None:
+            model.phase_positions = {
+                **model.phase_positions,
+                conductor: tuple(position),
+            }
+        if gmr is not None:
+            model.gmr = {**model.gmr, conductor: gmr}
+        if resistance is not None:
+            model.r = {**model.r, conductor: resistance}
+        model.forget_geometry()
+
+        index = self.conductors.index(conductor)
+        row = model.build_z_primitive()[index]
+        self._z_primitive[index, :] = row
+        self._z_primitive[:, index] = row
+
+        if index < model.dimension:
+            self._update_phase(index)
+        else:
+            self._reduce()
+
+        return self.z_abc
+
+    def _reduce(self):
+        self._reduction = KronReduction(self._z_primitive, self.model.dimension)
+        self._z_abc = self._reduction.z_abc
+
+    def _update_phase(self, index):
+        # only column `index` of Ẑnp changes, and so of -Ẑnn⁻¹Ẑnp; as
+        # Z_abc is symmetric its row and column `index` are the same
+        d, reduction = self.model.dimension, self._reduction
+        Ẑpp_row, Ẑpn_row = self._z_primitive[index, :d], self._z_primitive[index, d:]
+        reduction.current_division_matrix[:, index] = -reduction.solve(Ẑpn_row)
+
+        row = Ẑpp_row + Ẑpn_row @ reduction.current_division_matrix
+        self._z_abc[index, :] = row
+        self._z_abc[:, index] = row
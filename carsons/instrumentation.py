@@ -0,0 +1,108 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Iterator, NamedTuple
+
+
+class Stage(NamedTuple):
+    """One call of an instrumented function, as passed to sinks."""
+
+    name: str  # qualified name, e.g. "CarsonsEquations.build_z_primitive"
+    equations: str | None  # class of the model for methods, else None
+    seconds: float  # wall time, including nested stages
+    shape: tuple[int, ...] | None  # of the matrix computed, if any
+
+
+Sink = Callable[[Stage], None]
+
+# sinks of the active `instrument` blocks; instrumented functions check
+# that it is empty and otherwise do nothing
+_sinks: list[Sink] = []
+
+
+@contextmanager
+def instrument(sink: Sink | None = None) -> Iterator[Sink]:
+    """Records the stages of impedance calculations run in the block:
+
+        with instrument() as statistics:
+            calculate_impedances(models)
+        statistics.summary()
+
+    `sink` is called with a `Stage` for every call of an instrumented
+    function, from any thread, and defaults to a new `StageStatistics`.
+    Blocks may be nested; every active sink receives every stage.
+    """
+    sink = StageStatistics() if sink is None else sink
+    _sinks.append(sink)
+    try:
+        yield sink
+    finally:
+        _sinks.remove(sink)
+
+
+def instrumented(function):
+    """Reports the calls of `function` to the active sinks, see
+    `instrument`. Outside of `instrument` blocks it only adds a call."""
+    name = function.__qualname__
+    is_method = "." in name
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _sinks:
+            return function(*args, **kwargs)
+
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        seconds = perf_counter() - start
+
+        stage = Stage(
+            name,
+            type(args[0]).__name__ if is_method else None,
+            seconds,
+            _shape(result),
+        )
+        for sink in list(_sinks):
+            sink(stage)
+        return result
+
+    return wrapper
+
+
+def _shape(result) -> tuple[int, ...] | None:
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    return getattr(result, "shape", None)
+
+
+class StageStatistics:
+    """A sink totalling the calls, wall time and matrix shapes of each
+    stage per equation class."""
+
+    def __init__(self):
+        self.calls: Counter[tuple[str, str | None]] = Counter()
+        self.seconds: defaultdict[tuple[str, str | None], float] = defaultdict(float)
+        self.shapes: defaultdict[tuple[str, str | None], Counter] = defaultdict(Counter)
+
+    def __call__(self, stage: Stage):
+        key = (stage.name, stage.equations)
+        self.calls[key] += 1
+        self.seconds[key] += stage.seconds
+        if stage.shape is not None:
+            self.shapes[key][stage.shape] += 1
+
+    def summary(self) -> list[dict]:
+        """One dict per stage and equation class, e.g. for a metrics
+        exporter, with the slowest stages first."""
+        return [
+            {
+                "stage": name,
+                "equations": equations,
+                "calls": self.calls[name, equations],
+                "seconds": self.seconds[name, equations],
+                "shapes": dict(self.shapes[name, equations]),
+            }
+            for name, equations in sorted(
+                self.calls, key=lambda key: self.seconds[key], reverse=True
+            )
+        ]
@@ -0,0 +1,68 @@
+from numpy import asarray, ndarray, newaxis, swapaxes, zeros
+from numpy.linalg import inv
+
+
+class KronReduction:
+    """The Kron reduction of a primitive impedance matrix, with Ẑnn
+    factored once and kept for any number of further reductions:
+
+        reduction = KronReduction(z_primitive, dimension=3)
+        z_abc = reduction.z_abc
+        I_n = reduction.calculate_neutral_currents(I_abc)
+
+    See `perform_kron_reduction` for the blocks of z_primitive. A stack of
+    primitive matrices of shape (..., n, n), e.g. from
+    `CarsonsEquations.at_frequencies`, is factored in the same single
+    call, matrix by matrix.
+
+    Ẑnn is only as large as the number of neutral and shield conductors,
+    so the factorization is kept as Ẑnn⁻¹, from one LU based inversion;
+    each later solve is then a matrix product.
+    """
+
+    def __init__(self, z_primitive: ndarray, dimension=3):
+        z_primitive = asarray(z_primitive)
+        d = self.dimension = dimension
+
+        self.Ẑpp, self.Ẑpn = z_primitive[..., :d, :d], z_primitive[..., :d, d:]
+        self.Ẑnp, self.Ẑnn = z_primitive[..., d:, :d], z_primitive[..., d:, d:]
+        if self.Ẑnn.shape[-1]:
+            self.Ẑnn_inv = inv(self.Ẑnn)
+        else:
+            self.Ẑnn_inv = zeros(self.Ẑnn.shape, dtype=complex)
+
+        # -Ẑnn⁻¹Ẑnp
+        self.current_division_matrix = -(self.Ẑnn_inv @ self.Ẑnp)
+
+    @property
+    def z_abc(self) -> ndarray:
+        """Ẑpp - Ẑpn Ẑnn⁻¹Ẑnp"""
+        return self.Ẑpp + self.Ẑpn @ self.current_division_matrix
+
+    def solve(self, b) -> ndarray:
+        """Ẑnn⁻¹b, for a vector b of shape (m,) or a stack of matrices of
+        shape (..., m, k)."""
+        b = asarray(b)
+        if b.ndim == 1:
+            return (self.Ẑnn_inv @ b[:, newaxis])[..., 0]
+        return self.Ẑnn_inv @ b
+
+    def reduce(self, Ẑpp, Ẑpn, Ẑnp=None) -> ndarray:
+        """Ẑpp - Ẑpn Ẑnn⁻¹Ẑnp for other phase blocks coupled to the same
+        neutrals, e.g. other arrangements of the phase conductors of a
+        cable run. Ẑnp is Ẑpnᵀ if not given, as primitive matrices are
+        symmetric. The blocks may have leading axes of their own."""
+        Ẑpn = asarray(Ẑpn)
+        Ẑnp = swapaxes(Ẑpn, -1, -2) if Ẑnp is None else asarray(Ẑnp)
+        return asarray(Ẑpp) - Ẑpn @ self.solve(Ẑnp)
+
+    def calculate_neutral_currents(self, phase_currents) -> ndarray:
+        """The currents induced in the neutral conductors by the phase
+        currents, -Ẑnn⁻¹Ẑnp I_abc, when the neutrals are grounded at both
+        ends. phase_currents is a vector of shape (p,) or a stack of
+        matrices of shape (..., p, k), see `solve`."""
+        phase_currents = asarray(phase_currents)
+        if phase_currents.ndim == 1:
+            I_abc = phase_currents[:, newaxis]
+            return (self.current_division_matrix @ I_abc)[..., 0]
+        return self.current_division_matrix @ phase_currents
@@ -0,0 +1,142 @@
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Sequence
+
+from numpy import ndarray, zeros
+
+from carsons import carsons
+
+
+class ImpedanceExecutor:
+    """Computes the impedance matrices of many line models on a pool of
+    worker processes.
+
+    The models are split into chunks of `chunk_size`, each evaluated by a
+    worker with `carsons.calculate_impedances`. Workers write their
+    results straight into a shared memory array at the chunk's offset, so
+    matrices are never pickled and the output is in the order of the
+    input whichever worker finishes first.
+
+        with ImpedanceExecutor(max_workers=16) as executor:
+            z_abc = executor.calculate_impedances(lines, CarsonsEquations)
+
+    Line models, rather than equation models, are sent to the workers, so
+    they must be picklable; `LineGeometry` is.
+    """
+
+    def __init__(self, max_workers: int | None = None, chunk_size: int = 10_000):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool: Executor | None = None
+
+    def calculate_impedances(
+        self,
+        line_models: Iterable,
+        equations: type[carsons.CarsonsEquations] = carsons.CarsonsEquations,
+    ) -> ndarray:
+        """Returns the same array as
+        `carsons.calculate_impedances(equations(m) for m in line_models)`."""
+        line_models = list(line_models)
+        chunks = [
+            (start, line_models[start : start + self.chunk_size])
+            for start in range(0, len(line_models), self.chunk_size)
+        ]
+
+        if len(chunks) <= 1 or self.max_workers == 1:
+            return carsons.calculate_impedances(equations(m) for m in line_models)
+
+        p = _dimension_bound(line_models, equations)
+        shape = (len(line_models), p, p)
+        memory = SharedMemory(create=True, size=16 * p * p * len(line_models))
+        try:
+            futures = [
+                self.pool.submit(
+                    _calculate_chunk, memory.name, shape, start, equations, chunk
+                )
+                for start, chunk in chunks
+            ]
+            dimension = max(future.result() for future in futures)
+
+            z_abc: ndarray = ndarray(shape, dtype=complex, buffer=memory.buf)
+            result = z_abc[:, :dimension, :dimension].copy()
+            del z_abc
+        finally:
+            memory.close()
+            memory.unlink()
+
+        return result
+
+    @property
+    def pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def calculate_impedances(
+    line_models: Iterable,
+    equations: type[carsons.CarsonsEquations] = carsons.CarsonsEquations,
+    max_workers: int | None = None,
+    chunk_size: int = 10_000,
+) -> ndarray:
+    """Computes the impedance matrices of `line_models` on a temporary
+    `ImpedanceExecutor`."""
+    with ImpedanceExecutor(max_workers, chunk_size) as executor:
+        return executor.calculate_impedances(line_models, equations)
+
+
+def _dimension_bound(line_models: Sequence, equations) -> int:
+    # sizes the shared memory before any model is converted: a dimension is
+    # at most the number of phase labels, or of conductors for models laid
+    # out in their own phases, see `CarsonsEquations.phase_conductors`
+    bound = 3
+    for model in line_models:
+        labels = getattr(model, "phase_labels", equations.phase_labels)
+        bound = max(bound, len(model.phases) if labels is None else len(labels))
+    return bound
+
+
+def _calculate_chunk(
+    name: str,
+    shape: tuple[int, int, int],
+    start: int,
+    equations: type[carsons.CarsonsEquations],
+    line_models: Sequence,
+) -> int:
+    z_abc = carsons.calculate_impedances(equations(m) for m in line_models)
+    dimension = z_abc.shape[-1]
+
+    memory = _attach(name)
+    try:
+        output: ndarray = ndarray(shape, dtype=complex, buffer=memory.buf)
+        output[start : start + len(z_abc)] = zeros(shape[1:])
+        output[start : start + len(z_abc), :dimension, :dimension] = z_abc
+        del output
+    finally:
+        memory.close()
+
+    return dimension
+
+
+def _attach(name: str) -> SharedMemory:
+    # the creating process unlinks the block. Workers are its children and
+    # share its resource tracker, where attaching registers the block again,
+    # which is harmless; from 3.13 on it can be skipped.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
@@ -124,3 +124,48 @@ class MultiLineModel:
     @property
     def outside_radius(self):
         return self._outside_radius
+
+
+class TapeShieldedLineModel:
+    def __init__(self, conductors):
+        self._resistance = {}
+        self._geometric_mean_radius = {}
+        self._wire_positions = {}
+        self._tape_shield_outer_diameter = {}
+        self._tape_shield_thickness = {}
+
+        for phase, val in conductors.items():
+            self._resistance[phase] = val["resistance"]
+            self._geometric_mean_radius[phase] = val["gmr"]
+            self._wire_positions[phase] = val["wire_positions"]
+            if "tape_shield_outer_diameter" in val:
+                self._tape_shield_outer_diameter[phase] = val[
+                    "tape_shield_outer_diameter"
+                ]
+                self._tape_shield_thickness[phase] = val["tape_shield_thickness"]
+
+        self._phases = sorted(list(conductors.keys()))
+
+    @property
+    def resistance(self):
+        return self._resistance
+
+    @property
+    def geometric_mean_radius(self):
+        return self._geometric_mean_radius
+
+    @property
+    def wire_positions(self):
+        return self._wire_positions
+
+    @property
+    def phases(self):
+        return self._phases
+
+    @property
+    def tape_shield_outer_diameter(self):
+        return self._tape_shield_outer_diameter
+
+    @property
+    def tape_shield_thickness(self):
+        return self._tape_shield_thickness
@@ -0,0 +1,134 @@
+import pytest
+from numpy import array, float32, log
+from numpy import pi as π
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedances,
+    calculate_line_parameters,
+    calculate_shunt_admittance,
+    calculate_shunt_admittances,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import concentric_cable, triplex_secondary
+
+MICROSIEMENS_PER_MILE_TO_SIEMENS_PER_METER = 1e-6 / 1_609.344
+
+
+class ACBN_line_with_radii(ACBN_geometry_line):
+    """IEEE 13 Configuration 601, 556,500 26/7 ACSR phases and a 4/0 6/1
+    ACSR neutral"""
+
+    outside_radius = {
+        "A": 0.0117729,
+        "B": 0.0117729,
+        "C": 0.0117729,
+        "N": 0.0071501,
+    }
+
+
+class CBN_line_with_radii(CBN_geometry_line):
+    outside_radius = {"B": 0.0071501, "C": 0.0071501, "N": 0.0071501}
+
+
+def ACBN_line_shunt_admittance_60Hz():
+    """IEEE 13 Configuration 601 Shunt Admittance At 60Hz"""
+    return MICROSIEMENS_PER_MILE_TO_SIEMENS_PER_METER * array(
+        [
+            [6.2998j, -1.9958j, -1.2595j],
+            [-1.9958j, 5.9597j, -0.7417j],
+            [-1.2595j, -0.7417j, 5.6386j],
+        ]
+    )
+
+
+def test_ieee_13_configuration_601():
+    y_abc = calculate_shunt_admittance(CarsonsEquations(ACBN_line_with_radii()))
+
+    # the feeder's data rounds ε to 1.4240e-2 μF/mile
+    assert_allclose(y_abc, ACBN_line_shunt_admittance_60Hz(), rtol=1e-3)
+
+
+def test_potential_coefficients():
+    model = CarsonsEquations(ACBN_line_with_radii())
+    p_primitive = model.build_p_primitive()
+
+    A, N = model.conductors.index("A"), model.conductors.index("N")
+    (xₐ, yₐ), (xₙ, yₙ) = model.phase_positions["A"], model.phase_positions["N"]
+    Sₐₙ = ((xₐ - xₙ) ** 2 + (yₐ + yₙ) ** 2) ** 0.5
+    dₐₙ = ((xₐ - xₙ) ** 2 + (yₐ - yₙ) ** 2) ** 0.5
+
+    assert p_primitive[A, N] == pytest.approx(log(Sₐₙ / dₐₙ) / (2 * π * model.ε))
+    assert p_primitive[A, A] == pytest.approx(
+        log(2 * yₐ / 0.0117729) / (2 * π * model.ε)
+    )
+    assert_allclose(p_primitive, p_primitive.T)
+
+
+def test_missing_phases_are_zero():
+    y_abc = calculate_shunt_admittance(ModifiedCarsonsEquations(CBN_line_with_radii()))
+
+    assert (y_abc[0] == 0).all() and (y_abc[:, 0] == 0).all()
+    assert (y_abc[1:, 1:].imag > 0).any()
+
+
+def test_batches_match_single_models():
+    models = [
+        CarsonsEquations(ACBN_line_with_radii(ƒ=50)),
+        CarsonsEquations(CBN_line_with_radii()),
+        CarsonsEquations(ACBN_line_with_radii()),
+    ]
+    z_abc, y_abc = calculate_line_parameters(models)
+
+    assert_allclose(z_abc, calculate_impedances(models))
+    assert_allclose(y_abc, calculate_shunt_admittances(models))
+    for model, y in zip(models, y_abc):
+        expected = calculate_shunt_admittance(model)
+        size = len(expected)
+        assert_allclose(y[:size, :size], expected, rtol=1e-12)
+        assert (y[size:] == 0).all()
+
+
+def test_line_geometry():
+    lines = [ACBN_line_with_radii(ƒ=50), ACBN_line_with_radii(ƒ=60)]
+    geometry = LineGeometry.from_models(lines)
+    y_abc = calculate_shunt_admittance(CarsonsEquations(geometry))
+
+    assert_allclose(
+        y_abc,
+        calculate_shunt_admittances(CarsonsEquations(line) for line in lines),
+        rtol=1e-12,
+    )
+
+
+def test_single_precision():
+    models = [CarsonsEquations(ACBN_line_with_radii())]
+    y_abc = calculate_shunt_admittances(models, dtype=float32)
+
+    assert y_abc.dtype == "complex64"
+    assert_allclose(y_abc, calculate_shunt_admittances(models), rtol=1e-5)
+
+
+def test_requires_radii():
+    with pytest.raises(ValueError, match="outside_radius"):
+        CarsonsEquations(ACBN_geometry_line()).build_p_primitive()
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ConcentricNeutralCarsonsEquations(concentric_cable()),
+        TapeShieldedCableCarsonsEquations(AN_Tape_Shielded_Cable(3)),
+        MultiConductorCarsonsEquations(triplex_secondary()),
+    ],
+)
+def test_cables_are_not_supported(model):
+    with pytest.raises(ValueError, match="insulation"):
+        calculate_shunt_admittance(model)
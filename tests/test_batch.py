@@ -0,0 +1,105 @@
+import pytest
+from numpy import float32
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+    convert_geometric_model,
+    convert_geometric_models,
+)
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import (
+    concentric_cable,
+    dual_neutral_line,
+    quadruplex_cable,
+    triplex_secondary,
+)
+
+
+def test_batch_matches_individual_models():
+    models = [
+        CarsonsEquations(ACBN_geometry_line(ƒ=60)),
+        ConcentricNeutralCarsonsEquations(concentric_cable()),
+        CarsonsEquations(CN_geometry_line(ƒ=50)),
+        CarsonsEquations(ACBN_geometry_line(ƒ=50)),
+        TapeShieldedCableCarsonsEquations(AN_Tape_Shielded_Cable(3)),
+        MultiConductorCarsonsEquations(quadruplex_cable()),
+        CarsonsEquations(dual_neutral_line()),
+        TapeShieldedCableCarsonsEquations(AN_Tape_Shielded_Cable(1)),
+        CarsonsEquations(CBN_geometry_line(ƒ=60)),
+        ConcentricNeutralCarsonsEquations(concentric_cable()),
+    ]
+    z_abc = calculate_impedances(models)
+
+    assert z_abc.shape == (len(models), 3, 3)
+    for model, z in zip(models, z_abc):
+        assert_allclose(z, calculate_impedance(model), rtol=1e-12, atol=0)
+
+
+def test_batch_of_secondaries():
+    models = [MultiConductorCarsonsEquations(triplex_secondary()) for _ in range(4)]
+    z_abc = calculate_impedances(models)
+
+    assert z_abc.shape == (4, 2, 2)
+    assert_allclose(z_abc[2], calculate_impedance(models[2]), rtol=1e-12, atol=0)
+
+
+def test_batch_pads_secondaries_mixed_with_three_phase_lines():
+    models = [
+        MultiConductorCarsonsEquations(triplex_secondary()),
+        MultiConductorCarsonsEquations(quadruplex_cable()),
+    ]
+    z_abc = calculate_impedances(models)
+
+    assert z_abc.shape == (2, 3, 3)
+    assert_allclose(z_abc[0, :2, :2], calculate_impedance(models[0]), rtol=1e-12)
+    assert (z_abc[0, 2, :] == 0).all() and (z_abc[0, :, 2] == 0).all()
+    assert_allclose(z_abc[1], calculate_impedance(models[1]), rtol=1e-12)
+
+
+def test_batch_of_mixed_layouts_and_precisions():
+    unpadded = CarsonsEquations(CBN_geometry_line())
+    unpadded.phase_labels = None
+    models = [
+        CarsonsEquations(CBN_geometry_line()),
+        unpadded,
+        CarsonsEquations(CBN_geometry_line()).astype(float32),
+    ]
+    z_abc = calculate_impedances(models)
+
+    assert_allclose(z_abc[0], calculate_impedance(models[0]), rtol=1e-12)
+    assert_allclose(z_abc[1, :2, :2], calculate_impedance(models[1]), rtol=1e-12)
+    assert (z_abc[1, 2] == 0).all() and (z_abc[1, :, 2] == 0).all()
+    assert_allclose(z_abc[2], calculate_impedance(models[0]), rtol=1e-5, atol=1e-9)
+
+
+def test_batched_models_are_evaluated_on_their_own():
+    model = CarsonsEquations(ACBN_geometry_line())
+    batched = CarsonsEquations(LineGeometry.from_models([ACBN_geometry_line()] * 2))
+
+    for models in ([model, batched], [model.at_frequencies([50, 60])]):
+        with pytest.raises(ValueError, match="calculate_impedance"):
+            calculate_impedances(models)
+
+
+def test_empty_batch():
+    assert calculate_impedances([]).shape == (0, 3, 3)
+
+
+def test_convert_geometric_models():
+    lines = [ACBN_geometry_line(ƒ=50), CBN_geometry_line(), CN_geometry_line()]
+    z_abc = convert_geometric_models(lines)
+
+    for line, z in zip(lines, z_abc):
+        assert_allclose(z, convert_geometric_model(line), rtol=1e-12, atol=0)
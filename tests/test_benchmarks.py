@@ -0,0 +1,19 @@
+from benchmarks.run import compare, run_benchmarks
+
+
+def test_benchmarks_run():
+    results = run_benchmarks(
+        conductor_counts=(4,), batch_sizes=(1,), repeat=1, min_time=0
+    )
+
+    assert "build_z_primitive[CarsonsEquations-4]" in results
+    assert "perform_kron_reductions[1]" in results
+    assert "import[carsons]" in results
+    assert all(seconds > 0 for seconds in results.values())
+
+
+def test_compare_reports_slower_benchmarks():
+    baseline = {"fast": 1.0, "slow": 1.0, "removed": 1.0}
+    results = {"fast": 1.1, "slow": 1.5, "added": 9.0}
+
+    assert compare(results, baseline, tolerance=0.2) == ["slow"]
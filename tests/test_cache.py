@@ -0,0 +1,135 @@
+import pytest
+from numpy import float32
+from numpy.testing import assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    ImpedanceCache,
+    LineGeometry,
+    calculate_impedance,
+    convert_geometric_model,
+)
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_z_primitive import concentric_cable
+
+
+def test_repeated_geometries_are_served_from_the_cache():
+    cache = ImpedanceCache()
+
+    first = cache.convert_geometric_model(ACBN_geometry_line())
+    second = cache.convert_geometric_model(ACBN_geometry_line())
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_array_equal(first, convert_geometric_model(ACBN_geometry_line()))
+    assert_array_equal(second, first)
+
+
+def test_cached_matrices_cannot_be_modified_by_callers():
+    cache = ImpedanceCache()
+
+    cache.convert_geometric_model(CN_geometry_line())[:] = 0
+
+    assert cache.convert_geometric_model(CN_geometry_line()).any()
+
+
+def test_frequency_is_part_of_the_key():
+    cache = ImpedanceCache()
+
+    z_60 = cache.convert_geometric_model(ACBN_geometry_line(ƒ=60))
+    z_50 = cache.convert_geometric_model(ACBN_geometry_line(ƒ=50))
+
+    assert cache.misses == 2
+    assert not (z_60 == z_50).all()
+
+
+def test_phase_order_is_part_of_the_key_without_fixed_labels():
+    class UnlabelledLine(ACBN_geometry_line):
+        phase_labels = None
+
+        def __init__(self, phases):
+            super().__init__()
+            self._phases = phases
+
+        @property
+        def phases(self):
+            return self._phases
+
+    cache = ImpedanceCache()
+    ACN, CAN = UnlabelledLine(["A", "C", "N"]), UnlabelledLine(["C", "A", "N"])
+
+    assert_array_equal(cache.convert_geometric_model(ACN), convert_geometric_model(ACN))
+    assert_array_equal(cache.convert_geometric_model(CAN), convert_geometric_model(CAN))
+    assert cache.misses == 2
+
+    cache.convert_geometric_model(CBN_geometry_line())
+    cache.convert_geometric_model(CBN_geometry_line())
+    assert cache.hits == 1
+
+
+def test_equations_are_keyed_on_their_class_and_cable_attributes():
+    cache = ImpedanceCache()
+
+    cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line()))
+    z_abc = cache.calculate_impedance(
+        ConcentricNeutralCarsonsEquations(concentric_cable())
+    )
+    cache.calculate_impedance(ConcentricNeutralCarsonsEquations(concentric_cable()))
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert_array_equal(
+        z_abc,
+        calculate_impedance(ConcentricNeutralCarsonsEquations(concentric_cable())),
+    )
+
+
+def test_batched_and_single_precision_models():
+    cache = ImpedanceCache()
+    lines = [ACBN_geometry_line(ƒ=50), ACBN_geometry_line(ƒ=60)]
+    batched = CarsonsEquations(LineGeometry.from_models(lines))
+    single = CarsonsEquations(ACBN_geometry_line()).astype(float32)
+
+    for _ in range(2):
+        assert_array_equal(
+            cache.calculate_impedance(batched), calculate_impedance(batched)
+        )
+        assert cache.calculate_impedance(single).dtype == "complex64"
+
+    assert (cache.hits, cache.misses) == (2, 2)
+    swept = CarsonsEquations(LineGeometry.from_models(lines[::-1]))
+    assert_array_equal(
+        cache.calculate_impedance(swept), calculate_impedance(batched)[::-1]
+    )
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ImpedanceCache(maxsize=2)
+
+    cache.convert_geometric_model(ACBN_geometry_line())
+    cache.convert_geometric_model(CBN_geometry_line())
+    cache.convert_geometric_model(ACBN_geometry_line())
+    cache.convert_geometric_model(CN_geometry_line())
+
+    assert len(cache) == 2
+    cache.convert_geometric_model(ACBN_geometry_line())
+    cache.convert_geometric_model(CBN_geometry_line())
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_clear():
+    cache = ImpedanceCache()
+    cache.convert_geometric_model(ACBN_geometry_line())
+    cache.convert_geometric_model(ACBN_geometry_line())
+
+    cache.clear()
+
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ImpedanceCache(maxsize=0)
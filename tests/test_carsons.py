@@ -1,12 +1,13 @@
 import pytest
-from numpy import array
-from numpy.testing import assert_array_almost_equal
+from numpy import array, stack
+from numpy.testing import assert_allclose, assert_array_almost_equal
 
 from carsons.carsons import (
     CarsonsEquations,
     calculate_sequence_impedance_matrix,
     calculate_sequence_impedances,
     perform_kron_reduction,
+    perform_kron_reductions,
 )
 from tests.test_overhead_line import ACBN_geometry_line, CN_geometry_line
 
@@ -235,6 +236,33 @@ def test_kron_reduction(z_primitive, expected_z_abc):
     assert (actual_z_abc == expected_z_abc).all()
 
 
+def test_batched_kron_reduction():
+    z_primitives = stack(
+        [z_primitive_three_neutrals(), 2 * z_primitive_three_neutrals()]
+    )
+    expected = [perform_kron_reduction(z_primitive) for z_primitive in z_primitives]
+
+    assert_allclose(perform_kron_reductions(z_primitives), expected)
+
+
+def test_batched_kron_reduction_of_mixed_splits():
+    z_primitives = [
+        z_primitive_one_neutral(),
+        ACBN_line_z_primitive(),
+        z_primitive_no_neutral(),
+        z_primitive_three_neutrals(),
+        ACBN_line_z_primitive()[1:, 1:],
+    ]
+    dimensions = [3, 3, 3, 3, 2]
+    z_abc = perform_kron_reductions(z_primitives, dimensions)
+
+    assert z_abc.shape == (5, 3, 3)
+    for z_primitive, dimension, z in zip(z_primitives, dimensions, z_abc):
+        expected = perform_kron_reduction(z_primitive, dimension)
+        assert_allclose(z[:dimension, :dimension], expected, rtol=1e-12)
+        assert (z[dimension:] == 0).all() and (z[:, dimension:] == 0).all()
+
+
 @pytest.mark.parametrize(
     "z_abc,z_012_expected", [(z_abc_kersting_4_1(), z_012_kersting_4_1())]
 )
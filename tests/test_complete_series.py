@@ -0,0 +1,64 @@
+import pytest
+from numpy import array, geomspace, isfinite
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CompleteCarsonsEquations,
+    calculate_complete_carson_series,
+    calculate_frequency_sweep,
+)
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_z_primitive import FullSeriesCarsonsEquations
+
+
+@pytest.mark.parametrize(
+    "k,θ,P,Q",
+    [
+        # numerical integration of Carson's integral
+        # P + jQ = j ∫ exp(-k cos(θ) u) cos(k sin(θ) u) / (u + sqrt(u² + j)) du
+        (0.05, 0.2, 0.381790380175, 1.817270623379),
+        (0.5, 0.9, 0.324161537518, 0.729238714392),
+        (2.0, 0.0, 0.191243286663, 0.304521418488),
+        (6.0, 1.1, 0.066591482054, 0.057081710040),
+        (12.0, 0.4, 0.049581510306, 0.054121615511),
+        (40.0, 0.8, 0.012326239848, 0.012324284701),
+    ],
+)
+def test_complete_series_matches_carsons_integral(k, θ, P, Q):
+    assert_allclose(calculate_complete_carson_series(k, θ), (P, Q), atol=1e-10)
+
+
+def test_series_and_asymptotic_expansion_agree_where_they_meet():
+    θ = array([0.0, 0.6, 1.2])
+    below = calculate_complete_carson_series(19.999999, θ)
+    above = calculate_complete_carson_series(20.000001, θ)
+
+    assert_allclose(below, above, atol=2e-9)
+
+
+def test_complete_series_agrees_with_truncated_series_at_power_frequency():
+    line = ACBN_geometry_line()
+
+    assert_allclose(
+        CompleteCarsonsEquations(line).build_z_primitive(),
+        FullSeriesCarsonsEquations(line).build_z_primitive(),
+        rtol=1e-5,
+    )
+
+
+def test_frequency_sweep_up_to_megahertz():
+    frequencies = geomspace(1, 1e6, 200)
+    z_abc = calculate_frequency_sweep(
+        CompleteCarsonsEquations(ACBN_geometry_line()), frequencies
+    )
+
+    assert isfinite(z_abc).all()
+    assert_allclose(
+        z_abc[0],
+        calculate_frequency_sweep(
+            FullSeriesCarsonsEquations(ACBN_geometry_line()), [1]
+        )[0],
+        rtol=1e-5,
+    )
+    # the resistance of the earth return grows with frequency
+    assert (z_abc[1:, 0, 0].real > z_abc[:-1, 0, 0].real).all()
@@ -0,0 +1,111 @@
+import pytest
+from numpy import array, zeros
+from numpy.random import default_rng
+from numpy.testing import assert_allclose, assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ModifiedCarsonsEquations,
+    calculate_impedance,
+    convert_conductor_table,
+    convert_geometric_model,
+)
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+
+LINES = {
+    "s3": ACBN_geometry_line(ƒ=50),
+    "s1": ACBN_geometry_line(ƒ=60),
+    "s0": CBN_geometry_line(ƒ=60),
+    "s2": CN_geometry_line(ƒ=50),
+    "s4": CBN_geometry_line(ƒ=50),
+}
+
+
+def conductor_rows():
+    return [
+        (
+            segment,
+            phase,
+            *line.wire_positions[phase],
+            line.geometric_mean_radius[phase],
+            line.resistance[phase],
+            line.frequency,
+        )
+        for segment, line in LINES.items()
+        for phase in line.phases
+    ]
+
+
+def structured_table():
+    rows = conductor_rows()
+    default_rng(0).shuffle(rows)
+    table = zeros(
+        len(rows),
+        dtype=[
+            ("segment", "U2"),
+            ("phase", "U2"),
+            ("x", float),
+            ("y", float),
+            ("gmr", float),
+            ("r", float),
+            ("frequency", float),
+        ],
+    )
+    table[:] = rows
+    return table
+
+
+def test_structured_array():
+    segments, z_abc = convert_conductor_table(structured_table())
+
+    assert_array_equal(segments, ["s0", "s1", "s2", "s3", "s4"])
+    for segment, z in zip(segments, z_abc):
+        assert_allclose(
+            z, convert_geometric_model(LINES[str(segment)]), rtol=1e-12, atol=0
+        )
+
+
+def test_dict_of_columns():
+    table = structured_table()
+    columns = {name: table[name] for name in table.dtype.names}
+    columns["segment"] = array([int(segment[1]) for segment in table["segment"]])
+    del columns["frequency"]
+
+    segments, z_abc = convert_conductor_table(columns, ModifiedCarsonsEquations)
+
+    assert_array_equal(segments, [0, 1, 2, 3, 4])
+    line = CN_geometry_line(ƒ=60)
+    assert_allclose(
+        z_abc[2], calculate_impedance(ModifiedCarsonsEquations(line)), rtol=1e-12
+    )
+    assert_allclose(
+        z_abc[0], calculate_impedance(ModifiedCarsonsEquations(LINES["s0"]))
+    )
+
+
+def test_invalid_tables():
+    table = structured_table()
+    duplicated = table.copy()
+    duplicated["phase"][duplicated["segment"] == "s2"] = "N"
+    with pytest.raises(ValueError, match="only appear once"):
+        convert_conductor_table(duplicated)
+
+    mixed_frequency = table.copy()
+    mixed_frequency["frequency"][0] += 1
+    with pytest.raises(ValueError, match="frequency"):
+        convert_conductor_table(mixed_frequency)
+
+
+def test_earth_resistivity_column():
+    table = structured_table()
+    columns = {name: table[name] for name in table.dtype.names}
+    columns["earth_resistivity"] = zeros(len(table)) + CarsonsEquations.ρ * 10
+
+    _, z_abc = convert_conductor_table(columns)
+    _, z_default = convert_conductor_table(table)
+
+    assert (z_abc[:, 2, 2].imag > z_default[:, 2, 2].imag).all()
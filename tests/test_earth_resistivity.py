@@ -0,0 +1,62 @@
+import pytest
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+    calculate_resistivity_sweep,
+)
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_z_primitive import FullSeriesCarsonsEquations, concentric_cable
+
+RESISTIVITIES = [10, 30, 100, 300, 1_000, 3_000, 10_000]
+
+
+def with_resistivity(line, ρ):
+    model = line()
+    model.earth_resistivity = ρ
+    return model
+
+
+def test_resistivity_is_read_from_the_model():
+    class HighResistivityCarsonsEquations(CarsonsEquations):
+        ρ = 1_000
+
+    assert_allclose(
+        calculate_impedance(
+            CarsonsEquations(with_resistivity(ACBN_geometry_line, 1_000))
+        ),
+        calculate_impedance(HighResistivityCarsonsEquations(ACBN_geometry_line())),
+    )
+    assert CarsonsEquations(ACBN_geometry_line()).ρ == 100
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (FullSeriesCarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+    ],
+)
+def test_sweep_matches_models_built_for_each_resistivity(equations, line):
+    model = equations(line())
+    z_abc = calculate_resistivity_sweep(model, RESISTIVITIES)
+
+    assert z_abc.shape == (len(RESISTIVITIES), 3, 3)
+    for ρ, z in zip(RESISTIVITIES, z_abc):
+        expected = calculate_impedance(equations(with_resistivity(line, ρ)))
+        assert_allclose(z, expected, rtol=1e-10)
+
+
+def test_batch_of_models_with_different_resistivities():
+    models = [
+        FullSeriesCarsonsEquations(with_resistivity(ACBN_geometry_line, ρ))
+        for ρ in RESISTIVITIES
+    ]
+    z_abc = calculate_impedances(models)
+
+    for model, z in zip(models, z_abc):
+        assert_allclose(z, calculate_impedance(model), rtol=1e-10)
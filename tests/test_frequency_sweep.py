@@ -0,0 +1,81 @@
+import pytest
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    calculate_frequency_sweep,
+    calculate_impedance,
+    calculate_resistivity_sweep,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_z_primitive import (
+    FullSeriesCarsonsEquations,
+    concentric_cable,
+    triplex_secondary,
+)
+
+HARMONICS = [60 * harmonic for harmonic in range(1, 51)]
+
+
+def at_frequency(line, frequency):
+    model = line()
+    model.frequency = frequency
+    return model
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (CarsonsEquations, CBN_geometry_line),
+        (FullSeriesCarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (MultiConductorCarsonsEquations, triplex_secondary),
+    ],
+)
+def test_sweep_matches_models_built_at_each_frequency(equations, line):
+    model = equations(line())
+    z_abc = calculate_frequency_sweep(model, HARMONICS)
+
+    assert z_abc.shape == (len(HARMONICS), model.dimension, model.dimension)
+    for frequency, z in zip(HARMONICS, z_abc):
+        expected = calculate_impedance(equations(at_frequency(line, frequency)))
+        assert_allclose(z, expected, rtol=1e-10)
+
+
+def test_sweep_leaves_the_model_frequency_unchanged():
+    model = CarsonsEquations(ACBN_geometry_line(ƒ=50))
+    calculate_frequency_sweep(model, HARMONICS)
+
+    assert model.ƒ == 50
+    assert_allclose(
+        calculate_impedance(model),
+        calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50))),
+    )
+
+
+class BACN_geometry_line(ACBN_geometry_line):
+    @property
+    def wire_positions(self):
+        return {**super().wire_positions, "A": (0, 8.5344), "B": (0.762, 8.5344)}
+
+
+@pytest.mark.parametrize(
+    "sweep,values",
+    [
+        (calculate_frequency_sweep, HARMONICS[:5]),
+        (calculate_resistivity_sweep, [10, 100, 1_000]),
+    ],
+)
+def test_sweep_of_a_batched_model(sweep, values):
+    lines = [ACBN_geometry_line(), BACN_geometry_line()]
+    batch = CarsonsEquations(LineGeometry.from_models(lines))
+    z_abc = sweep(batch, values)
+
+    assert z_abc.shape == (len(values), 2, 3, 3)
+    for index, line in enumerate(lines):
+        expected = sweep(CarsonsEquations(line), values)
+        assert_allclose(z_abc[:, index], expected, rtol=1e-12)
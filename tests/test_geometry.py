@@ -0,0 +1,113 @@
+import pytest
+from numpy import array
+from numpy.testing import assert_allclose, assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedance,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import concentric_cable, quadruplex_cable
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (CarsonsEquations, CBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (TapeShieldedCableCarsonsEquations, lambda: AN_Tape_Shielded_Cable(3)),
+        (MultiConductorCarsonsEquations, quadruplex_cable),
+    ],
+)
+def test_equations_accept_line_geometry(equations, line):
+    model = line()
+    geometry = LineGeometry.from_model(model)
+
+    assert_allclose(
+        calculate_impedance(equations(geometry)),
+        calculate_impedance(equations(model)),
+        rtol=1e-12,
+        atol=0,
+    )
+
+    batch = LineGeometry.from_models([model, model])
+    assert batch.batch_shape == (2,)
+    z_abc = calculate_impedance(equations(batch))
+    assert z_abc.shape == (2, 3, 3)
+    assert_allclose(z_abc[1], calculate_impedance(equations(model)), rtol=1e-12)
+
+
+def test_batch_broadcasts_shared_conductor_values():
+    geometry = LineGeometry(
+        ["A", "B", "C", "N"],
+        x=[[0.762, 0.0, 2.1336, 1.2192], [0.0, 0.762, 2.1336, 1.2192]],
+        y=[8.5344, 8.5344, 8.5344, 7.3152],
+        gmr=[0.00947938, 0.00947938, 0.00947938, 0.00248107],
+        r=[0.000115575, 0.000115575, 0.000115575, 0.000367852],
+        frequency=[60, 50],
+    )
+    z_abc = calculate_impedance(CarsonsEquations(geometry))
+
+    assert_allclose(
+        z_abc[0], calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=60)))
+    )
+    second = LineGeometry(
+        geometry.labels, geometry.x[1], geometry.y, geometry.gmr, geometry.r, 50
+    )
+    assert_allclose(z_abc[1], calculate_impedance(CarsonsEquations(second)))
+
+
+def test_equation_resistivity_applies_by_default():
+    class WetCarsonsEquations(CarsonsEquations):
+        ρ = 10
+
+    line = ACBN_geometry_line()
+    geometry = LineGeometry.from_model(line)
+
+    assert not hasattr(geometry, "earth_resistivity")
+    assert_allclose(
+        calculate_impedance(WetCarsonsEquations(geometry)),
+        calculate_impedance(WetCarsonsEquations(line)),
+        rtol=1e-12,
+    )
+    assert not hasattr(LineGeometry.from_models([line, line]), "earth_resistivity")
+
+    dry = ACBN_geometry_line()
+    dry.earth_resistivity = 1_000  # type: ignore[attr-defined]
+    with pytest.raises(ValueError, match="earth_resistivity"):
+        LineGeometry.from_models([line, dry])
+
+
+def test_masks_and_model_interface():
+    geometry = LineGeometry.from_model(ACBN_geometry_line())
+
+    assert_array_equal(geometry.is_neutral, [False, False, False, True])
+    assert_array_equal(geometry.phase_indices, [0, 1, 2])
+    assert_array_equal(geometry.neutral_indices, [3])
+    assert geometry.wire_positions["N"] == (1.2192, 7.3152)
+    assert geometry.resistance["N"] == 0.000367852
+
+
+def test_geometry_is_a_read_only_snapshot():
+    x = array([0.0, 1.0])
+    geometry = LineGeometry(["A", "N"], x, [8, 7], [0.01, 0.01], [1e-4, 1e-4])
+    x[0] = 5.0
+
+    assert geometry.x[0] == 0.0
+    with pytest.raises(ValueError):
+        geometry.x[0] = 5.0
+
+
+def test_invalid_geometries():
+    with pytest.raises(ValueError, match="unique"):
+        LineGeometry(["A", "A"], [0, 1], [8, 8], [0.01, 0.01], [1e-4, 1e-4])
+    with pytest.raises(ValueError, match="one value per conductor"):
+        LineGeometry(["A", "N"], [0, 1, 2], [8, 8], [0.01, 0.01], [1e-4, 1e-4])
+    with pytest.raises(AttributeError):
+        LineGeometry(["A"], [0], [8], [0.01], [1e-4]).neutral_strand_gmr
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+import carsons
+from carsons.carsons import CarsonsEquations
+
+
+def test_names_are_loaded_on_first_use():
+    assert carsons.CarsonsEquations is CarsonsEquations
+    assert "KronReduction" in dir(carsons)
+    assert all(getattr(carsons, name) for name in carsons.__all__)
+
+    with pytest.raises(AttributeError):
+        carsons.missing
+
+
+def test_importing_the_package_loads_no_numpy():
+    code = "import sys, carsons; print('numpy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_submodules_are_loaded_on_first_use():
+    code = (
+        "import carsons; "
+        "print(carsons.carsons.perform_kron_reduction.__name__, carsons.kron.__name__)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.split() == ["perform_kron_reduction", "carsons.kron"]
+    assert "parallel" in dir(carsons)
+
+
+def test_version_is_read_once():
+    assert carsons.get_version() is carsons.get_version()
+
+
+def test_unreadable_version(monkeypatch):
+    monkeypatch.setattr("pkgutil.get_data", lambda package, resource: None)
+    carsons.get_version.cache_clear()
+    try:
+        with pytest.raises(RuntimeError, match="VERSION"):
+            carsons.get_version()
+    finally:
+        carsons.get_version.cache_clear()
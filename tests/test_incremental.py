@@ -0,0 +1,89 @@
+import pytest
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    IncrementalImpedance,
+    LineGeometry,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    calculate_impedance,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_z_primitive import (
+    concentric_cable,
+    dual_neutral_line,
+    triplex_secondary,
+)
+
+UPDATES = [
+    {"position": (0.3, 9.1)},
+    {"gmr": 0.0121},
+    {"resistance": 0.000201},
+    {"position": (1.7, 7.9), "gmr": 0.0031},
+]
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (CarsonsEquations, CBN_geometry_line),
+        (CarsonsEquations, dual_neutral_line),
+        (ModifiedCarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (MultiConductorCarsonsEquations, triplex_secondary),
+    ],
+)
+def test_updates_match_full_evaluation(equations, line):
+    incremental = IncrementalImpedance(equations(line()))
+    expected = equations(line())
+
+    for step, conductor in enumerate(expected.present_conductors * 2):
+        values = dict(UPDATES[step % len(UPDATES)])
+        if "position" in values:
+            x, y = values["position"]
+            values["position"] = (x + 0.25 * step, y)
+        z_abc = incremental.update(conductor, **values)
+
+        if "position" in values:
+            expected.phase_positions = {
+                **expected.phase_positions,
+                conductor: values["position"],
+            }
+        expected.gmr = {
+            **expected.gmr,
+            conductor: values.get("gmr", expected.gmr[conductor]),
+        }
+        expected.r = {
+            **expected.r,
+            conductor: values.get("resistance", expected.r[conductor]),
+        }
+        expected.forget_geometry()
+
+        assert_allclose(z_abc, calculate_impedance(expected), rtol=1e-12, atol=0)
+        assert_allclose(
+            incremental.z_primitive, expected.build_z_primitive(), rtol=1e-12, atol=0
+        )
+
+
+def test_model_is_not_modified():
+    model = CarsonsEquations(LineGeometry.from_model(ACBN_geometry_line()))
+    z_abc = calculate_impedance(model)
+
+    incremental = IncrementalImpedance(model)
+    incremental.update("A", position=(0.0, 10.0))
+
+    assert_allclose(calculate_impedance(model), z_abc, rtol=0, atol=0)
+    assert model.phase_positions["A"] != (0.0, 10.0)
+
+
+def test_invalid_updates():
+    incremental = IncrementalImpedance(CarsonsEquations(CBN_geometry_line()))
+    with pytest.raises(ValueError):
+        incremental.update("A", position=(0.0, 10.0))
+
+    batched = CarsonsEquations(ACBN_geometry_line()).at_frequencies([50, 60])
+    with pytest.raises(ValueError):
+        IncrementalImpedance(batched)
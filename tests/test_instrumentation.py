@@ -0,0 +1,70 @@
+import pytest
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    StageStatistics,
+    calculate_impedance,
+    calculate_impedances,
+    instrument,
+)
+from carsons.instrumentation import Stage
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_z_primitive import concentric_cable
+
+
+def test_stages_reach_the_sink():
+    stages: list[Stage] = []
+    with instrument(stages.append):
+        calculate_impedance(CarsonsEquations(ACBN_geometry_line()))
+
+    assert [stage.name for stage in stages] == [
+        "CarsonsEquations.__init__",
+        "CarsonsEquations.compute_P_and_Q_matrix",
+        "CarsonsEquations.build_z_primitive",
+        "perform_kron_reduction",
+    ]
+    assert stages[2].equations == "CarsonsEquations"
+    assert stages[2].shape == (4, 4)
+    assert stages[3].equations is None
+    assert all(stage.seconds > 0 for stage in stages)
+
+
+def test_statistics_per_equation_class():
+    with instrument() as statistics:
+        calculate_impedances(
+            ConcentricNeutralCarsonsEquations(concentric_cable()) for _ in range(3)
+        )
+
+    summary = {(row["stage"], row["equations"]): row for row in statistics.summary()}
+    init = summary["CarsonsEquations.__init__", "ConcentricNeutralCarsonsEquations"]
+    build = summary[
+        "CarsonsEquations.build_z_primitive", "ConcentricNeutralCarsonsEquations"
+    ]
+
+    assert init["calls"] == 3
+    assert build["calls"] == 1
+    assert build["shapes"] == {(3, 6, 6): 1}
+    assert summary["perform_kron_reductions", None]["shapes"] == {(3, 3, 3): 1}
+
+
+def test_nothing_is_recorded_outside_the_block():
+    statistics = StageStatistics()
+    with instrument(statistics):
+        pass
+    calculate_impedance(CarsonsEquations(ACBN_geometry_line()))
+
+    assert statistics.summary() == []
+
+
+def test_nested_blocks_and_errors():
+    outer, inner = StageStatistics(), StageStatistics()
+    with instrument(outer):
+        with pytest.raises(ValueError):
+            with instrument(inner):
+                CarsonsEquations(ACBN_geometry_line())
+                raise ValueError
+        CarsonsEquations(ACBN_geometry_line())
+
+    assert sum(inner.calls.values()) == 1
+    assert sum(outer.calls.values()) == 2
@@ -0,0 +1,148 @@
+import pytest
+from numpy import array, ones
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    CompleteCarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_complete_carson_series,
+    calculate_impedance,
+    calculate_impedance_derivatives,
+    perform_kron_reduction_derivative,
+)
+from carsons.carsons import (
+    calculate_carson_series,
+    calculate_carson_series_derivatives,
+    calculate_complete_carson_series_derivatives,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import concentric_cable, triplex_secondary
+
+STEP = 1e-7
+
+
+def perturbed(equations, line, name, conductor, step):
+    model = equations(line)
+    if name == "x":
+        x, y = model.phase_positions[conductor]
+        model.phase_positions = {**model.phase_positions, conductor: (x + step, y)}
+    elif name == "y":
+        x, y = model.phase_positions[conductor]
+        model.phase_positions = {**model.phase_positions, conductor: (x, y + step)}
+    elif name == "ρ":
+        model.ρ += step * 1e4
+    else:
+        values = getattr(model, name)
+        setattr(model, name, {**values, conductor: values[conductor] + step})
+    model.forget_geometry()
+    return model
+
+
+def finite_difference(equations, line, name, conductor, evaluate):
+    forward = evaluate(perturbed(equations, line, name, conductor, STEP))
+    backward = evaluate(perturbed(equations, line, name, conductor, -STEP))
+    step = STEP * 1e4 if name == "ρ" else STEP
+    return (forward - backward) / (2 * step)
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line()),
+        (CarsonsEquations, CBN_geometry_line(ƒ=50)),
+        (ModifiedCarsonsEquations, ACBN_geometry_line()),
+        (MultiConductorCarsonsEquations, triplex_secondary()),
+        (CompleteCarsonsEquations, ACBN_geometry_line()),
+        (CompleteCarsonsEquations, ACBN_geometry_line(ƒ=1e6)),
+        (ConcentricNeutralCarsonsEquations, concentric_cable()),
+        (TapeShieldedCableCarsonsEquations, AN_Tape_Shielded_Cable(3)),
+    ],
+)
+def test_derivatives_match_finite_differences(equations, line):
+    model = equations(line)
+    dz_primitive = model.build_z_primitive_derivatives()
+    dz_abc = calculate_impedance_derivatives(model)
+
+    for name in ("x", "y", "gmr", "r", "ρ"):
+        for k, conductor in enumerate(model.conductors):
+            if conductor not in model.phases:
+                assert not dz_primitive[name][k].any()
+                continue
+
+            analytic = dz_primitive[name] if name == "ρ" else dz_primitive[name][k]
+            expected = finite_difference(
+                equations, line, name, conductor, lambda m: m.build_z_primitive()
+            )
+            assert_allclose(analytic, expected, rtol=1e-5, atol=1e-9)
+
+            analytic = dz_abc[name] if name == "ρ" else dz_abc[name][k]
+            expected = finite_difference(
+                equations, line, name, conductor, calculate_impedance
+            )
+            assert_allclose(analytic, expected, rtol=1e-5, atol=1e-9)
+
+
+@pytest.mark.parametrize("terms", [(1, 1), (2, 3), (4, 4), (6, 7)])
+def test_series_derivatives(terms):
+    k, θ = array([0.01, 0.3, 1.2]), array([0.1, 0.7, 1.3])
+    step = 1e-6
+    P_k, P_θ, Q_k, Q_θ = calculate_carson_series_derivatives(k, θ, *terms)
+
+    P_forward, Q_forward = calculate_carson_series(k + step, θ, *terms)
+    P_backward, Q_backward = calculate_carson_series(k - step, θ, *terms)
+    assert_allclose(P_k, (P_forward - P_backward) / (2 * step), atol=1e-8)
+    assert_allclose(Q_k, (Q_forward - Q_backward) / (2 * step), atol=1e-8)
+
+    P_forward, Q_forward = calculate_carson_series(k, θ + step, *terms)
+    P_backward, Q_backward = calculate_carson_series(k, θ - step, *terms)
+    assert_allclose(P_θ, (P_forward - P_backward) / (2 * step), atol=1e-8)
+    assert_allclose(Q_θ, (Q_forward - Q_backward) / (2 * step), atol=1e-8)
+
+
+def test_complete_series_derivatives():
+    # on both sides of the switch to the asymptotic series at k = 20, where
+    # the rounding errors of the series call for larger steps
+    k = array([0.01, 1.2, 8.0, 19.0, 25.0, 80.0])
+    θ = array([0.1, 0.7, 1.3, 0, 0.4, 1.1])
+    k_step, θ_step = 1e-3 * k, 1e-3
+    P_k, P_θ, Q_k, Q_θ = calculate_complete_carson_series_derivatives(k, θ)
+
+    P_forward, Q_forward = calculate_complete_carson_series(k + k_step, θ)
+    P_backward, Q_backward = calculate_complete_carson_series(k - k_step, θ)
+    assert_allclose(P_k, (P_forward - P_backward) / (2 * k_step), rtol=1e-4)
+    assert_allclose(Q_k, (Q_forward - Q_backward) / (2 * k_step), rtol=1e-4)
+
+    P_forward, Q_forward = calculate_complete_carson_series(k, θ + θ_step)
+    P_backward, Q_backward = calculate_complete_carson_series(k, θ - θ_step)
+    assert_allclose(P_θ, (P_forward - P_backward) / (2 * θ_step), atol=1e-6)
+    assert_allclose(Q_θ, (Q_forward - Q_backward) / (2 * θ_step), atol=1e-6)
+
+
+def test_batched_models():
+    lines = [ACBN_geometry_line(ƒ=50), ACBN_geometry_line(ƒ=60)]
+    batched = calculate_impedance_derivatives(
+        CarsonsEquations(LineGeometry.from_models(lines))
+    )
+
+    assert batched["x"].shape == (4, 2, 3, 3)
+    assert batched["ρ"].shape == (2, 3, 3)
+    for index, line in enumerate(lines):
+        single = calculate_impedance_derivatives(CarsonsEquations(line))
+        assert_allclose(batched["ρ"][index], single["ρ"], rtol=1e-12)
+        for name in ("x", "y", "gmr", "r"):
+            assert_allclose(batched[name][:, index], single[name], rtol=1e-12)
+
+
+def test_kron_reduction_derivative_without_neutrals():
+    z_primitive = ones((3, 3), dtype=complex)
+    dz_primitive = ones((4, 3, 3), dtype=complex)
+
+    assert_allclose(
+        perform_kron_reduction_derivative(z_primitive, dz_primitive), dz_primitive
+    )
@@ -0,0 +1,61 @@
+from numpy import array, stack
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    KronReduction,
+)
+from carsons.carsons import perform_kron_reduction
+from tests.test_carsons import z_primitive_no_neutral, z_primitive_three_neutrals
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_z_primitive import concentric_cable
+
+
+def test_matches_perform_kron_reduction():
+    for z_primitive in (z_primitive_three_neutrals(), z_primitive_no_neutral()):
+        reduction = KronReduction(z_primitive)
+        assert_allclose(reduction.z_abc, perform_kron_reduction(z_primitive))
+
+
+def test_stacked_frequencies():
+    model = CarsonsEquations(ACBN_geometry_line())
+    z_primitives = model.at_frequencies([50, 60, 400]).build_z_primitive()
+    reduction = KronReduction(z_primitives)
+
+    assert reduction.current_division_matrix.shape == (3, 1, 3)
+    for z_primitive, z_abc in zip(z_primitives, reduction.z_abc):
+        assert_allclose(z_abc, perform_kron_reduction(z_primitive), rtol=1e-12)
+
+
+def test_neutral_currents():
+    model = ConcentricNeutralCarsonsEquations(concentric_cable())
+    z_primitive = model.build_z_primitive()
+    reduction = KronReduction(z_primitive)
+
+    I_abc = array([100, 100 * (-0.5 - 0.866j), 100 * (-0.5 + 0.866j)])
+    I_n = reduction.calculate_neutral_currents(I_abc)
+
+    # grounded at both ends, the neutrals have no voltage drop
+    assert_allclose(
+        z_primitive[3:, :3] @ I_abc + z_primitive[3:, 3:] @ I_n, 0, atol=1e-9
+    )
+    assert_allclose(
+        reduction.calculate_neutral_currents(stack([I_abc, 2 * I_abc], axis=1)),
+        stack([I_n, 2 * I_n], axis=1),
+    )
+
+
+def test_reduce_other_phase_blocks():
+    z_primitive = z_primitive_three_neutrals()
+    reduction = KronReduction(z_primitive)
+    swapped = z_primitive[[1, 0, 2, 3, 4, 5]][:, [1, 0, 2, 3, 4, 5]]
+
+    assert_allclose(
+        reduction.reduce(swapped[:3, :3], swapped[:3, 3:]),
+        perform_kron_reduction(swapped),
+    )
+    assert_allclose(
+        reduction.solve(z_primitive[3:, 0]),
+        reduction.solve(z_primitive[3:, :3])[:, 0],
+    )
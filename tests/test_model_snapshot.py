@@ -0,0 +1,75 @@
+from copy import deepcopy
+from types import SimpleNamespace
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+)
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import concentric_cable, quadruplex_cable
+
+
+def tape_shielded_cable():
+    # unlike AN_Tape_Shielded_Cable, returns the same objects on every access
+    cable = AN_Tape_Shielded_Cable(3)
+    return SimpleNamespace(
+        phases=cable.phases,
+        resistance=cable.resistance,
+        geometric_mean_radius=cable.geometric_mean_radius,
+        wire_positions=cable.wire_positions,
+        tape_shield_outer_diameter=cable.tape_shield_outer_diameter,
+        tape_shield_thickness=cable.tape_shield_thickness,
+    )
+
+
+def snapshot(model):
+    return {
+        name: deepcopy(getattr(model, name))
+        for name in dir(model)
+        if not name.startswith("__")
+    }
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (TapeShieldedCableCarsonsEquations, tape_shielded_cable),
+        (MultiConductorCarsonsEquations, quadruplex_cable),
+    ],
+)
+def test_repeated_construction_is_idempotent(equations, line):
+    model = line()
+    before = snapshot(model)
+
+    first = equations(model)
+    second = equations(model)
+
+    assert snapshot(model) == before
+    assert first.conductors == second.conductors
+    assert_array_equal(first.build_z_primitive(), second.build_z_primitive())
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (TapeShieldedCableCarsonsEquations, tape_shielded_cable),
+        (MultiConductorCarsonsEquations, quadruplex_cable),
+    ],
+)
+def test_per_conductor_values_are_read_only(equations, line):
+    model = equations(line())
+
+    for name in model.per_conductor_attributes:
+        values = getattr(model, name)
+        with pytest.raises(TypeError):
+            values["A"] = 0.0  # type: ignore[index]
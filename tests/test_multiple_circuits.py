@@ -0,0 +1,159 @@
+from numpy import arange, array, delete, repeat, tile
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    ImpedanceCache,
+    LineGeometry,
+    ModifiedCarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+    calculate_sequence_impedance_matrix,
+    convert_conductor_table,
+)
+from carsons.parallel import ImpedanceExecutor
+from tests.test_overhead_line import ACBN_geometry_line, CBN_geometry_line
+from tests.test_z_primitive import elementwise_z_primitive
+
+
+class CircuitCarsonsEquations(CarsonsEquations):
+    phase_labels = None
+
+
+def circuits_line(circuits=2):
+    """`circuits` three phase circuits on shared structures 1.5m apart,
+    over a neutral, e.g. the phases A1, B1, C1, A2, B2, C2 and N."""
+    labels = [
+        f"{phase}{circuit}" for circuit in range(1, circuits + 1) for phase in "ABC"
+    ]
+    x = 1.5 * arange(len(labels)) + 0.3 * repeat(arange(circuits), 3)
+    y = 10.0 + 0.4 * tile([0, 1, 2], circuits)
+    return LineGeometry(
+        [*labels, "N"],
+        x=[*x, x.mean()],
+        y=[*y, 8.0],
+        gmr=[0.00947938] * len(labels) + [0.00248107],
+        r=[0.000115575] * len(labels) + [0.000367852],
+    )
+
+
+def test_double_circuit():
+    model = CircuitCarsonsEquations(circuits_line())
+    z_primitive = model.build_z_primitive()
+    z_abc = calculate_impedance(model)
+
+    assert model.conductors == ["A1", "B1", "C1", "A2", "B2", "C2", "N"]
+    assert z_abc.shape == (6, 6)
+    assert_allclose(z_primitive, elementwise_z_primitive(model), rtol=1e-12)
+    # the circuits are coupled through the earth and the shared neutral
+    assert (abs(z_abc[:3, 3:]) > 0).all()
+    assert_allclose(z_abc, z_abc.T)
+
+    z_012 = calculate_sequence_impedance_matrix(z_abc, circuits=2)
+    # the zero sequences of the circuits are strongly coupled, unlike
+    # their positive sequences
+    assert abs(z_012[0, 3]) > 10 * abs(z_012[1, 4])
+
+
+def test_reduced_to_the_phases_present():
+    padded = calculate_impedance(CarsonsEquations(CBN_geometry_line()))
+    unpadded = calculate_impedance(CircuitCarsonsEquations(CBN_geometry_line()))
+
+    assert unpadded.shape == (2, 2)
+    # in the order of the model's phases, B then C
+    assert_allclose(unpadded, padded[1:, 1:])
+
+
+def test_fixed_labels_are_padded():
+    class DoubleCircuitCarsonsEquations(CarsonsEquations):
+        phase_labels = ("A1", "B1", "C1", "A2", "B2", "C2")
+
+    line = circuits_line()
+    phases = [phase for phase in line.phases if phase != "B2"]
+    missing_phase = LineGeometry(
+        line.labels, line.x, line.y, line.gmr, line.r, phases=phases
+    )
+
+    z_abc = calculate_impedance(DoubleCircuitCarsonsEquations(missing_phase))
+
+    assert z_abc.shape == (6, 6)
+    assert (z_abc[4] == 0).all() and (z_abc[:, 4] == 0).all()
+    expected = calculate_impedance(CircuitCarsonsEquations(missing_phase))
+    assert_allclose(delete(delete(z_abc, 4, 0), 4, 1), expected)
+
+
+def test_labels_read_from_the_line_model():
+    line = CBN_geometry_line()
+    line.phase_labels = None  # type: ignore[attr-defined]
+
+    assert calculate_impedance(ModifiedCarsonsEquations(line)).shape == (2, 2)
+
+
+def test_batches_of_many_circuits():
+    line = circuits_line(circuits=4)
+    segments = 50
+    x = line.x + 0.01 * arange(segments)[:, None]
+    batch = LineGeometry(line.labels, x, line.y, line.gmr, line.r)
+
+    z_abc = calculate_impedance(CircuitCarsonsEquations(batch))
+
+    assert z_abc.shape == (segments, 12, 12)
+    for index in (0, segments - 1):
+        single = LineGeometry(line.labels, x[index], line.y, line.gmr, line.r)
+        assert_allclose(
+            z_abc[index], calculate_impedance(CircuitCarsonsEquations(single))
+        )
+
+
+def test_mixed_dimensions_are_padded():
+    models = [
+        CircuitCarsonsEquations(circuits_line()),
+        CircuitCarsonsEquations(ACBN_geometry_line()),
+        CircuitCarsonsEquations(CBN_geometry_line()),
+    ]
+    z_abc = calculate_impedances(models)
+
+    assert z_abc.shape == (3, 6, 6)
+    for model, z in zip(models, z_abc):
+        d = model.dimension
+        assert_allclose(z[:d, :d], calculate_impedance(model), rtol=1e-12)
+        assert (z[d:] == 0).all()
+
+    with ImpedanceExecutor(max_workers=2, chunk_size=1) as executor:
+        lines = [circuits_line(), ACBN_geometry_line(), CBN_geometry_line()]
+        assert_allclose(
+            executor.calculate_impedances(lines, CircuitCarsonsEquations), z_abc
+        )
+
+
+def test_conductor_table():
+    line = circuits_line()
+    table = {
+        "segment": array(["s"] * len(line.labels)),
+        "phase": array(line.labels),
+        "x": line.x,
+        "y": line.y,
+        "gmr": line.gmr,
+        "r": line.r,
+    }
+    _, z_abc = convert_conductor_table(table, CircuitCarsonsEquations)
+
+    # the table's labels are sorted, which keeps each phase's circuits together
+    order = [0, 3, 1, 4, 2, 5]
+    expected = calculate_impedance(CircuitCarsonsEquations(line))
+    assert_allclose(z_abc[0], expected[order][:, order])
+
+
+def test_cache_keys_on_the_layout():
+    cache = ImpedanceCache()
+    model = CarsonsEquations(CBN_geometry_line())
+    padded = cache.calculate_impedance(model)
+    model.phase_labels = None
+    unpadded = cache.calculate_impedance(model)
+
+    line = CBN_geometry_line()
+    line.phase_labels = None  # type: ignore[attr-defined]
+    converted = cache.convert_geometric_model(line)
+
+    assert padded.shape == (3, 3)
+    assert unpadded.shape == converted.shape == (2, 2)
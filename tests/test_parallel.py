@@ -0,0 +1,68 @@
+import pytest
+from numpy.testing import assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    calculate_impedances,
+)
+from carsons.parallel import ImpedanceExecutor
+from carsons.parallel import calculate_impedances as calculate_impedances_parallel
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_z_primitive import concentric_cable, triplex_secondary
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ImpedanceExecutor(max_workers=2, chunk_size=3) as executor:
+        yield executor
+
+
+def test_results_are_in_input_order(executor):
+    lines = [
+        ACBN_geometry_line(ƒ=50 + index) if index % 3 else CN_geometry_line()
+        for index in range(20)
+    ]
+    lines[7] = LineGeometry.from_model(CBN_geometry_line())
+
+    assert_array_equal(
+        executor.calculate_impedances(lines),
+        calculate_impedances(CarsonsEquations(line) for line in lines),
+    )
+
+
+def test_cable_equations(executor):
+    lines = [concentric_cable() for _ in range(7)]
+
+    assert_array_equal(
+        executor.calculate_impedances(lines, ConcentricNeutralCarsonsEquations),
+        calculate_impedances(ConcentricNeutralCarsonsEquations(l) for l in lines),
+    )
+
+
+def test_secondaries_keep_their_dimension(executor):
+    lines = [triplex_secondary() for _ in range(5)]
+    z_abc = executor.calculate_impedances(lines, MultiConductorCarsonsEquations)
+
+    assert z_abc.shape == (5, 2, 2)
+
+
+def test_small_batches_run_in_process():
+    lines = [ACBN_geometry_line(), CBN_geometry_line()]
+    z_abc = calculate_impedances_parallel(lines, max_workers=4, chunk_size=10)
+
+    assert_array_equal(
+        z_abc, calculate_impedances(CarsonsEquations(line) for line in lines)
+    )
+    assert calculate_impedances_parallel([]).shape == (0, 3, 3)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        ImpedanceExecutor(chunk_size=0)
@@ -0,0 +1,197 @@
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from numpy import float32
+from numpy.testing import assert_allclose, assert_array_equal
+
+from carsons import (
+    CarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    PersistentImpedanceCache,
+    calculate_impedance,
+    calculate_impedances,
+    convert_geometric_model,
+)
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_z_primitive import concentric_cable, triplex_secondary
+
+
+def models():
+    return [
+        CarsonsEquations(ACBN_geometry_line(ƒ=50)),
+        CarsonsEquations(CBN_geometry_line()),
+        MultiConductorCarsonsEquations(triplex_secondary()),
+        ConcentricNeutralCarsonsEquations(concentric_cable()),
+        CarsonsEquations(ACBN_geometry_line(ƒ=50)),
+    ]
+
+
+def test_entries_outlive_the_cache(tmp_path):
+    path = tmp_path / "impedances.sqlite"
+    with PersistentImpedanceCache(path) as cache:
+        first = cache.calculate_impedances(models())
+        assert (cache.hits, cache.misses) == (1, 4)
+        assert len(cache) == 4
+
+    with PersistentImpedanceCache(path) as cache:
+        second = cache.calculate_impedances(models())
+        assert (cache.hits, cache.misses) == (5, 0)
+
+    assert_array_equal(first, calculate_impedances(models()))
+    assert_array_equal(second, first)
+
+
+def test_single_models(tmp_path):
+    with PersistentImpedanceCache(tmp_path / "impedances.sqlite") as cache:
+        for _ in range(2):
+            assert_array_equal(
+                cache.convert_geometric_model(CN_geometry_line()),
+                convert_geometric_model(CN_geometry_line()),
+            )
+            z_abc = cache.calculate_impedance(
+                MultiConductorCarsonsEquations(triplex_secondary())
+            )
+            assert z_abc.shape == (2, 2)
+
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert_array_equal(
+            cache.calculate_impedances([CarsonsEquations(CN_geometry_line())]),
+            [convert_geometric_model(CN_geometry_line())],
+        )
+
+
+def test_keys_include_the_inputs_and_precision(tmp_path):
+    with PersistentImpedanceCache(tmp_path / "impedances.sqlite") as cache:
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50)))
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=60)))
+        single = cache.calculate_impedance(
+            CarsonsEquations(ACBN_geometry_line(ƒ=60)).astype(float32)
+        )
+
+        assert cache.misses == 3
+        assert single.dtype == "complex64"
+
+
+def test_batched_models(tmp_path):
+    lines = [ACBN_geometry_line(ƒ=50), ACBN_geometry_line(ƒ=60)]
+    model = CarsonsEquations(LineGeometry.from_models(lines))
+    path = tmp_path / "impedances.sqlite"
+
+    for _ in range(2):
+        with PersistentImpedanceCache(path) as cache:
+            z_abc = cache.calculate_impedance(model)
+            assert_array_equal(z_abc, calculate_impedance(model))
+            # the batch path stacks models into one (batch, n, n) array
+            with pytest.raises(ValueError, match="calculate_impedance"):
+                cache.calculate_impedances([model])
+    assert z_abc.shape == (2, 3, 3)
+    assert cache.hits == 1
+
+
+def test_files_of_another_layout_are_emptied(tmp_path):
+    path = tmp_path / "impedances.sqlite"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE impedances (key BLOB, dimension INTEGER)")
+        connection.execute("INSERT INTO impedances VALUES (x'00', 2)")
+    connection.close()
+
+    with PersistentImpedanceCache(path) as cache:
+        assert len(cache) == 0
+        cache.calculate_impedance(CarsonsEquations(CN_geometry_line()))
+        cache.calculate_impedance(CarsonsEquations(CN_geometry_line()))
+        assert cache.hits == 1
+
+
+def test_other_versions_are_removed(tmp_path, monkeypatch):
+    path = tmp_path / "impedances.sqlite"
+    with PersistentImpedanceCache(path) as cache:
+        cache.calculate_impedances(models())
+
+    monkeypatch.setattr("carsons.cache.get_version", lambda: "0.0.1")
+    with PersistentImpedanceCache(path) as cache:
+        assert len(cache) == 0
+        cache.calculate_impedances(models())
+        assert cache.misses == 4
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    with PersistentImpedanceCache(tmp_path / "impedances.sqlite", 2) as cache:
+        cache.use_resolution = 0
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50)))
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=60)))
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50)))
+        cache.calculate_impedance(CarsonsEquations(CBN_geometry_line()))
+
+        assert len(cache) == 2
+        cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50)))
+        assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_entries_are_counted_only_near_the_limit(tmp_path):
+    with PersistentImpedanceCache(tmp_path / "impedances.sqlite", 3) as cache:
+        statements: list[str] = []
+        cache._connect().set_trace_callback(statements.append)
+        for ƒ in (50, 60, 70, 80):
+            cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=ƒ)))
+
+        counts = [statement for statement in statements if "COUNT" in statement]
+        # once on the first store, then once the limit could be exceeded
+        assert len(counts) == 2
+        assert len(cache) == 3
+
+
+def test_clear(tmp_path):
+    with PersistentImpedanceCache(tmp_path / "impedances.sqlite") as cache:
+        cache.calculate_impedances(models())
+        cache.clear()
+
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_max_entries_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        PersistentImpedanceCache(tmp_path / "impedances.sqlite", max_entries=0)
+
+
+def calculate_in_worker(cache, frequencies):
+    lines = [CarsonsEquations(ACBN_geometry_line(ƒ=ƒ)) for ƒ in frequencies]
+    return cache.calculate_impedances(lines)
+
+
+def test_shared_by_processes(tmp_path):
+    cache = PersistentImpedanceCache(tmp_path / "impedances.sqlite")
+    cache.calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=50)))
+    batches = [range(50, 50 + 40 * step, step) for step in (1, 2, 3, 4)]
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(calculate_in_worker, [cache] * 4, batches))
+
+    for frequencies, z_abc in zip(batches, results):
+        expected = [
+            calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=ƒ)))
+            for ƒ in frequencies
+        ]
+        assert_allclose(z_abc, expected, rtol=1e-12)
+    assert len(cache) == len({ƒ for batch in batches for ƒ in batch})
+    cache.close()
+
+
+def test_pickled_caches_reconnect(tmp_path):
+    cache = PersistentImpedanceCache(tmp_path / "impedances.sqlite")
+    cache.calculate_impedance(CarsonsEquations(CN_geometry_line()))
+    copy = pickle.loads(pickle.dumps(cache))
+
+    copy.calculate_impedance(CarsonsEquations(CN_geometry_line()))
+
+    assert copy.hits == 1
+    cache.close()
+    copy.close()
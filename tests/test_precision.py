@@ -0,0 +1,98 @@
+import pytest
+from numpy import absolute, complex64, complex128, float32
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    CompleteCarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    LineGeometry,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+)
+from carsons.carsons import perform_kron_reductions
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import (
+    FullSeriesCarsonsEquations,
+    concentric_cable,
+    dual_neutral_line,
+    quadruplex_cable,
+    triplex_secondary,
+)
+
+# the documented bound, relative to the largest entry of the float64 result
+FLOAT32_ERROR = 1e-6
+
+
+def assert_within_bound(actual, expected):
+    assert absolute(actual - expected).max() <= FLOAT32_ERROR * absolute(expected).max()
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (CarsonsEquations, CBN_geometry_line),
+        (CarsonsEquations, CN_geometry_line),
+        (CarsonsEquations, dual_neutral_line),
+        (FullSeriesCarsonsEquations, ACBN_geometry_line),
+        (FullSeriesCarsonsEquations, dual_neutral_line),
+        (CompleteCarsonsEquations, ACBN_geometry_line),
+        (ModifiedCarsonsEquations, ACBN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (TapeShieldedCableCarsonsEquations, lambda: AN_Tape_Shielded_Cable(3)),
+        (MultiConductorCarsonsEquations, quadruplex_cable),
+        (MultiConductorCarsonsEquations, triplex_secondary),
+    ],
+)
+def test_float32_error_bound(equations, line):
+    model = equations(line())
+    reduced = model.astype(float32)
+
+    z_primitive = reduced.build_z_primitive()
+    z_abc = calculate_impedance(reduced)
+
+    assert z_primitive.dtype == z_abc.dtype == complex64
+    assert_within_bound(z_primitive, model.build_z_primitive())
+    assert_within_bound(z_abc, calculate_impedance(model))
+
+
+def test_batched_float32():
+    lines = [ACBN_geometry_line(ƒ=50 + index) for index in range(5)]
+    models = [CarsonsEquations(line) for line in lines]
+
+    z_abc = calculate_impedances(models, dtype=float32)
+    geometry = CarsonsEquations(LineGeometry.from_models(lines)).astype(float32)
+    z_primitive = geometry.build_z_primitive()
+
+    assert z_abc.dtype == z_primitive.dtype == complex64
+    assert perform_kron_reductions(z_primitive).dtype == complex64
+    assert_within_bound(z_abc, calculate_impedances(models))
+    assert_allclose(perform_kron_reductions(z_primitive), z_abc, rtol=1e-6)
+
+
+def test_mixed_batch_float32():
+    models = [
+        CarsonsEquations(ACBN_geometry_line()),
+        CompleteCarsonsEquations(ACBN_geometry_line()),
+    ]
+    z_abc = calculate_impedances(models, dtype=float32)
+
+    assert z_abc.dtype == complex64
+    assert_within_bound(z_abc, calculate_impedances(models))
+
+
+def test_float64_is_the_default():
+    model = CarsonsEquations(ACBN_geometry_line())
+
+    assert calculate_impedance(model).dtype == complex128
+    assert model.astype(float32).dtype is float32
+    assert model.dtype is not float32
@@ -0,0 +1,102 @@
+import pytest
+from numpy import complex64, eye, stack, zeros
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    LineGeometry,
+    MultiConductorCarsonsEquations,
+    calculate_impedance,
+    calculate_impedances,
+    calculate_sequence_impedance_components,
+    calculate_sequence_impedance_matrix,
+    calculate_sequence_impedances,
+)
+from carsons.carsons import A, Ainv, fortescue_matrices
+from tests.test_carsons import z_abc_kersting_4_1
+from tests.test_overhead_line import ACBN_geometry_line
+from tests.test_z_primitive import triplex_secondary
+
+
+def test_stack_matches_single_matrices():
+    lines = [ACBN_geometry_line(ƒ=ƒ) for ƒ in (50, 60, 400)]
+    z_abc = calculate_impedance(CarsonsEquations(LineGeometry.from_models(lines)))
+    z_012 = calculate_sequence_impedance_matrix(z_abc)
+    Z0, Z1, Z2 = calculate_sequence_impedance_components(z_abc)
+
+    assert z_012.shape == (3, 3, 3) and Z0.shape == (3,)
+    for index, z in enumerate(z_abc):
+        expected = Ainv @ z @ A
+        assert_allclose(z_012[index], expected, rtol=1e-12)
+        assert_allclose(
+            [Z0[index], Z1[index], Z2[index]], expected.diagonal(), rtol=1e-12
+        )
+        assert calculate_sequence_impedances(z) == pytest.approx(
+            (expected[1, 1], expected[0, 0]), rel=1e-12
+        )
+
+
+def test_single_matrix():
+    z_abc = z_abc_kersting_4_1()
+    Z0, Z1, Z2 = calculate_sequence_impedance_components(z_abc)
+
+    assert (Z1, Z0) == calculate_sequence_impedances(z_abc)
+    assert Z1 == pytest.approx(Z2)
+
+
+def test_fortescue_matrices():
+    for phases in (1, 2, 3, 4):
+        Aₙ, Aₙinv = fortescue_matrices(phases)
+        assert_allclose(Aₙinv @ Aₙ, eye(phases), atol=1e-12)
+
+    assert_allclose(fortescue_matrices(2)[0], [[1, 1], [1, -1]], atol=1e-12)
+    assert (fortescue_matrices(3)[0] == A).all()
+    with pytest.raises(ValueError):
+        fortescue_matrices(0)
+
+
+def test_two_phase_secondary():
+    z_secondary = calculate_impedance(
+        MultiConductorCarsonsEquations(triplex_secondary())
+    )
+
+    Z0, Z1 = calculate_sequence_impedance_components(z_secondary)
+
+    # the common and differential modes of the two legs
+    z_self, z_mutual = z_secondary[0, 0], z_secondary[0, 1]
+    assert Z0 == pytest.approx(z_self + z_mutual)
+    assert Z1 == pytest.approx(z_self - z_mutual)
+
+
+def test_double_circuit():
+    z_abc = calculate_impedances(
+        [CarsonsEquations(ACBN_geometry_line(ƒ=ƒ)) for ƒ in (50, 60)]
+    )
+    # two uncoupled circuits on the diagonal, then one coupled circuit
+    z_double = zeros((2, 6, 6), dtype=complex)
+    z_double[:, :3, :3], z_double[:, 3:, 3:] = z_abc, 2 * z_abc
+    z_double[1, :3, 3:] = z_double[1, 3:, :3] = 0.1 * z_abc[1]
+
+    z_012 = calculate_sequence_impedance_matrix(z_double, circuits=2)
+    components = calculate_sequence_impedance_components(z_double, circuits=2)
+
+    expected = calculate_sequence_impedance_matrix(z_abc)
+    assert_allclose(z_012[:, :3, :3], expected, rtol=1e-12)
+    assert_allclose(z_012[:, 3:, 3:], 2 * expected, rtol=1e-12)
+    assert_allclose(z_012[0, :3, 3:], 0, atol=1e-12)
+    assert_allclose(z_012[1, :3, 3:], 0.1 * expected[1], rtol=1e-12)
+    assert_allclose(components, z_012.diagonal(axis1=-2, axis2=-1).T, rtol=1e-12)
+
+
+def test_keeps_single_precision():
+    z_abc = stack([z_abc_kersting_4_1()] * 2).astype(complex64)
+
+    assert calculate_sequence_impedance_matrix(z_abc).dtype == complex64
+    assert calculate_sequence_impedance_components(z_abc).dtype == complex64
+
+
+def test_invalid_shapes():
+    with pytest.raises(ValueError):
+        calculate_sequence_impedance_matrix(zeros((3, 3)), circuits=2)
+    with pytest.raises(ValueError):
+        calculate_sequence_impedance_components(zeros((3, 2)))
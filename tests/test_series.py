@@ -0,0 +1,88 @@
+import pytest
+from numpy import array, cos, log, pi, sin, sqrt
+from numpy.testing import assert_allclose
+
+from carsons.carsons import (
+    CarsonsEquations,
+    ModifiedCarsonsEquations,
+    calculate_carson_series,
+)
+from tests.test_overhead_line import ACBN_geometry_line
+
+k = array([[0.005, 0.02], [0.02, 0.4]])
+θ = array([[0.0, 0.3], [0.3, 1.2]])
+
+
+def P_terms_at(k, θ):
+    return [
+        pi / 8.0 + 0 * k,
+        -k / (3 * sqrt(2)) * cos(θ),
+        k**2 / 16 * (0.6728 + log(2 / k)) * cos(2 * θ),
+        k**2 / 16 * θ * sin(2 * θ),
+        k**3 / (45 * sqrt(2)) * cos(3 * θ),
+        -pi * k**4 * cos(4 * θ) / 1536,
+    ]
+
+
+def Q_terms_at(k, θ):
+    return [
+        -0.0386 + 0 * k,
+        0.5 * log(2 / k),
+        k / (3 * sqrt(2)) * cos(θ),
+        -pi * k**2 / 64 * cos(2 * θ),
+        k**3 / (45 * sqrt(2)) * cos(3 * θ),
+        -(k**4) / 384 * θ * sin(4 * θ),
+        -(k**4) / 384 * cos(4 * θ) * (log(2 / k) + 1.0895),
+    ]
+
+
+P_terms, Q_terms = P_terms_at(k, θ), Q_terms_at(k, θ)
+
+
+@pytest.mark.parametrize("number_of_terms", range(1, 8))
+def test_series_are_partial_sums_of_their_terms(number_of_terms):
+    P, Q = calculate_carson_series(k, θ, number_of_terms, number_of_terms)
+
+    assert_allclose(P, sum(P_terms[:number_of_terms]), rtol=1e-14)
+    assert_allclose(Q, sum(Q_terms[:number_of_terms]), rtol=1e-14)
+
+
+@pytest.mark.parametrize("ƒ", [60, 1])
+@pytest.mark.parametrize("i, j", [("A", "N"), ("A", "B")])
+def test_terms_of_a_conductor_pair(i, j, ƒ):
+    model = CarsonsEquations(ACBN_geometry_line(ƒ=ƒ))
+    kᵢⱼ, θᵢⱼ = model.compute_k(i, j), model.compute_θ(i, j)
+    P, Q = calculate_carson_series(array([[kᵢⱼ]]), array([[θᵢⱼ]]), 6, 7)
+
+    P_terms_ij = list(model.compute_P_terms(i, j))
+    Q_terms_ij = list(model.compute_Q_terms(i, j))
+
+    assert len(P_terms_ij) == 6 and len(Q_terms_ij) == 7
+    # even the smallest terms match their closed form to full precision
+    kθ = dict(k=array([[kᵢⱼ]]), θ=array([[θᵢⱼ]]))
+    for term, expected in zip(P_terms_ij, P_terms_at(**kθ)):
+        assert term == pytest.approx(expected[0, 0], rel=1e-12, abs=0)
+    for term, expected in zip(Q_terms_ij, Q_terms_at(**kθ)):
+        assert term == pytest.approx(expected[0, 0], rel=1e-12, abs=0)
+    assert sum(P_terms_ij) == pytest.approx(P[0, 0], rel=1e-14)
+    assert sum(Q_terms_ij) == pytest.approx(Q[0, 0], rel=1e-14)
+    assert sum(P_terms_ij[:1]) == model.compute_P(i, j)
+    assert sum(Q_terms_ij[:2]) == pytest.approx(model.compute_Q(i, j))
+
+
+def test_constant_terms_need_no_geometry():
+    assert calculate_carson_series(None, None, 1, 1) == (pi / 8.0, -0.0386)
+
+    _, Q = calculate_carson_series(k, None, 1, 2)
+    assert_allclose(Q, Q_terms[0] + Q_terms[1])
+
+
+def test_modified_carsons_equations_skip_k_and_θ():
+    class StrictModifiedCarsonsEquations(ModifiedCarsonsEquations):
+        def compute_k_matrix(self, conductors):
+            raise AssertionError("k is not used by the modified equations")
+
+        def compute_θ_matrix(self, conductors):
+            raise AssertionError("θ is not used by the modified equations")
+
+    StrictModifiedCarsonsEquations(ACBN_geometry_line()).build_z_primitive()
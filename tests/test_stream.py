@@ -0,0 +1,54 @@
+from itertools import count, islice
+
+import pytest
+from numpy.testing import assert_allclose
+
+from carsons import (
+    CarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+    calculate_impedance,
+    stream_impedances,
+)
+from tests.test_overhead_line import ACBN_geometry_line, CN_geometry_line
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+from tests.test_z_primitive import quadruplex_cable, triplex_secondary
+
+
+def test_stream_matches_individual_models():
+    models = [
+        CarsonsEquations(ACBN_geometry_line()),
+        TapeShieldedCableCarsonsEquations(AN_Tape_Shielded_Cable(3)),
+        MultiConductorCarsonsEquations(triplex_secondary()),
+        CarsonsEquations(CN_geometry_line(ƒ=50)),
+        MultiConductorCarsonsEquations(quadruplex_cable()),
+    ]
+    results = list(stream_impedances(enumerate(models), batch_size=2))
+
+    assert [key for key, _ in results] == [0, 1, 2, 3, 4]
+    for model, (_, z_abc) in zip(models, results):
+        assert_allclose(z_abc, calculate_impedance(model), rtol=1e-12, atol=0)
+    assert results[2][1].shape == (2, 2)
+
+
+def test_stream_reads_one_batch_at_a_time():
+    read = []
+
+    def lines():
+        for index in count():
+            read.append(index)
+            yield f"line-{index}", ACBN_geometry_line(ƒ=50 + index % 10)
+
+    results = stream_impedances(lines(), equations=CarsonsEquations, batch_size=8)
+    first = list(islice(results, 10))
+
+    assert len(read) == 16
+    assert first[9][0] == "line-9"
+    assert_allclose(
+        first[9][1], calculate_impedance(CarsonsEquations(ACBN_geometry_line(ƒ=59)))
+    )
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        next(stream_impedances([], batch_size=0))
@@ -0,0 +1,163 @@
+import pytest
+from numpy import zeros
+from numpy.testing import assert_allclose
+
+from carsons import LineGeometry, calculate_impedance
+from carsons.carsons import (
+    CarsonsEquations,
+    CompleteCarsonsEquations,
+    ConcentricNeutralCarsonsEquations,
+    ModifiedCarsonsEquations,
+    MultiConductorCarsonsEquations,
+    TapeShieldedCableCarsonsEquations,
+)
+from tests.helpers import ConcentricLineModel, LineModel, MultiLineModel
+from tests.test_overhead_line import (
+    ACBN_geometry_line,
+    CBN_geometry_line,
+    CN_geometry_line,
+)
+from tests.test_tape_shielded_cables import AN_Tape_Shielded_Cable
+
+
+class FullSeriesCarsonsEquations(CarsonsEquations):
+    number_of_P_terms = 6
+    number_of_Q_terms = 7
+
+
+def elementwise_z_primitive(model):
+    conductors = model.conductors
+    z_primitive = zeros(shape=(len(conductors), len(conductors)), dtype=complex)
+
+    for index_i, phase_i in enumerate(conductors):
+        for index_j, phase_j in enumerate(conductors):
+            if phase_i not in model.phases or phase_j not in model.phases:
+                continue
+            R = model.compute_R(phase_i, phase_j)
+            X = model.compute_X(phase_i, phase_j)
+            z_primitive[index_i, index_j] = complex(R, X)
+
+    return z_primitive
+
+
+def dual_neutral_line():
+    return LineModel(
+        {
+            #    resistance   gmr         (x, y)
+            #   ==========================================
+            "A": (0.000115575, 0.00947938, (0.762, 8.5344)),
+            "B": (0.000115575, 0.00947938, (0.0, 8.5344)),
+            "N1": (0.000115575, 0.00947938, (2.1336, 8.5344)),
+            "N2": (0.000367852, 0.00248107, (1.2192, 7.3152)),
+        }
+    )
+
+
+def concentric_cable():
+    phase = {"resistance": 0.000254762, "gmr": 0.00521208}
+    neutral = {
+        "neutral_strand_gmr": 0.000633984,
+        "neutral_strand_resistance": 0.00923964,
+        "neutral_strand_diameter": 0.00162814,
+        "diameter_over_neutral": 0.032766,
+        "neutral_strand_count": 13,
+    }
+    return ConcentricLineModel(
+        {
+            "A": {**phase, "wire_positions": (0, 0)},
+            "B": {**phase, "wire_positions": (0.1524, 0)},
+            "C": {**phase, "wire_positions": (0.3048, 0)},
+            "NA": neutral,
+            "NB": neutral,
+            "NC": neutral,
+        }
+    )
+
+
+def quadruplex_cable():
+    conductor = {"resistance": 0.000300744, "gmr": 0.00481584, "wire_positions": (0, 5)}
+    return MultiLineModel(
+        {
+            **{ph: {**conductor, "outside_radius": 0.00799940} for ph in "ABC"},
+            "N": {**conductor, "outside_radius": 0.00662940},
+        }
+    )
+
+
+def triplex_secondary():
+    conductor = {"resistance": 0.000602730, "gmr": 0.00338328, "wire_positions": (0, 1)}
+    return MultiLineModel(
+        {
+            "S1": {**conductor, "outside_radius": 0.00670560},
+            "S2": {**conductor, "outside_radius": 0.00670560},
+            "N": {**conductor, "outside_radius": 0.00467360},
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "equations,line",
+    [
+        (CarsonsEquations, ACBN_geometry_line),
+        (CarsonsEquations, CBN_geometry_line),
+        (CarsonsEquations, CN_geometry_line),
+        (CarsonsEquations, dual_neutral_line),
+        (FullSeriesCarsonsEquations, ACBN_geometry_line),
+        (FullSeriesCarsonsEquations, dual_neutral_line),
+        (CompleteCarsonsEquations, ACBN_geometry_line),
+        (CompleteCarsonsEquations, dual_neutral_line),
+        (ModifiedCarsonsEquations, ACBN_geometry_line),
+        (ModifiedCarsonsEquations, CN_geometry_line),
+        (ConcentricNeutralCarsonsEquations, concentric_cable),
+        (TapeShieldedCableCarsonsEquations, lambda: AN_Tape_Shielded_Cable(3)),
+        (MultiConductorCarsonsEquations, quadruplex_cable),
+        (MultiConductorCarsonsEquations, triplex_secondary),
+    ],
+)
+def test_z_primitive_matches_elementwise_evaluation(equations, line):
+    model = equations(line())
+
+    assert_allclose(
+        model.build_z_primitive(), elementwise_z_primitive(model), rtol=1e-12, atol=0
+    )
+
+
+def test_pair_geometry_is_computed_once_per_pair():
+    class CountingCarsonsEquations(CarsonsEquations):
+        distances = 0
+
+        @classmethod
+        def calculate_distance(cls, positionᵢ, positionⱼ):
+            cls.distances += 1
+            return super().calculate_distance(positionᵢ, positionⱼ)
+
+    model = CountingCarsonsEquations(ACBN_geometry_line())
+    elementwise_z_primitive(model)
+    elementwise_z_primitive(model)
+
+    # Dᵢⱼ for the 10 unordered pairs, dᵢⱼ for the 6 pairs of distinct conductors
+    assert CountingCarsonsEquations.distances == 10 + 6
+    assert model.compute_D("A", "N") == model.compute_D("N", "A")
+
+
+@pytest.mark.parametrize(
+    "line", [ACBN_geometry_line, lambda: LineGeometry.from_model(ACBN_geometry_line())]
+)
+def test_forgetting_geometry_after_assigning_values(line):
+    model = CarsonsEquations(line())
+    swept = model.at_frequencies([50, 60])
+    before = calculate_impedance(model)
+    calculate_impedance(swept)
+
+    x, y = model.phase_positions["A"]
+    model.phase_positions = {**model.phase_positions, "A": (x + 1.0, y)}
+    model.gmr = {**model.gmr, "N": 2 * model.gmr["N"]}
+    model.forget_geometry()
+
+    expected = CarsonsEquations(ACBN_geometry_line())
+    expected.phase_positions, expected.gmr = model.phase_positions, model.gmr
+    expected.forget_geometry()
+    assert_allclose(calculate_impedance(model), calculate_impedance(expected))
+    assert not (calculate_impedance(model) == before).all()
+    # copies keep the geometry of the values they were made with
+    assert_allclose(calculate_impedance(swept)[1], before)